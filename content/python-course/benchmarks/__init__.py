@@ -0,0 +1,4 @@
+# ============================================
+# BENCHMARKS - run from content/python-course:
+#   python -m benchmarks.<name>
+# ============================================
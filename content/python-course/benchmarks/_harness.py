@@ -0,0 +1,214 @@
+"""Timing, JSON results and baseline comparison shared by the benchmark suites.
+
+A suite registers cases; each case builds its input once and returns the
+callable that gets timed:
+
+    suite = Suite("primitives")
+
+    @suite.case("comprehension.list", size=100_000)
+    def _(n):
+        data = list(range(n))
+        return lambda: [x**2 for x in data]
+
+    if __name__ == "__main__":
+        suite.main()
+
+Methodology (the same as ``timeit``): one warm-up call, then the loop count
+is doubled until one sample takes at least ``--min-time`` seconds, then
+``--repeat`` samples are taken with the garbage collector disabled. Both
+the median and the minimum per-call time are reported; regressions are
+judged on the minimum, which background load on the machine can only
+raise, never lower (the ``timeit`` recommendation). The standard deviation
+shows how noisy a run was.
+
+``--compare`` checks the minimums against the suite's stored baseline
+(``benchmarks/baselines/<suite>.json``) and exits with status 1 when a
+case got slower per item by more than ``--threshold``. Baselines are only
+meaningful on the machine and Python they were recorded with; refresh
+them with ``--save-baseline``.
+"""
+
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.15
+MAX_LOOPS = 1_000_000
+
+
+class Case(NamedTuple):
+    name: str
+    size: int
+    make: Callable[[int], Callable[[], Any]]
+
+
+def _time(func: Callable[[], Any], loops: int) -> float:
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def measure(func: Callable[[], Any], repeat: int = DEFAULT_REPEAT,
+            min_time: float = DEFAULT_MIN_TIME) -> Dict[str, Any]:
+    """Time ``func``; return per-call ``median_s``, ``min_s``, ``stdev_s`` and ``loops``."""
+    func()
+    loops = 1
+    while loops < MAX_LOOPS and _time(func, loops) < min_time:
+        loops *= 2
+    samples = [_time(func, loops) / loops for _ in range(repeat)]
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """One row per case in both: minimum times, ratio and ``slower``/``faster``/``same``."""
+    rows = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]
+        # Per-item time, so a case whose size changed still compares.
+        ratio = (current["min_s"] / current["size"]) / (before["min_s"] / before["size"])
+        status = "slower" if ratio > 1 + threshold else "faster" if ratio < 1 - threshold else "same"
+        rows.append({"name": name, "baseline_s": before["min_s"], "min_s": current["min_s"],
+                     "ratio": ratio, "status": status})
+    return rows
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+class Suite:
+    """A named set of benchmark cases with a command line."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cases: List[Case] = []
+
+    def case(self, name: str, size: int):
+        """Register ``make(size) -> callable`` as case ``name``."""
+        def register(make):
+            if any(c.name == name for c in self.cases):
+                raise ValueError(f"duplicate benchmark case {name!r}")
+            self.cases.append(Case(name, size, make))
+            return make
+        return register
+
+    def baseline_path(self) -> str:
+        return os.path.join(BASELINE_DIR, f"{self.name}.json")
+
+    def run(self, patterns: Optional[List[str]] = None, repeat: int = DEFAULT_REPEAT,
+            min_time: float = DEFAULT_MIN_TIME, scale: float = 1.0,
+            report: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Run the cases matching any of ``patterns`` (fnmatch); return the JSON document."""
+        results = {}
+        for case in self.cases:
+            if patterns and not any(fnmatch.fnmatch(case.name, p) or p in case.name for p in patterns):
+                continue
+            size = max(1, int(case.size * scale))
+            stats = measure(case.make(size), repeat, min_time)
+            stats["size"] = size
+            stats["ns_per_item"] = stats["median_s"] / size * 1e9
+            results[case.name] = stats
+            if report:
+                report(case.name, stats)
+        return {"suite": self.name, "environment": environment(),
+                "settings": {"repeat": repeat, "min_time": min_time, "scale": scale},
+                "results": results}
+
+    def main(self, argv: Optional[List[str]] = None) -> None:
+        import argparse
+
+        parser = argparse.ArgumentParser(description=f"Run the {self.name} benchmark suite.")
+        parser.add_argument("-k", dest="patterns", action="append",
+                            help="only cases matching this glob or substring (repeatable)")
+        parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+        parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                            help="seconds per sample; the loop count grows until reached")
+        parser.add_argument("--scale", type=float, default=1.0, help="multiply every case size")
+        parser.add_argument("--json", help="write the results here")
+        parser.add_argument("--compare", nargs="?", const="", metavar="BASELINE",
+                            help="compare with a baseline (default: the stored one); "
+                                 "exit 1 on regression")
+        parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="relative slow-down that counts as a regression")
+        parser.add_argument("--save-baseline", action="store_true",
+                            help="store the results as this suite's baseline")
+        parser.add_argument("--list", action="store_true", help="list the cases and exit")
+        args = parser.parse_args(argv)
+
+        if args.list:
+            for case in self.cases:
+                print(f"{case.name:<32}{case.size:>12,}")
+            return
+
+        def report(name, stats):
+            print(f"{name:<32}{stats['size']:>12,}{_format_time(stats['median_s']):>12}"
+                  f"{_format_time(stats['min_s']):>12}{stats['stdev_s'] / stats['median_s']:>8.1%}"
+                  f"{stats['ns_per_item']:>12.1f}")
+            sys.stdout.flush()
+
+        print(f"{'case':<32}{'size':>12}{'median':>12}{'min':>12}{'stdev':>8}{'ns/item':>12}")
+        document = self.run(args.patterns, args.repeat, args.min_time, args.scale, report)
+
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+        if args.save_baseline:
+            os.makedirs(BASELINE_DIR, exist_ok=True)
+            with open(self.baseline_path(), "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+                f.write("\n")
+            print(f"baseline saved to {self.baseline_path()}")
+        if args.compare is not None:
+            path = args.compare or self.baseline_path()
+            with open(path, encoding="utf-8") as f:
+                baseline = json.load(f)
+            if baseline.get("environment", {}).get("python") != document["environment"]["python"]:
+                print(f"note: baseline recorded on Python {baseline['environment'].get('python')}")
+            rows = compare(document["results"], baseline["results"], args.threshold)
+            print(f"\n{'case (min)':<32}{'baseline':>12}{'now':>12}{'ratio':>8}  status")
+            for row in rows:
+                print(f"{row['name']:<32}{_format_time(row['baseline_s']):>12}"
+                      f"{_format_time(row['min_s']):>12}{row['ratio']:>8.2f}  {row['status']}")
+            regressions = [row["name"] for row in rows if row["status"] == "slower"]
+            if regressions:
+                print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: "
+                      + ", ".join(regressions))
+                sys.exit(1)
@@ -0,0 +1,67 @@
+"""``pycourse.dispatch`` against a plain ``speak()`` loop.
+
+    python -m benchmarks.dispatch
+    python -m benchmarks.dispatch -k slotted
+
+``size`` animals, a random mix of ``Animal``, ``Dog`` and ``Cat``, either
+``pycourse.core.oop``'s classes (``dict.*``) or their ``__slots__``
+versions (``slotted.*``):
+
+``naive``    ``[animal.speak() for animal in animals]``
+``call``     ``TypeBatch.call``: results in the original order
+``grouped``  ``TypeBatch.call_grouped``: results per type
+``each``     ``TypeBatch.each``: results discarded
+``dispatch`` ``dispatch(animals, "speak")``, grouping included
+"""
+
+import random
+from collections import deque
+from functools import lru_cache
+
+from pycourse.core.oop import Animal, Cat, Dog
+from pycourse.dispatch import SlottedAnimal, SlottedCat, SlottedDog, TypeBatch, dispatch
+
+from ._harness import Suite
+
+suite = Suite("dispatch")
+SIZE = 1_000_000
+HIERARCHIES = {"dict": (Animal, Dog, Cat), "slotted": (SlottedAnimal, SlottedDog, SlottedCat)}
+
+
+@lru_cache(maxsize=2)
+def _animals(hierarchy, n):
+    rng = random.Random(12)
+    classes = HIERARCHIES[hierarchy]
+    return [rng.choice(classes)(f"pet{i}") for i in range(n)]
+
+
+@lru_cache(maxsize=2)
+def _batch(hierarchy, n):
+    return TypeBatch(_animals(hierarchy, n))
+
+
+APPROACHES = {
+    "naive": lambda animals, batch: [animal.speak() for animal in animals],
+    "naive_discard": lambda animals, batch: deque((a.speak() for a in animals), maxlen=0),
+    "call": lambda animals, batch: batch.call("speak"),
+    "grouped": lambda animals, batch: batch.call_grouped("speak"),
+    "each": lambda animals, batch: batch.each("speak"),
+    "dispatch": lambda animals, batch: dispatch(animals, "speak"),
+}
+
+
+def _register(hierarchy, approach):
+    @suite.case(f"{hierarchy}.{approach}", size=SIZE)
+    def _(n):
+        animals, batch = _animals(hierarchy, n), _batch(hierarchy, n)
+        run = APPROACHES[approach]
+        return lambda: run(animals, batch)
+
+
+for _hierarchy in HIERARCHIES:
+    for _approach in APPROACHES:
+        _register(_hierarchy, _approach)
+
+
+if __name__ == "__main__":
+    suite.main()
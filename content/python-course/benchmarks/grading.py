@@ -0,0 +1,173 @@
+"""Grading throughput in submissions/sec.
+
+    python -m benchmarks.grading                        # generated corpus
+    python -m benchmarks.grading --count 5000 --workers 1 2 4
+    python -m benchmarks.grading --corpus submissions.jsonl
+
+The generated corpus mixes correct, wrong and crashing answers to every
+exercise in ``pycourse.grading.EXERCISES``, plus a few that spin forever,
+sleep forever or allocate without bound, so the CPU, wall-clock and memory
+caps are part of what gets measured. Pool start-up is timed separately from grading. Each
+worker count runs twice: expected outcomes looked up in the reference-answer
+index (``pycourse.answers``), and references re-run for every test.
+"""
+
+import collections
+import os
+import random
+import time
+
+from pycourse.answers import load_index
+from pycourse.grading import EXERCISES, GradingPool, Limits, Submission, load_submissions
+
+# Learner-style answers per exercise: (label, source).
+ANSWERS = {
+    "greet": [
+        ("correct", "def greet(name):\n    return f'Hello, {name}!'\n"),
+        ("concat", "def greet(name):\n    return 'Hello, ' + name + '!'\n"),
+        ("wrong", "def greet(name):\n    return f'Hi, {name}!'\n"),
+        ("prints", "def greet(name):\n    print(f'Hello, {name}!')\n"),
+    ],
+    "greet_person": [
+        ("correct", "def greet_person(name='Guest'):\n    return f'Hello, {name}!'\n"),
+        ("no-default", "def greet_person(name):\n    return f'Hello, {name}!'\n"),
+    ],
+    "add_numbers": [
+        ("correct", "def add_numbers(a, b, c=0):\n    return a + b + c\n"),
+        ("sum", "def add_numbers(a, b, c=0):\n    return sum((a, b, c))\n"),
+        ("ignores-c", "def add_numbers(a, b, c=0):\n    return a + b\n"),
+        ("no-c", "def add_numbers(a, b):\n    return a + b\n"),
+    ],
+    "sum_all": [
+        ("correct", "def sum_all(*args):\n    return sum(args)\n"),
+        ("loop", "def sum_all(*args):\n    total = 0\n    for n in args:\n        total += n\n"
+                 "    return total\n"),
+        ("off-by-one", "def sum_all(*args):\n    return sum(args[1:])\n"),
+    ],
+    "print_info": [
+        ("correct", "def print_info(**kwargs):\n    for key, value in kwargs.items():\n"
+                    "        print(f'{key}: {value}')\n"),
+        ("equals", "def print_info(**kwargs):\n    for k, v in kwargs.items():\n        print(k, '=', v)\n"),
+    ],
+    "square": [
+        ("correct", "square = lambda x: x ** 2\n"),
+        ("def", "def square(x):\n    return x * x\n"),
+        ("double", "def square(x):\n    return x * 2\n"),
+    ],
+    "validate_age": [
+        ("correct", "def validate_age(age):\n    if age < 0:\n        raise ValueError('negative')\n"
+                    "    return age\n"),
+        ("no-raise", "def validate_age(age):\n    return age\n"),
+        ("wrong-type", "def validate_age(age):\n    if age < 0:\n        raise TypeError('negative')\n"
+                       "    return age\n"),
+    ],
+    "is_valid_email": [
+        ("correct", "import re\n\ndef is_valid_email(email):\n"
+                    "    return bool(re.match(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$', email))\n"),
+        ("naive", "def is_valid_email(email):\n    return '@' in email and '.' in email\n"),
+        ("syntax-error", "def is_valid_email(email)\n    return True\n"),
+    ],
+    "squares": [
+        ("correct", "squares = [x**2 for x in range(10)]\n"),
+        ("loop", "squares = []\nfor x in range(10):\n    squares.append(x * x)\n"),
+        ("generator", "squares = (x**2 for x in range(10))\n"),
+    ],
+    "squares_dict": [
+        ("correct", "squares_dict = {x: x**2 for x in range(5)}\n"),
+        ("off-by-one", "squares_dict = {x: x**2 for x in range(1, 5)}\n"),
+    ],
+    "map_squares": [
+        ("correct", "map_squares = list(map(lambda x: x**2, [1, 2, 3, 4, 5]))\n"),
+        ("lazy", "map_squares = map(lambda x: x**2, [1, 2, 3, 4, 5])\n"),
+    ],
+    "filter_evens": [
+        ("correct", "filter_evens = list(filter(lambda x: x % 2 == 0, [1, 2, 3, 4, 5]))\n"),
+        ("odds", "filter_evens = [x for x in [1, 2, 3, 4, 5] if x % 2]\n"),
+    ],
+    "reduce_sum": [
+        ("correct", "from functools import reduce\nreduce_sum = reduce(lambda a, b: a + b, [1, 2, 3, 4, 5])\n"),
+        ("builtin", "reduce_sum = sum([1, 2, 3, 4, 5])\n"),
+    ],
+}
+
+# Pathological answers, added at a low rate to any exercise.
+HAZARDS = [
+    ("spins", "def {name}(*args, **kwargs):\n    while True:\n        pass\n"),
+    ("spins-at-import", "while True:\n    pass\n"),
+    ("swallows-timer", "def {name}(*args, **kwargs):\n    while True:\n        try:\n"
+                       "            while True:\n                pass\n        except BaseException:\n"
+                       "            pass\n"),
+    ("allocates", "def {name}(*args, **kwargs):\n    chunks = []\n    while True:\n"
+                  "        chunks.append(bytearray(16 * 1024 * 1024))\n"),
+    ("exits", "import os\n\ndef {name}(*args, **kwargs):\n    os._exit(3)\n"),
+    ("sleeps", "import time\n\ndef {name}(*args, **kwargs):\n    time.sleep(10 ** 9)\n"),
+]
+
+
+def generate(count, hazard_rate, seed=0):
+    """Return ``count`` submissions; ``hazard_rate`` of them are pathological."""
+    rng = random.Random(seed)
+    names = sorted(ANSWERS)
+    submissions = []
+    for i in range(count):
+        name = rng.choice(names)
+        if rng.random() < hazard_rate:
+            label, template = rng.choice(HAZARDS)
+            source = template.format(name=name)
+        else:
+            label, source = rng.choice(ANSWERS[name])
+        submissions.append(Submission(f"{i}-{name}-{label}", name, source))
+    return submissions
+
+
+def run(submissions, workers, limits, batch_size, use_answers):
+    start = time.perf_counter()
+    pool = GradingPool(workers, limits, batch_size, use_answers)
+    startup = time.perf_counter() - start
+    with pool:
+        start = time.perf_counter()
+        results = pool.grade(submissions)
+        elapsed = time.perf_counter() - start
+    return results, startup, elapsed, pool.crashes, pool.timeouts
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="JSON lines of submissions instead of a generated corpus")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--hazard-rate", type=float, default=0.005)
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--cpu-seconds", type=float, default=0.2)
+    parser.add_argument("--memory-mb", type=int, default=256)
+    parser.add_argument("--wall-seconds", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        submissions = load_submissions(args.corpus)
+    else:
+        submissions = generate(args.count, args.hazard_rate)
+    limits = Limits(args.cpu_seconds, args.memory_mb, args.wall_seconds)
+    print(f"{len(submissions)} submissions, {len(EXERCISES)} exercises, "
+          f"batch size {args.batch_size}, {args.cpu_seconds}s CPU / {args.memory_mb} MB per test, "
+          f"{args.wall_seconds}s per submission")
+
+    load_index()  # build outside the timings
+    print(f"{'workers':>7}{'expected':>10}{'start-up ms':>13}{'grading s':>11}{'subs/sec':>11}"
+          f"{'crashes':>9}{'timeouts':>10}")
+    for workers in args.workers:
+        for use_answers in (True, False):
+            results, startup, elapsed, crashes, timeouts = run(submissions, workers, limits,
+                                                               args.batch_size, use_answers)
+            print(f"{workers:>7}{'index' if use_answers else 'rerun':>10}{startup * 1000:>13.1f}"
+                  f"{elapsed:>11.2f}{len(submissions) / elapsed:>11.0f}{crashes:>9}{timeouts:>10}")
+
+    outcomes = collections.Counter(
+        "error" if r.error else "pass" if r.ok else "fail" for r in results)
+    print("outcomes: " + ", ".join(f"{k} {v}" for k, v in sorted(outcomes.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""``pycourse.indexed.IndexedList`` against ``list`` across read/write mixes.
+
+    python -m benchmarks.indexed
+    python -m benchmarks.indexed -k "*r99*"
+
+A list of 10,000 learner IDs takes ``size`` operations, ``r<N>`` percent
+of them lookups (half ``in``, half ``index()``, hits and misses) and the
+rest writes:
+
+``tail.*``   writes are ``append`` / ``pop()``, which keep the index
+``shift.*``  writes are ``insert(0, x)`` / ``remove(x)``, which drop it
+"""
+
+import random
+from functools import lru_cache
+
+from pycourse.indexed import IndexedList
+
+from ._harness import Suite
+
+suite = Suite("indexed")
+SIZE = 10_000          # operations per run
+LENGTH = 10_000        # list length
+READ_PERCENTS = (50, 90, 99, 100)
+KINDS = {"list": list, "indexed": IndexedList}
+
+
+@lru_cache(maxsize=None)
+def _operations(writes, read_percent, n):
+    rng = random.Random(read_percent)
+    operations = []
+    for _ in range(n):
+        if rng.random() * 100 < read_percent:
+            value = rng.randrange(2 * LENGTH)   # about half of them misses
+            operations.append(("in" if rng.random() < 0.5 else "index", value))
+        else:
+            operations.append((writes, rng.randrange(LENGTH)))
+    return operations
+
+
+def _run(items, operations):
+    found = 0
+    for op, value in operations:
+        if op == "in":
+            found += value in items
+        elif op == "index":
+            if value in items:
+                found += items.index(value)
+        elif op == "tail":
+            items.append(value)
+            items.pop()
+        else:
+            items.insert(0, value)
+            items.remove(value)
+    return found
+
+
+def _register(writes, read_percent, kind):
+    @suite.case(f"{writes}.r{read_percent}.{kind}", size=SIZE)
+    def _(n):
+        operations = _operations(writes, read_percent, n)
+        items = KINDS[kind](range(LENGTH))
+        return lambda: _run(items, operations)
+
+
+for _writes in ("tail", "shift"):
+    for _percent in READ_PERCENTS:
+        for _kind in KINDS:
+            _register(_writes, _percent, _kind)
+
+
+if __name__ == "__main__":
+    suite.main()
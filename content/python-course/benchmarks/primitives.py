@@ -0,0 +1,284 @@
+"""Every primitive the courses teach, at production-like sizes.
+
+    python -m benchmarks.primitives                     # run and print
+    python -m benchmarks.primitives -k sets -k json     # a subset
+    python -m benchmarks.primitives --compare           # vs benchmarks/baselines/primitives.json
+    python -m benchmarks.primitives --json results.json --scale 0.1
+
+Cases are named ``<topic>.<operation>``; the topic follows the chapter
+that teaches it. Definitions come from ``pycourse.core`` where the course
+has one (``TodoApp``, the ``Person`` dataclass, ``count_up_to``,
+``is_valid_email``). Output the course functions print goes to a sink, so
+terminal speed is not measured. See ``benchmarks/_harness.py`` for the
+timing methodology.
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+from contextlib import redirect_stdout
+from functools import reduce
+
+from pycourse.core.data_classes import Person
+from pycourse.core.generators import count_up_to
+from pycourse.core.regex import is_valid_email
+from pycourse.core.todo import TodoApp
+
+from ._harness import Suite
+
+suite = Suite("primitives")
+
+
+class _Sink:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def _words(n, seed=0):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(3, 10))) for _ in range(n)]
+
+
+# ============================================
+# Chapters 5-6: comprehensions
+# ============================================
+
+@suite.case("comprehension.list_squares", size=100_000)
+def _(n):
+    data = list(range(n))
+    return lambda: [x**2 for x in data]
+
+
+@suite.case("comprehension.list_filtered", size=100_000)
+def _(n):
+    data = list(range(n))
+    return lambda: [x for x in data if x % 2 == 0]
+
+
+@suite.case("comprehension.dict_squares", size=100_000)
+def _(n):
+    data = list(range(n))
+    return lambda: {x: x**2 for x in data}
+
+
+# ============================================
+# Chapter 7: sets
+# ============================================
+
+def _set_pair(n):
+    return set(range(n)), set(range(n // 2, n + n // 2))
+
+
+@suite.case("sets.build_with_duplicates", size=100_000)
+def _(n):
+    data = [i % (n // 2) for i in range(n)]
+    return lambda: set(data)
+
+
+@suite.case("sets.union", size=100_000)
+def _(n):
+    a, b = _set_pair(n)
+    return lambda: a | b
+
+
+@suite.case("sets.intersection", size=100_000)
+def _(n):
+    a, b = _set_pair(n)
+    return lambda: a & b
+
+
+@suite.case("sets.difference", size=100_000)
+def _(n):
+    a, b = _set_pair(n)
+    return lambda: a - b
+
+
+@suite.case("sets.membership", size=100_000)
+def _(n):
+    a, _ = _set_pair(n)
+    probes = list(range(0, 2 * n, 2))
+    return lambda: sum(1 for p in probes if p in a)
+
+
+# ============================================
+# Chapter 8: strings
+# ============================================
+
+@suite.case("strings.method_chain", size=10_000)
+def _(n):
+    texts = [f"Hello, {word} World!" for word in _words(n)]
+    return lambda: [t.lower().replace("world", "python").title() for t in texts]
+
+
+@suite.case("strings.split_join", size=10_000)
+def _(n):
+    texts = [", ".join(_words(8, seed)) for seed in range(n)]
+    return lambda: [" | ".join(t.split(", ")) for t in texts]
+
+
+@suite.case("strings.fstring_format", size=10_000)
+def _(n):
+    people = list(zip(_words(n), range(n)))
+    return lambda: [f"My name is {name} and I'm {age}" for name, age in people]
+
+
+@suite.case("strings.contains", size=10_000)
+def _(n):
+    texts = [f"{word} Hello there" if i % 3 else word for i, word in enumerate(_words(n))]
+    return lambda: sum("Hello" in t for t in texts)
+
+
+# ============================================
+# Chapter 15: generators
+# ============================================
+
+@suite.case("generators.count_up_to", size=1_000_000)
+def _(n):
+    return lambda: sum(count_up_to(n))
+
+
+@suite.case("generators.expression", size=1_000_000)
+def _(n):
+    return lambda: sum(x**2 for x in range(n))
+
+
+# ============================================
+# Chapter 16: map, filter, reduce
+# ============================================
+
+@suite.case("functional.map", size=100_000)
+def _(n):
+    numbers = list(range(n))
+    return lambda: list(map(lambda x: x**2, numbers))
+
+
+@suite.case("functional.filter", size=100_000)
+def _(n):
+    numbers = list(range(n))
+    return lambda: list(filter(lambda x: x % 2 == 0, numbers))
+
+
+@suite.case("functional.reduce", size=100_000)
+def _(n):
+    numbers = list(range(n))
+    return lambda: reduce(lambda a, b: a + b, numbers)
+
+
+# ============================================
+# Chapters 18 and 20: dataclass, TodoApp
+# ============================================
+
+@suite.case("dataclass.create", size=100_000)
+def _(n):
+    rows = [(name, i % 90, "NYC") for i, name in enumerate(_words(n))]
+    return lambda: [Person(name, age, city) for name, age, city in rows]
+
+
+@suite.case("dataclass.compare", size=100_000)
+def _(n):
+    left = [Person(name, i % 90) for i, name in enumerate(_words(n))]
+    right = [Person(p.name, p.age) for p in left]
+    return lambda: sum(a == b for a, b in zip(left, right))
+
+
+@suite.case("todo.add_complete_show", size=10_000)
+def _(n):
+    tasks = [f"Task {word}" for word in _words(n)]
+
+    def run():
+        with redirect_stdout(_Sink()):
+            app = TodoApp()
+            for task in tasks:
+                app.add_todo(task)
+            for i in range(0, n, 2):
+                app.complete_todo(i)
+            app.show_todos()
+    return run
+
+
+@suite.case("todo.remove_front", size=2_000)
+def _(n):
+    tasks = [f"Task {word}" for word in _words(n)]
+
+    def run():
+        with redirect_stdout(_Sink()):
+            app = TodoApp()
+            for task in tasks:
+                app.add_todo(task)
+            while app.todos:
+                app.remove_todo(0)
+    return run
+
+
+# ============================================
+# Chapter 22: JSON
+# ============================================
+
+@suite.case("json.round_trip", size=10_000)
+def _(n):
+    records = [{"name": name, "age": i % 90, "city": "NYC", "tags": ["a", "b"], "active": i % 2 == 0}
+               for i, name in enumerate(_words(n))]
+    return lambda: json.loads(json.dumps(records))
+
+
+# ============================================
+# Chapter 23: regular expressions
+# ============================================
+
+def _email_lines(n):
+    words = _words(n)
+    return [f"Contact {w} at {w}@example.com or {w}.x@mail.org" if i % 4 else f"No email for {w}"
+            for i, w in enumerate(words)]
+
+
+@suite.case("regex.extract_emails", size=10_000)
+def _(n):
+    text = "\n".join(_email_lines(n))
+    pattern = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+    return lambda: pattern.findall(text)
+
+
+@suite.case("regex.is_valid_email", size=10_000)
+def _(n):
+    candidates = [f"{w}@example.com" if i % 3 else f"{w}-at-example" for i, w in enumerate(_words(n))]
+    return lambda: sum(map(is_valid_email, candidates))
+
+
+# ============================================
+# Chapters 24-25: threads, asyncio
+# ============================================
+
+@suite.case("threads.start_join", size=32)
+def _(n):
+    def work():
+        sum(range(10_000))
+
+    def run():
+        threads = [threading.Thread(target=work) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    return run
+
+
+@suite.case("asyncio.gather", size=1_000)
+def _(n):
+    async def fetch(i):
+        await asyncio.sleep(0)
+        return {"data": i}
+
+    async def gather():
+        return await asyncio.gather(*(fetch(i) for i in range(n)))
+
+    return lambda: asyncio.run(gather())
+
+
+if __name__ == "__main__":
+    suite.main()
@@ -0,0 +1,143 @@
+"""``pycourse.profiles.ProfileStore`` against a list of chapter 6 dicts.
+
+    python -m benchmarks.profiles                # memory table, then timings
+    python -m benchmarks.profiles -k get --scale 0.1
+
+Every profile starts as ``{"name", "age", "city"}``; as in chapter 6 the
+age is then changed, one in four profiles gets an ``email`` and one in
+eight loses its ``city``. The memory table traces the allocations of
+building ``size`` profiles each way; values come from small shared pools,
+so it measures the containers. Timings:
+
+``build.*``   build every profile from (name, age, city) tuples, then apply the chapter 6 edits
+``get.*``     read ``age`` (schema key) and ``email`` (optional) of every profile
+``update.*``  add one to every ``age``
+``row.*``     read three keys through one profile at a time
+"""
+
+import random
+import sys
+import tracemalloc
+from functools import lru_cache
+
+from pycourse.profiles import ProfileStore
+
+from ._harness import Suite
+
+suite = Suite("profiles")
+SIZE = 1_000_000
+SCHEMA = ("name", "age", "city")
+NAMES = ["Alice", "Bob", "Chloé", "Dmitri", "Eva", "Farah", "Günter", "Hana"]
+CITIES = ["New York", "Lagos", "Karachi", "Lima", "Oslo", "Osaka"]
+
+
+@lru_cache(maxsize=2)
+def _fields(n):
+    rng = random.Random(11)
+    return [(rng.choice(NAMES), rng.randrange(16, 80), rng.choice(CITIES)) for _ in range(n)]
+
+
+def _build_dicts(n):
+    people = [{"name": name, "age": age, "city": city} for name, age, city in _fields(n)]
+    for i, person in enumerate(people):
+        person["age"] += 1
+        if i % 4 == 0:
+            person["email"] = "learner@example.com"
+        if i % 8 == 1:
+            del person["city"]
+    return people
+
+
+def _build_store(n):
+    store = ProfileStore(SCHEMA)
+    store.extend_rows(_fields(n))
+    store.update_many("age", [age + 1 for age in store.get_many("age")])
+    store.update_many("email", ["learner@example.com"] * len(range(0, n, 4)), rows=range(0, n, 4))
+    store.delete_many("city", rows=range(1, n, 8))
+    return store
+
+
+def _traced(build, n):
+    _fields(n)
+    tracemalloc.start()
+    try:
+        built = build(n)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del built
+    return size
+
+
+def memory_table(scale=1.0):
+    n = max(8, int(SIZE * scale))
+    fresh = _traced(lambda n: [{"name": a, "age": b, "city": c} for a, b, c in _fields(n)], n)
+    edited = _traced(_build_dicts, n)
+    store = _traced(_build_store, n)
+    print(f"{'profiles':>10}{'fresh dicts':>16}{'edited dicts':>16}{'ProfileStore':>16}")
+    print(f"{n:>10,}" + "".join(f"{size / n:>11.1f} B/row" for size in (fresh, edited, store)))
+    print()
+
+
+@suite.case("build.dicts", size=SIZE)
+def _(n):
+    _fields(n)
+    return lambda: _build_dicts(n)
+
+
+@suite.case("build.store", size=SIZE)
+def _(n):
+    _fields(n)
+    return lambda: _build_store(n)
+
+
+@suite.case("get.dicts", size=SIZE)
+def _(n):
+    people = _build_dicts(n)
+    return lambda: ([p["age"] for p in people], [p.get("email") for p in people])
+
+
+@suite.case("get.store", size=SIZE)
+def _(n):
+    store = _build_store(n)
+    return lambda: (store.get_many("age"), store.get_many("email"))
+
+
+@suite.case("update.dicts", size=SIZE)
+def _(n):
+    people = _build_dicts(n)
+
+    def run():
+        for p in people:
+            p["age"] += 1
+    return run
+
+
+@suite.case("update.store", size=SIZE)
+def _(n):
+    store = _build_store(n)
+    return lambda: store.update_many("age", [age + 1 for age in store.get_many("age")])
+
+
+@suite.case("row.dicts", size=SIZE // 10)
+def _(n):
+    people = _build_dicts(n)
+    return lambda: [(p["name"], p["age"], p.get("city")) for p in people]
+
+
+@suite.case("row.store", size=SIZE // 10)
+def _(n):
+    store = _build_store(n)
+    return lambda: [(p["name"], p["age"], p.get("city")) for p in store]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--list" not in argv:
+        scale = float(argv[argv.index("--scale") + 1]) if "--scale" in argv else 1.0
+        memory_table(scale)
+    suite.main(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""``asyncio.run`` per call against one reused loop (``pycourse.runtime``).
+
+    python -m benchmarks.runtime
+    python -m benchmarks.runtime -k "threads.*"
+
+Each case makes ``size`` calls of a small request handler (one
+``await asyncio.sleep(0)``, a dict back):
+
+``call.asyncio_run``      ``asyncio.run(handler(i))``: a new loop per call
+``call.runner``           one ``asyncio.Runner`` reused on this thread
+``call.runtime``          ``AsyncRuntime.run``: the loop on its own thread
+``call.runtime_submit``   ``AsyncRuntime.submit`` every call, then wait for all
+``threads.asyncio_run``   4 request threads, each calling ``asyncio.run``
+``threads.runtime``       4 request threads sharing one ``AsyncRuntime``
+
+The per-item time is the cost of one call; its inverse is the calls per
+second one process can sustain. The runner and thread pools the cases set
+up are closed once the suite has run.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from pycourse.runtime import get_runtime
+
+from ._harness import Suite
+
+suite = Suite("runtime")
+SIZE = 500
+THREADS = 4
+# The cases' asyncio.Runner and thread pools, closed after suite.main().
+_resources = ExitStack()
+
+
+async def _handler(i):
+    await asyncio.sleep(0)
+    return {"data": i}
+
+
+@suite.case("call.asyncio_run", size=SIZE)
+def _(n):
+    return lambda: [asyncio.run(_handler(i)) for i in range(n)]
+
+
+@suite.case("call.runner", size=SIZE)
+def _(n):
+    runner = _resources.enter_context(asyncio.Runner())
+    return lambda: [runner.run(_handler(i)) for i in range(n)]
+
+
+@suite.case("call.runtime", size=SIZE)
+def _(n):
+    runtime = get_runtime()
+    return lambda: [runtime.run(_handler(i)) for i in range(n)]
+
+
+@suite.case("call.runtime_submit", size=SIZE)
+def _(n):
+    runtime = get_runtime()
+    return lambda: [f.result() for f in [runtime.submit(_handler(i)) for i in range(n)]]
+
+
+@suite.case("threads.asyncio_run", size=SIZE)
+def _(n):
+    pool = _resources.enter_context(ThreadPoolExecutor(THREADS))
+    return lambda: list(pool.map(lambda i: asyncio.run(_handler(i)), range(n)))
+
+
+@suite.case("threads.runtime", size=SIZE)
+def _(n):
+    pool = _resources.enter_context(ThreadPoolExecutor(THREADS))
+    runtime = get_runtime()
+    return lambda: list(pool.map(lambda i: runtime.run(_handler(i)), range(n)))
+
+
+if __name__ == "__main__":
+    with _resources:
+        suite.main()
@@ -0,0 +1,120 @@
+"""``pycourse.sequences`` views against chapter 5's materialised lists.
+
+    python -m benchmarks.sequences               # memory table, then timings
+    python -m benchmarks.sequences -k contains
+
+The memory table traces what ``[x**2 for x in range(n)]`` and
+``[x for x in range(n) if x % 2 == 0]`` allocate against
+``power_view(range(n))`` and ``multiples(range(n), 2)``. A list is
+measured at ``--scale`` x 10^6 elements and extrapolated to 10^8; the
+views are measured at 10^8. Timings, each case over ``size`` elements:
+
+``*.list``  build the chapter 5 list, then use it
+``*.view``  the same through a view (nothing to build)
+"""
+
+import sys
+import tracemalloc
+
+from pycourse.sequences import multiples, power_view
+
+from ._harness import Suite
+
+suite = Suite("sequences")
+SIZE = 1_000_000
+VIEW_SIZE = 10**8
+
+
+def _traced(build):
+    tracemalloc.start()
+    try:
+        built = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del built
+    return size
+
+
+def memory_table(scale=1.0):
+    n = max(1, int(SIZE * scale))
+    rows = [
+        ("squares", lambda: [x**2 for x in range(n)], lambda: power_view(range(VIEW_SIZE))),
+        ("evens", lambda: [x for x in range(n) if x % 2 == 0],
+         lambda: multiples(range(VIEW_SIZE), 2)),
+    ]
+    print(f"{'sequence':<10}{'list @ ' + format(n, ','):>22}{'list @ 10^8 (est.)':>22}{'view @ 10^8':>14}")
+    for name, build_list, build_view in rows:
+        listed = _traced(build_list)
+        print(f"{name:<10}{listed:>20,} B{listed * VIEW_SIZE // n:>20,} B{_traced(build_view):>12,} B")
+    print()
+
+
+@suite.case("first5.list", size=SIZE)
+def _(n):
+    return lambda: [x**2 for x in range(n)][:5]
+
+
+@suite.case("first5.view", size=SIZE)
+def _(n):
+    return lambda: power_view(range(n))[:5].tolist()
+
+
+@suite.case("contains.list", size=SIZE)
+def _(n):
+    squares = [x**2 for x in range(n)]
+    target = (n - 1) ** 2
+    return lambda: (target in squares, target + 1 in squares)
+
+
+@suite.case("contains.view", size=SIZE)
+def _(n):
+    squares = power_view(range(n))
+    target = (n - 1) ** 2
+    return lambda: (target in squares, target + 1 in squares)
+
+
+@suite.case("index.list", size=SIZE)
+def _(n):
+    squares = [x**2 for x in range(n)]
+    target = (n // 2) ** 2
+    return lambda: squares.index(target)
+
+
+@suite.case("index.view", size=SIZE)
+def _(n):
+    squares = power_view(range(n))
+    target = (n // 2) ** 2
+    return lambda: squares.index(target)
+
+
+@suite.case("evens_slice.list", size=SIZE)
+def _(n):
+    return lambda: [x for x in range(n) if x % 2 == 0][:5]
+
+
+@suite.case("evens_slice.view", size=SIZE)
+def _(n):
+    return lambda: list(multiples(range(n), 2)[:5])
+
+
+@suite.case("sum.list", size=SIZE)
+def _(n):
+    return lambda: sum([x**2 for x in range(n)])
+
+
+@suite.case("sum.view", size=SIZE)
+def _(n):
+    return lambda: sum(power_view(range(n)))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--list" not in argv:
+        scale = float(argv[argv.index("--scale") + 1]) if "--scale" in argv else 1.0
+        memory_table(scale)
+    suite.main(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""``pycourse.sets`` against builtin ``set``: speed and memory.
+
+    python -m benchmarks.sets                    # memory table, then timings
+    python -m benchmarks.sets -k intersection --scale 0.1
+
+Two workloads, each run with ``set``, ``SortedIntSet`` and ``RoaringBitmap``:
+
+``cohort``
+    Two cohorts of ``size`` random learner IDs drawn from five times as
+    many IDs (dense: most chunks end up as bitmaps).
+``sparse``
+    Two cohorts of ``size`` IDs drawn from a billion (one or two IDs per
+    chunk; where ``SortedIntSet`` is meant to win).
+
+``*_size`` cases count the result without building it (``len(a & b)`` for
+``set``).
+"""
+
+import random
+import sys
+from functools import lru_cache
+
+from pycourse.sets import RoaringBitmap, SortedIntSet, int_set
+
+from ._harness import Suite
+
+suite = Suite("sets")
+KINDS = {"set": set, "sorted": SortedIntSet, "roaring": RoaringBitmap}
+WORKLOADS = {"cohort": (1_000_000, 5), "sparse": (100_000, 10_000)}  # size, ID space / size
+
+
+@lru_cache(maxsize=None)
+def _ids(workload, n):
+    space = n * WORKLOADS[workload][1]
+    rng = random.Random(7)
+    return rng.sample(range(space), n), rng.sample(range(space), n)
+
+
+@lru_cache(maxsize=4)
+def _pair(workload, kind, n):
+    a, b = _ids(workload, n)
+    return KINDS[kind](a), KINDS[kind](b)
+
+
+OPERATIONS = {
+    "union": lambda a, b: a | b,
+    "intersection": lambda a, b: a & b,
+    "difference": lambda a, b: a - b,
+    "intersection_size": lambda a, b: len(a & b) if isinstance(a, set) else a.intersection_size(b),
+    "difference_size": lambda a, b: len(a - b) if isinstance(a, set) else a.difference_size(b),
+}
+
+
+def _register(workload, operation, kind):
+    size = WORKLOADS[workload][0]
+
+    @suite.case(f"{workload}.{operation}.{kind}", size=size)
+    def _(n):
+        a, b = _pair(workload, kind, n)
+        op = OPERATIONS[operation]
+        return lambda: op(a, b)
+
+
+for _workload in WORKLOADS:
+    for _operation in OPERATIONS:
+        for _kind in KINDS:
+            _register(_workload, _operation, _kind)
+
+
+def _set_bytes(s):
+    return sys.getsizeof(s) + sum(sys.getsizeof(v) for v in s)
+
+
+def memory_table(scale=1.0):
+    print(f"{'workload':<10}{'IDs':>12}{'set':>14}{'sorted':>14}{'roaring':>14}  int_set() picks")
+    for workload, (size, _) in WORKLOADS.items():
+        n = max(1, int(size * scale))
+        ids = _ids(workload, n)[0]
+        cells = [_set_bytes(set(ids)), SortedIntSet(ids).nbytes, RoaringBitmap(ids).nbytes]
+        print(f"{workload:<10}{n:>12,}" + "".join(f"{c / n:>10.1f} B/ID" for c in cells)
+              + f"  {type(int_set(ids)).__name__}")
+    print()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--list" not in argv:
+        scale = float(argv[argv.index("--scale") + 1]) if "--scale" in argv else 1.0
+        memory_table(scale)
+    suite.main(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Start-up import budget for rendering a single chapter.
+
+    python -m benchmarks.startup            # report and check the budget
+    python -m benchmarks.startup --runs 9
+
+Each case in ``startup_budget.json`` runs ``python -X importtime SCRIPT
+--chapter N`` several times. Modules the bare interpreter already imports
+(``python -X importtime -c pass``) are subtracted, leaving what the course
+script itself pulls in.
+
+Absolute milliseconds depend on the machine, so each run is paired with a
+run of ``python -X importtime -c pass`` and the budget is a ratio: the
+script's own imports divided by the bare interpreter's. A case fails when
+its median ratio exceeds ``max_import_ratio`` or when any ``forbidden``
+module gets imported, e.g. ``asyncio`` while rendering chapter 1. Exit
+status is 1 on any failure.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from pycourse.runner import course_path
+
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_budget.json")
+
+
+def import_times(args):
+    """Run ``python -X importtime *args``.
+
+    Returns ``({module: cumulative_us}, imported)``: the cumulative time of
+    each top-level import, and the names of every module imported.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    times, imported = {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.add(name.strip())
+        # Nested imports are indented under their importer; only top-level
+        # entries are summed so each microsecond is counted once.
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times, imported
+
+
+def measure(course, chapter, runs, baseline):
+    """Median import ms of the script, of ``-c pass``, and their ratio."""
+    args = [course_path(course), "--chapter", str(chapter)]
+    totals, bare, ratios, imported = [], [], [], set()
+    for _ in range(runs):
+        times, imported = import_times(args)
+        total = sum(us for name, us in times.items() if name not in baseline) / 1000
+        # The bare run right next to it sees the same machine load.
+        bare_ms = sum(import_times(["-c", "pass"])[0].values()) / 1000
+        totals.append(total)
+        bare.append(bare_ms)
+        ratios.append(total / bare_ms)
+    return (statistics.median(totals), statistics.median(bare), statistics.median(ratios),
+            imported - baseline)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", default=BUDGET_FILE)
+    args = parser.parse_args(argv)
+
+    with open(args.budget, encoding="utf-8") as f:
+        budget = json.load(f)
+
+    baseline = import_times(["-c", "pass"])[1]
+    failures = 0
+    print(f"{'case':<14}{'imports ms':>12}{'bare ms':>9}{'ratio':>7}{'budget':>8}  result")
+    for case in budget["cases"]:
+        label = f"{case['course']}:{case['chapter']}"
+        median_ms, bare_ms, ratio, imported = measure(case["course"], case["chapter"], args.runs, baseline)
+        problems = []
+        if ratio > case["max_import_ratio"]:
+            problems.append("over budget")
+        leaked = sorted(m for m in case.get("forbidden", []) if m in imported)
+        if leaked:
+            problems.append("imported " + ", ".join(leaked))
+        failures += bool(problems)
+        print(f"{label:<14}{median_ms:>12.2f}{bare_ms:>9.2f}{ratio:>7.2f}{case['max_import_ratio']:>8.2f}  "
+              f"{'; '.join(problems) or 'ok'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""``pycourse.strings.StringChain`` against per-string method calls.
+
+    python -m benchmarks.strings
+    python -m benchmarks.strings -k numpy --scale 10
+
+Every case normalises the same learner names with
+``strip().lower().replace("  ", " ").title()``:
+
+``per_string``      the chapter 8 way, ``[t.strip().lower()... for t in names]``
+``step_lists``      one list per method, as a naive batch pipeline would build
+``chain``           ``StringChain`` on a list
+``chain_stream``    ``StringChain.stream`` consumed without keeping results
+``chain_processes`` ``StringChain(..., processes=2)``; includes pool start-up
+``chain_numpy``     ``backend="numpy"``; only registered when NumPy is installed
+"""
+
+import os
+import random
+from collections import deque
+
+from pycourse.strings import StringChain, numpy_available
+
+from ._harness import Suite
+
+suite = Suite("strings")
+SIZE = 200_000
+NORMALIZE = StringChain().strip().lower().replace("  ", " ").title()
+
+
+def _names(n):
+    rng = random.Random(3)
+    first = ["alice", "BOB", "Chloé", "dmitri", "EVA", "farah", "günter", "hana"]
+    last = ["smith", "O'NEIL", "van  der berg", "Nakamura", "LÓPEZ", "ng", "müller"]
+    return [f"  {rng.choice(first)}  {rng.choice(last)} " for _ in range(n)]
+
+
+@suite.case("normalize.per_string", size=SIZE)
+def _(n):
+    names = _names(n)
+    return lambda: [t.strip().lower().replace("  ", " ").title() for t in names]
+
+
+@suite.case("normalize.step_lists", size=SIZE)
+def _(n):
+    names = _names(n)
+
+    def run():
+        stripped = [t.strip() for t in names]
+        lowered = [t.lower() for t in stripped]
+        replaced = [t.replace("  ", " ") for t in lowered]
+        return [t.title() for t in replaced]
+    return run
+
+
+@suite.case("normalize.chain", size=SIZE)
+def _(n):
+    names = _names(n)
+    return lambda: NORMALIZE(names)
+
+
+@suite.case("normalize.chain_stream", size=SIZE)
+def _(n):
+    names = _names(n)
+    return lambda: deque(NORMALIZE.stream(iter(names)), maxlen=0)
+
+
+@suite.case("normalize.chain_processes", size=SIZE)
+def _(n):
+    names = _names(n)
+    processes = max(2, min(4, os.cpu_count() or 1))
+    return lambda: NORMALIZE(names, processes=processes, chunk_size=max(1, n // (4 * processes)))
+
+
+if numpy_available():
+    @suite.case("normalize.chain_numpy", size=SIZE)
+    def _(n):
+        names = _names(n)
+        return lambda: NORMALIZE(names, backend="numpy")
+
+
+if __name__ == "__main__":
+    suite.main()
@@ -0,0 +1,101 @@
+"""``pycourse.templates`` against per-row f-strings, ``.format`` and ``%``.
+
+    python -m benchmarks.templates
+    python -m benchmarks.templates -k todo --scale 0.1
+
+``todo.*`` renders ``TodoApp.show_todos`` rows for ``size`` todos and
+``banner.*`` renders chapter banners for ``size`` titles, each into one
+report string:
+
+``fstring``   ``f"  {i}. [{status}] {task}"`` per row, the chapter 8 way
+``format``    ``"  {}. [{}] {}".format(...)`` per row
+``percent``   ``"  %d. [%s] %s" % (...)`` per row
+``template``  the precompiled ``TODO_ROW`` / ``BANNER`` template
+"""
+
+import random
+
+from pycourse.templates import BANNER, TODO_ROW, banners, todo_rows
+
+from ._harness import Suite
+
+suite = Suite("templates")
+SIZE = 100_000
+
+
+def _todos(n):
+    rng = random.Random(5)
+    tasks = ["Learn Python", "Build a project", "Review chapter 8", "Write tests", "Read the docs"]
+    return [{"task": f"{rng.choice(tasks)} #{i}", "completed": rng.random() < 0.3} for i in range(n)]
+
+
+def _titles(n):
+    return [f"CHAPTER {i % 25 + 1}: Section {i}" for i in range(n)]
+
+
+@suite.case("todo.fstring", size=SIZE)
+def _(n):
+    todos = _todos(n)
+    return lambda: "\n".join([f"  {i}. [{'X' if t['completed'] else 'O'}] {t['task']}"
+                              for i, t in enumerate(todos)])
+
+
+@suite.case("todo.format", size=SIZE)
+def _(n):
+    todos = _todos(n)
+    return lambda: "\n".join(["  {}. [{}] {}".format(i, "X" if t["completed"] else "O", t["task"])
+                              for i, t in enumerate(todos)])
+
+
+@suite.case("todo.percent", size=SIZE)
+def _(n):
+    todos = _todos(n)
+    return lambda: "\n".join(["  %d. [%s] %s" % (i, "X" if t["completed"] else "O", t["task"])
+                              for i, t in enumerate(todos)])
+
+
+@suite.case("todo.template", size=SIZE)
+def _(n):
+    todos = _todos(n)
+    return lambda: "\n".join(todo_rows(todos))
+
+
+@suite.case("todo.template_rows", size=SIZE)
+def _(n):
+    # Records already shaped for the template: the cost of rendering alone.
+    rows = [(i, "X" if t["completed"] else "O", t["task"]) for i, t in enumerate(_todos(n))]
+    return lambda: TODO_ROW.join(rows)
+
+
+@suite.case("banner.fstring", size=SIZE)
+def _(n):
+    titles = _titles(n)
+    return lambda: "\n".join([f"\n{'=' * 60}\n{title}\n{'=' * 60}" for title in titles])
+
+
+@suite.case("banner.format", size=SIZE)
+def _(n):
+    titles = _titles(n)
+    return lambda: "\n".join(["\n{}\n{}\n{}".format("=" * 60, title, "=" * 60) for title in titles])
+
+
+@suite.case("banner.percent", size=SIZE)
+def _(n):
+    titles = _titles(n)
+    return lambda: "\n".join(["\n%s\n%s\n%s" % ("=" * 60, title, "=" * 60) for title in titles])
+
+
+@suite.case("banner.template", size=SIZE)
+def _(n):
+    titles = _titles(n)
+    return lambda: banners(titles)
+
+
+@suite.case("banner.template_rows", size=SIZE)
+def _(n):
+    rows = [{"title": title} for title in _titles(n)]
+    return lambda: BANNER.join(rows)
+
+
+if __name__ == "__main__":
+    suite.main()
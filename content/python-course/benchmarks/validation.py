@@ -0,0 +1,59 @@
+"""Bulk age validation against raising ``ValueError`` per invalid age.
+
+    python -m benchmarks.validation
+    python -m benchmarks.validation -k rate_50
+
+Each ``rate_N`` workload validates ``size`` ages of which N% are negative:
+
+``raising``  ``validate_age`` in a ``try``/``except ValueError`` loop, chapter 10 style
+``pairs``    ``validate_ages``: one ``(age, error)`` pair per age
+``mask``     ``valid_ages_mask``: one ``bool`` per age
+"""
+
+import random
+from functools import lru_cache
+
+from pycourse.core.exceptions import valid_ages_mask, validate_age, validate_ages
+
+from ._harness import Suite
+
+suite = Suite("validation")
+SIZE = 1_000_000
+RATES = (0, 1, 10, 50)   # percent of invalid ages
+
+
+@lru_cache(maxsize=2)
+def _ages(rate, n):
+    rng = random.Random(rate)
+    return [-rng.randrange(1, 100) if rng.random() * 100 < rate else rng.randrange(0, 100)
+            for _ in range(n)]
+
+
+def _raising(ages):
+    results = []
+    for age in ages:
+        try:
+            results.append((validate_age(age), None))
+        except ValueError as e:
+            results.append((None, e))
+    return results
+
+
+APPROACHES = {"raising": _raising, "pairs": validate_ages, "mask": valid_ages_mask}
+
+
+def _register(rate, approach):
+    @suite.case(f"rate_{rate}.{approach}", size=SIZE)
+    def _(n):
+        ages = _ages(rate, n)
+        validate = APPROACHES[approach]
+        return lambda: validate(ages)
+
+
+for _rate in RATES:
+    for _approach in APPROACHES:
+        _register(_rate, _approach)
+
+
+if __name__ == "__main__":
+    suite.main()
@@ -0,0 +1,70 @@
+"""Cold spawn vs warm worker latency for rendering one chapter.
+
+    python -m benchmarks.worker --requests 20 --course advanced --chapter 14
+
+Cold: ``python python-advanced-course.py --chapter 14`` in a new process
+per request. Warm: the same request sent to one ``pycourse.worker``
+subprocess that is already running. Both outputs are checked against
+each other before timing, so pick a chapter without random or clock output.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from pycourse.runner import course_path
+from pycourse.worker import WorkerClient
+
+
+def _cold(course, chapter):
+    result = subprocess.run([sys.executable, course_path(course), "--chapter", str(chapter)],
+                            capture_output=True, check=True)
+    return result.stdout.decode("utf-8")
+
+
+def _summary(label, samples):
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    return (f"{label:<6} mean {statistics.mean(ms):8.2f} ms   median {statistics.median(ms):8.2f} ms"
+            f"   p95 {p95:8.2f} ms")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--course", default="advanced")
+    parser.add_argument("--chapter", type=int, default=14)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    client = WorkerClient()
+    client.request(op="ping")
+    startup = time.perf_counter() - start
+
+    with client:
+        if client.render(args.course, args.chapter) != _cold(args.course, args.chapter).replace("\r\n", "\n"):
+            sys.exit("cold and warm output differ")
+        client.render(args.course, args.chapter)  # warm-up
+
+        cold, warm = [], []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            _cold(args.course, args.chapter)
+            cold.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            client.render(args.course, args.chapter)
+            warm.append(time.perf_counter() - start)
+
+    print(f"{args.course} chapter {args.chapter}, {args.requests} requests each")
+    print(f"worker start-up (paid once): {startup * 1000:.2f} ms")
+    print(_summary("cold", cold))
+    print(_summary("warm", warm))
+    print(f"speed-up (median): {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
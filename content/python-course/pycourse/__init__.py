@@ -0,0 +1,3 @@
+# ============================================
+# PYCOURSE - Tooling for the Python course scripts
+# ============================================
@@ -0,0 +1,224 @@
+"""Asynchronous file I/O for course assets.
+
+Blocking ``open``/``json.load``/``json.dump`` calls are pushed onto a
+bounded thread pool, so the event loop started by ``asyncio.run`` (the
+chapter 25 pattern) stays free while hundreds of files load at once.
+
+    async def main():
+        async with AsyncFiles(max_workers=8) as files:
+            texts = await files.load_many(paths)        # same order as paths
+            await files.save_many([("a.json", {"x": 1})], kind="json")
+
+    asyncio.run(main())
+
+An ``AsyncFiles`` can serve several event loops in turn (one
+``asyncio.run`` after another) until it is closed. It is a standalone
+tool: the course scripts read their few files directly, and only
+``python -m pycourse.aio`` and code written against it use it.
+"""
+
+import asyncio
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_WORKERS = 8
+KINDS = ("text", "bytes", "json")
+
+# os.umask can only be read by setting it; do that once, at import, rather
+# than racing the pool's threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# ============================================
+# Blocking helpers (run inside the pool)
+# ============================================
+
+def _read(path: str, kind: str, encoding: str) -> Any:
+    if kind == "bytes":
+        with open(path, "rb") as f:
+            return f.read()
+    with open(path, "r", encoding=encoding) as f:
+        if kind == "json":
+            return json.load(f)
+        return f.read()
+
+
+def _write(path: str, data: Any, kind: str, encoding: str) -> None:
+    # Write to a sibling temp file and rename it into place, so readers
+    # never observe a half-written asset.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        # mkstemp creates the file 0600; give it the mode the file already
+        # has, or the one open() would have created it with.
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(fd, mode)
+        if kind == "bytes":
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        else:
+            with os.fdopen(fd, "w", encoding=encoding) as f:
+                if kind == "json":
+                    json.dump(data, f, indent=2)
+                else:
+                    f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+
+
+# ============================================
+# Async file layer
+# ============================================
+
+class AsyncFiles:
+    """Bounded thread-pool backed file reader/writer for asyncio code."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, encoding: str = "utf-8"):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.encoding = encoding
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="course-io")
+        # asyncio primitives belong to the loop that first waits on them, so
+        # each running loop gets its own: loop -> (slots, {path: [lock, users]}).
+        self._loops: "weakref.WeakKeyDictionary[Any, tuple]" = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> "AsyncFiles":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+
+    def _state(self, loop: asyncio.AbstractEventLoop) -> Tuple[asyncio.Semaphore, Dict[str, list]]:
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = (asyncio.Semaphore(self.max_workers), {})
+        return state
+
+    async def _submit(self, func, *args) -> Any:
+        # The semaphore keeps the number of in-flight jobs at the pool size,
+        # so thousands of queued requests don't pile up inside the executor.
+        loop = asyncio.get_running_loop()
+        async with self._state(loop)[0]:
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    # Single files
+
+    async def read(self, path: str, kind: str = "text") -> Any:
+        _check_kind(kind)
+        return await self._submit(_read, os.fspath(path), kind, self.encoding)
+
+    async def write(self, path: str, data: Any, kind: str = "text") -> None:
+        _check_kind(kind)
+        path = os.fspath(path)
+        # Writes to the same path are serialized in call order; writes to
+        # different paths run concurrently.
+        key = os.path.abspath(path)
+        path_locks = self._state(asyncio.get_running_loop())[1]
+        entry = path_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                await self._submit(_write, path, data, kind, self.encoding)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del path_locks[key]
+
+    async def read_text(self, path: str) -> str:
+        return await self.read(path, "text")
+
+    async def write_text(self, path: str, text: str) -> None:
+        await self.write(path, text, "text")
+
+    async def read_json(self, path: str) -> Any:
+        return await self.read(path, "json")
+
+    async def write_json(self, path: str, data: Any) -> None:
+        await self.write(path, data, "json")
+
+    # Many files
+
+    async def load_many(self, paths: Sequence[str], kind: str = "text") -> List[Any]:
+        """Read every path concurrently; results keep the order of ``paths``."""
+        return list(await asyncio.gather(*(self.read(p, kind) for p in paths)))
+
+    async def save_many(self, items: Iterable[Tuple[str, Any]], kind: str = "text") -> None:
+        """Write ``(path, data)`` pairs concurrently.
+
+        A path listed more than once ends up holding its last entry.
+        """
+        # Locks are taken in list order because each write() call reaches
+        # its lock before yielding to the loop.
+        await asyncio.gather(*(self.write(p, d, kind) for p, d in items))
+
+    async def load_directory(self, root: str, suffixes: Tuple[str, ...] = (".py", ".md"),
+                             kind: str = "text") -> Dict[str, Any]:
+        """Load every file under ``root`` ending in one of ``suffixes``.
+
+        The returned dict is keyed by path and ordered by sorted path.
+        """
+        loop = asyncio.get_running_loop()
+        paths = await loop.run_in_executor(self._executor, _walk, os.fspath(root), suffixes)
+        contents = await self.load_many(paths, kind)
+        return dict(zip(paths, contents))
+
+
+def _walk(root: str, suffixes: Tuple[str, ...]) -> List[str]:
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith((".", "__"))]
+        for filename in filenames:
+            if filename.endswith(suffixes):
+                found.append(os.path.join(dirpath, filename))
+    return sorted(found)
+
+
+# ============================================
+# Command line: python -m pycourse.aio DIR
+# ============================================
+
+async def _load_and_report(root: str, max_workers: int) -> None:
+    start = time.perf_counter()
+    async with AsyncFiles(max_workers=max_workers) as files:
+        contents = await files.load_directory(root)
+    elapsed = time.perf_counter() - start
+    total = sum(len(text) for text in contents.values())
+    print(f"Loaded {len(contents)} files ({total} chars) in {elapsed * 1000:.1f} ms "
+          f"with {max_workers} workers")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load course content files concurrently.")
+    parser.add_argument("root", nargs="?", default=os.path.join(os.path.dirname(__file__), "..", ".."))
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+    asyncio.run(_load_and_report(args.root, args.workers))
+
+
+if __name__ == "__main__":
+    main()
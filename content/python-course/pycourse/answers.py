@@ -0,0 +1,145 @@
+"""Reference-answer index for ``pycourse.grading``.
+
+Grading thousands of submissions against the same test cases would run
+``sum_all(1, 2, 3, 4, 5)`` or ``[x**2 for x in range(10)]`` once per
+submission. Instead, every expected outcome is computed once per course
+version and stored on disk:
+
+    index = load_index()                      # builds it if missing or stale
+    index.expected("sum_all", 1)              # ("return", 15, "")
+
+    python -m pycourse.answers                # build and report
+    python -m pycourse.answers --rebuild
+
+The course version is a hash of the ``pycourse.core`` sources, the
+exercise table in ``pycourse/grading.py`` and the interpreter version,
+so editing a reference or a test case starts a new index file
+(``pycourse/__pycache__/answers.<version>.marshal``). Outcomes whose value
+the built-in ``marshal`` format cannot hold are left out of the index and
+computed by the grader as before.
+"""
+
+import glob
+import hashlib
+import marshal
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_DIR = os.path.join(PACKAGE_DIR, "__pycache__")
+
+
+def _version_sources() -> List[str]:
+    return sorted(glob.glob(os.path.join(PACKAGE_DIR, "core", "*.py"))) + \
+        [os.path.join(PACKAGE_DIR, "grading.py")]
+
+
+def course_version() -> str:
+    """Hash of everything the expected outcomes depend on."""
+    digest = hashlib.sha256(sys.implementation.cache_tag.encode())
+    for path in _version_sources():
+        digest.update(os.path.relpath(path, PACKAGE_DIR).encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+
+def index_path(version: Optional[str] = None) -> str:
+    return os.path.join(INDEX_DIR, f"answers.{version or course_version()}.marshal")
+
+
+class AnswerIndex:
+    """Expected outcomes by exercise name and test case number."""
+
+    def __init__(self, version: str, answers: Dict[str, Tuple[Optional[tuple], ...]]):
+        self.version = version
+        self._answers = answers
+
+    def expected(self, exercise: str, case: int) -> Optional[tuple]:
+        """The stored ``(kind, value, printed)`` outcome, or None if not indexed."""
+        outcomes = self._answers.get(exercise)
+        if outcomes is None or case >= len(outcomes):
+            return None
+        return outcomes[case]
+
+    def __len__(self) -> int:
+        return sum(outcome is not None for outcomes in self._answers.values() for outcome in outcomes)
+
+
+def _storable(outcome: tuple) -> Optional[tuple]:
+    try:
+        stored = marshal.loads(marshal.dumps(outcome))
+    except ValueError:  # marshal cannot hold this value
+        return None
+    # A value only counts as indexed if it comes back equal and of the same
+    # type (marshal turns a subclass of list into a plain list).
+    if stored != outcome or type(stored[1]) is not type(outcome[1]):
+        return None
+    return stored
+
+
+def build_index(version: Optional[str] = None) -> AnswerIndex:
+    """Run every reference once and collect the outcomes."""
+    from .grading import EXERCISES, reference_outcome
+
+    answers = {}
+    for exercise in EXERCISES.values():
+        answers[exercise.name] = tuple(_storable(reference_outcome(exercise, case))
+                                       for case in range(exercise.total))
+    return AnswerIndex(version or course_version(), answers)
+
+
+def save_index(index: AnswerIndex, path: Optional[str] = None) -> str:
+    path = path or index_path(index.version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        marshal.dump({"version": index.version, "answers": index._answers}, f)
+    os.replace(tmp, path)
+    # Indexes of earlier versions are never read again.
+    for stale in glob.glob(os.path.join(os.path.dirname(path), "answers.*.marshal")):
+        if stale != path:
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+    return path
+
+
+def load_index(rebuild: bool = False) -> AnswerIndex:
+    """Load the index for the current course version, building it if needed."""
+    version = course_version()
+    path = index_path(version)
+    if not rebuild:
+        try:
+            with open(path, "rb") as f:
+                data = marshal.load(f)
+            if data.get("version") == version:
+                return AnswerIndex(version, data["answers"])
+        except (OSError, ValueError, EOFError, TypeError, AttributeError):
+            pass
+    index = build_index(version)
+    try:
+        save_index(index, path)
+    except OSError:
+        pass  # read-only checkout: use the index from memory
+    return index
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the reference-answer index for grading.")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild even if the index is current")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    index = load_index(rebuild=args.rebuild)
+    path = index_path(index.version)
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    print(f"version {index.version}: {len(index)} answers, {size} bytes")
+    print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""Definitions shared by the Python course scripts.
+
+Each module holds the functions and classes one chapter teaches, so the
+basic, advanced and complete scripts import them instead of redefining
+them:
+
+    functions         Chapter 4   greet, greet_person, add_numbers, sum_all, ...
+    exceptions        Chapter 10  validate_age, MyError, validate_ages
+    oop               11-12       Person, Animal, Dog, Cat
+    decorators        Chapter 14  my_decorator, say_hello, repeat, greet
+    generators        Chapter 15  count_up_to
+    context_managers  Chapter 17  MyContext
+    data_classes      Chapter 18  Person (dataclass)
+    type_hints        Chapter 19  greet, add, process_items, get_user, process
+    todo              Chapter 20  TodoApp
+    regex             Chapter 23  is_valid_email
+    threads           Chapter 24  print_numbers, print_letters
+    async_tasks       Chapter 25  fetch_data, main, run_all
+"""
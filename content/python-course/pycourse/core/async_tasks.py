@@ -0,0 +1,21 @@
+"""Chapter 25: Async/Await (Python 3.5+)."""
+
+import asyncio
+
+async def fetch_data():
+    print("Fetching data...")
+    await asyncio.sleep(2)
+    print("Data fetched")
+    return {"data": "sample"}
+
+async def main():
+    result = await fetch_data()
+    print(result)
+
+# Run multiple tasks concurrently
+async def run_all():
+    await asyncio.gather(
+        fetch_data(),
+        fetch_data(),
+        fetch_data()
+    )
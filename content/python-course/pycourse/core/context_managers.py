@@ -0,0 +1,10 @@
+"""Chapter 17: Context Managers."""
+
+# Custom context manager
+class MyContext:
+    def __enter__(self):
+        print("Entering context")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        print("Exiting context")
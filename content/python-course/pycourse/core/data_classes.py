@@ -0,0 +1,9 @@
+"""Chapter 18: Data Classes (Python 3.7+)."""
+
+from dataclasses import dataclass
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    city: str = "Unknown"  # Default value
@@ -0,0 +1,37 @@
+"""Chapter 10: Exception Handling."""
+
+# Raise exceptions
+def validate_age(age):
+    if age < 0:
+        raise ValueError("Age cannot be negative")
+    return age
+
+# Custom exception
+class MyError(Exception):
+    pass
+
+# Validate many ages without raising: raising and catching one exception
+# per invalid age costs far more than the check itself.
+NEGATIVE_AGE = ValueError("Age cannot be negative")  # shared, never raised
+
+def _check_age(age):
+    try:
+        return (None, NEGATIVE_AGE) if age < 0 else (age, None)
+    except TypeError as e:  # validate_age(age) would raise this
+        return None, e
+
+def validate_ages(ages):
+    """(age, None) for each valid age, (None, error) for each invalid one."""
+    ages = ages if isinstance(ages, (list, tuple)) else list(ages)
+    try:
+        return [(None, NEGATIVE_AGE) if age < 0 else (age, None) for age in ages]
+    except TypeError:  # an age that cannot be compared: check one at a time
+        return [_check_age(age) for age in ages]
+
+def valid_ages_mask(ages):
+    """True for each age validate_age accepts, False where it would raise."""
+    ages = ages if isinstance(ages, (list, tuple)) else list(ages)
+    try:
+        return [not age < 0 for age in ages]
+    except TypeError:
+        return [_check_age(age)[1] is None for age in ages]
@@ -0,0 +1,26 @@
+"""Chapter 4: Functions."""
+
+# Basic function
+def greet(name):
+    return f"Hello, {name}!"
+
+# Function with default parameters
+def greet_person(name="Guest"):
+    return f"Hello, {name}!"
+
+# Function with multiple parameters
+def add_numbers(a, b, c=0):
+    return a + b + c
+
+# Function with *args
+def sum_all(*args):
+    return sum(args)
+
+# Function with **kwargs
+def print_info(**kwargs):
+    for key, value in kwargs.items():
+        print(f"{key}: {value}")
+
+# Lambda functions
+square = lambda x: x ** 2
+add = lambda a, b: a + b
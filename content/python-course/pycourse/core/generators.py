@@ -0,0 +1,8 @@
+"""Chapter 15: Generators."""
+
+# Generator function
+def count_up_to(n):
+    count = 1
+    while count <= n:
+        yield count
+        count += 1
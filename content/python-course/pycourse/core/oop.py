@@ -0,0 +1,42 @@
+"""Chapters 11-12: Classes, OOP and Inheritance."""
+
+class Person:
+    # Class attribute
+    species = "Homo sapiens"
+
+    # Constructor
+    def __init__(self, name, age):
+        self.name = name  # Instance attribute
+        self.age = age
+
+    # Instance method
+    def greet(self):
+        return f"Hello, I'm {self.name}"
+
+    # Method with parameters
+    def have_birthday(self):
+        self.age += 1
+        return f"Happy birthday! Now I'm {self.age}"
+
+    # String representation
+    def __str__(self):
+        return f"Person({self.name}, {self.age})"
+
+
+class Animal:
+    def __init__(self, name):
+        self.name = name
+
+    def speak(self):
+        return "Some sound"
+
+class Dog(Animal):
+    def speak(self):  # Override
+        return "Woof!"
+
+    def fetch(self):
+        return f"{self.name} is fetching"
+
+class Cat(Animal):
+    def speak(self):  # Override
+        return "Meow!"
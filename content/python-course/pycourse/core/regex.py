@@ -0,0 +1,8 @@
+"""Chapter 23: Regular Expressions."""
+
+import re
+
+# Validate email
+def is_valid_email(email):
+    pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+    return bool(re.match(pattern, email))
@@ -0,0 +1,13 @@
+"""Chapter 24: Multithreading."""
+
+import time
+
+def print_numbers():
+    for i in range(5):
+        time.sleep(1)
+        print(i)
+
+def print_letters():
+    for letter in "ABCDE":
+        time.sleep(1)
+        print(letter)
@@ -0,0 +1,31 @@
+"""Chapter 20: Complete Example - Todo App."""
+
+class TodoApp:
+    def __init__(self):
+        self.todos = []
+
+    def add_todo(self, task):
+        self.todos.append({"task": task, "completed": False})
+        print(f"✓ Added: {task}")
+
+    def complete_todo(self, index):
+        if 0 <= index < len(self.todos):
+            self.todos[index]["completed"] = True
+            print(f"✓ Completed: {self.todos[index]['task']}")
+        else:
+            print("Invalid index")
+
+    def show_todos(self):
+        if not self.todos:
+            print("No todos!")
+            return
+        for i, todo in enumerate(self.todos):
+            status = "X" if todo["completed"] else "O"
+            print(f"  {i}. [{status}] {todo['task']}")
+
+    def remove_todo(self, index):
+        if 0 <= index < len(self.todos):
+            removed = self.todos.pop(index)
+            print(f"✓ Removed: {removed['task']}")
+        else:
+            print("Invalid index")
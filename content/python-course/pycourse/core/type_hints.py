@@ -0,0 +1,19 @@
+"""Chapter 19: Type Hints."""
+
+from typing import List, Dict, Optional, Union
+
+def greet(name: str) -> str:
+    return f"Hello, {name}"
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+def process_items(items: List[str]) -> None:
+    for item in items:
+        print(item)
+
+def get_user(user_id: int) -> Optional[Dict]:
+    return {"id": user_id, "name": "Alice"}
+
+def process(value: Union[int, str]) -> str:
+    return str(value)
@@ -0,0 +1,118 @@
+"""Deterministic execution: seeded ``random`` and a frozen wall clock.
+
+Chapter 13 prints ``random.randint(1, 10)`` and ``datetime.now()``, so two
+runs never produce the same transcript. Inside ``deterministic()`` both
+are pinned, which makes transcripts byte-reproducible:
+
+    with deterministic(seed=0):
+        random.randint(1, 10)   # same value every run
+        datetime.now()          # FROZEN_AT every run
+
+Only wall-clock readings are frozen (``datetime.now``/``utcnow``/``today``,
+``date.today``, ``time.time``/``time_ns``). ``time.monotonic`` and
+``time.perf_counter`` keep running so ``sleep`` and timeouts still work.
+
+Chapter 24 starts two threads that print as they go, and their lines
+interleave differently from run to run. Inside the block
+``threading.Thread.start`` therefore runs the thread to completion before
+returning, so threads print one after the other in start order (chapter
+24 takes the sum of its threads' time instead of the longest). Daemon
+threads and ``concurrent.futures`` pool workers, which wait for work
+forever, are started as usual. Threads that need each other to finish,
+such as a producer blocked on a full queue until its consumer thread
+starts, deadlock this way; run such code with
+``deterministic(serialize_threads=False)``.
+"""
+
+import datetime as _datetime
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+DEFAULT_SEED = 0
+# Interpreted as UTC; naive now() returns it unchanged on every machine. An
+# aware frozen_at is converted to UTC first.
+FROZEN_AT = _datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+_real_datetime = _datetime.datetime
+_real_date = _datetime.date
+_real_start = threading.Thread.start
+
+
+def _frozen_classes(frozen_at: _datetime.datetime):
+    if frozen_at.tzinfo is not None:
+        frozen_at = frozen_at.astimezone(_datetime.timezone.utc)
+    instant = frozen_at.replace(tzinfo=None)
+    utc_instant = instant.replace(tzinfo=_datetime.timezone.utc)
+
+    class FrozenDatetime(_real_datetime):
+        @classmethod
+        def now(cls, tz=None):
+            value = utc_instant.astimezone(tz) if tz is not None else instant
+            return cls._from(value)
+
+        @classmethod
+        def utcnow(cls):
+            return cls._from(instant)
+
+        @classmethod
+        def today(cls):
+            return cls._from(instant)
+
+        @classmethod
+        def _from(cls, value):
+            return cls(value.year, value.month, value.day, value.hour, value.minute,
+                       value.second, value.microsecond, value.tzinfo, fold=value.fold)
+
+    class FrozenDate(_real_date):
+        @classmethod
+        def today(cls):
+            return cls(instant.year, instant.month, instant.day)
+
+    FrozenDatetime.__name__ = FrozenDatetime.__qualname__ = "datetime"
+    FrozenDate.__name__ = FrozenDate.__qualname__ = "date"
+    return FrozenDatetime, FrozenDate, utc_instant.timestamp()
+
+
+def _serial_start(thread: threading.Thread) -> None:
+    # Joins every non-daemon thread right away: one that waits on a thread
+    # started after it never returns (see the module docstring).
+    _real_start(thread)
+    target = getattr(thread, "_target", None)
+    if thread.daemon or getattr(target, "__module__", "").startswith("concurrent.futures"):
+        return
+    thread.join()
+
+
+@contextmanager
+def deterministic(seed: int = DEFAULT_SEED,
+                  frozen_at: Optional[_datetime.datetime] = None,
+                  serialize_threads: bool = True) -> Iterator[None]:
+    """Seed ``random``, freeze the wall clock and serialise threads until the block exits.
+
+    ``from datetime import datetime`` executed inside the block picks up the
+    frozen class, which is how the course scripts import it. The previous
+    random state and clock are restored afterwards. ``serialize_threads=False``
+    leaves ``Thread.start`` alone, for threads that wait on one another.
+    """
+    frozen_datetime, frozen_date, timestamp = _frozen_classes(frozen_at or FROZEN_AT)
+    saved_state = random.getstate()
+    saved_time, saved_time_ns = time.time, time.time_ns
+
+    random.seed(seed)
+    _datetime.datetime = frozen_datetime
+    _datetime.date = frozen_date
+    time.time = lambda: timestamp
+    time.time_ns = lambda: int(timestamp * 1_000_000_000)
+    if serialize_threads:
+        threading.Thread.start = _serial_start
+    try:
+        yield
+    finally:
+        _datetime.datetime = _real_datetime
+        _datetime.date = _real_date
+        time.time, time.time_ns = saved_time, saved_time_ns
+        threading.Thread.start = _real_start
+        random.setstate(saved_state)
@@ -0,0 +1,357 @@
+"""Threads, processes or free-threaded threads: measure, then pick per job.
+
+Chapter 24 starts threads for ``time.sleep`` work, where they shine. The
+CPU-bound jobs that grew out of the course (regex validation, JSON round
+trips, ``reduce``) hold the GIL, so threads run them one at a time. This
+harness runs the same job under every executor at increasing worker
+counts and reports the scaling curve:
+
+    python -m pycourse.executors                    # every registered job
+    python -m pycourse.executors regex json --workers 1,2,4,8
+    python -m pycourse.executors --python python3.13t   # add a free-threaded build
+    python -m pycourse.executors --json scaling.json
+
+Executors are ``serial`` (the baseline), ``threads`` (reported as
+``free-threaded`` when this interpreter runs without a GIL) and
+``processes``. ``--python`` also runs the thread measurements under
+another interpreter, typically a free-threaded CPython 3.13+ build, and
+adds them to the table. Pools are started and warmed before timing, so
+the numbers are per-batch throughput of a long-lived pool.
+
+In code, register a job and let the harness choose:
+
+    register("thumbnails", make_thumbnail, lambda scale: paths_in_chunks(scale))
+    calibrate("thumbnails")                 # times every candidate: takes seconds
+    pick("thumbnails")                      # ("processes", 4)
+    results = run("thumbnails", chunks)     # on the picked executor
+
+A job's function takes one chunk and returns one result. Processes can
+only run a function they can unpickle, i.e. a module-level one; a lambda
+or nested function is never picked for them, and ``scaling`` leaves
+processes out of its curve. Calibration runs the job under each
+candidate, so it only happens when ``calibrate`` is called: ``pick`` and
+``run`` raise ``LookupError`` for a job that has not been calibrated (or
+was registered again since). ``run`` keeps the picked pool alive for the
+job's later calls, as calibration measured warm pools, and may be called
+from several threads; a pool replaced by a new calibration is shut down
+once the calls using it finish. ``shutdown()`` closes the pools (and runs
+at exit).
+"""
+
+import atexit
+import json
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+KINDS = ("serial", "threads", "processes")
+COURSE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class Job(NamedTuple):
+    name: str
+    func: Callable[[Any], Any]                    # one chunk -> one result
+    make_chunks: Callable[[float], List[Any]]     # scale -> the chunks of one run
+
+
+class Point(NamedTuple):
+    job: str
+    executor: str
+    workers: int
+    seconds: float
+    speedup: float      # serial seconds / seconds
+
+
+JOBS: Dict[str, Job] = {}
+_choices: Dict[str, Tuple[str, int]] = {}
+_pools: Dict[str, list] = {}   # job -> [pick, its running pool, run() calls using it]
+_pools_lock = threading.Lock()
+
+
+def _retire(name: str) -> Optional[Executor]:
+    # Called with _pools_lock held. A pool still in use is left to the last
+    # run() using it; an idle one is returned for the caller to shut down.
+    kept = _pools.pop(name, None)
+    return kept[1] if kept is not None and not kept[2] else None
+
+
+def _close_pool(name: str) -> None:
+    with _pools_lock:
+        idle = _retire(name)
+    if idle is not None:
+        idle.shutdown()
+
+
+def register(name: str, func: Callable[[Any], Any],
+             make_chunks: Callable[[float], List[Any]]) -> Job:
+    job = JOBS[name] = Job(name, func, make_chunks)
+    _choices.pop(name, None)
+    _close_pool(name)
+    return job
+
+
+def _job(job) -> Job:
+    if isinstance(job, Job):
+        return job
+    if job not in JOBS:
+        raise ValueError(f"unknown job {job!r}, expected one of {sorted(JOBS)}")
+    return JOBS[job]
+
+
+# ============================================
+# Built-in jobs
+# ============================================
+
+def _regex_job(emails: List[str]) -> int:
+    from pycourse.core.regex import is_valid_email
+    return sum(map(is_valid_email, emails))
+
+
+def _json_job(records: List[dict]) -> int:
+    return len(json.loads(json.dumps(records)))
+
+
+def _reduce_job(numbers: range) -> int:
+    return reduce(lambda total, x: total + x * x, numbers, 0)
+
+
+def _sleep_job(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def _chunks(scale: float, count: int, make: Callable[[int], Any]) -> List[Any]:
+    return [make(i) for i in range(max(1, int(count * scale)))]
+
+
+register("regex", _regex_job, lambda scale: _chunks(
+    scale, 64, lambda i: [f"learner{j}@example.com" if j % 3 else f"learner{j}@invalid"
+                          for j in range(i * 2000, (i + 1) * 2000)]))
+register("json", _json_job, lambda scale: _chunks(
+    scale, 64, lambda i: [{"id": j, "task": f"Task {j}", "completed": j % 2 == 0, "tags": ["a", "b"]}
+                          for j in range(1000)]))
+register("reduce", _reduce_job, lambda scale: _chunks(
+    scale, 64, lambda i: range(i * 50_000, (i + 1) * 50_000)))
+register("sleep", _sleep_job, lambda scale: _chunks(scale, 32, lambda i: 0.01))
+
+
+# ============================================
+# Measuring
+# ============================================
+
+def _executor(kind: str, workers: int) -> Optional[Executor]:
+    if kind == "serial":
+        return None
+    if kind == "threads":
+        return ThreadPoolExecutor(workers)
+    if kind == "processes":
+        import multiprocessing
+        methods = multiprocessing.get_all_start_methods()
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(
+            "fork" if "fork" in methods else None))
+    raise ValueError(f"unknown executor {kind!r}, expected one of {KINDS}")
+
+
+def _picklable(func: Callable) -> bool:
+    try:
+        pickle.dumps(func)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _executor_name(kind: str) -> str:
+    return "free-threaded" if kind == "threads" and FREE_THREADED else kind
+
+
+def measure(job, kind: str, workers: int, chunks: Optional[Sequence[Any]] = None,
+            scale: float = 1.0, repeat: int = 3) -> float:
+    """Best of ``repeat`` wall-clock seconds to run every chunk of ``job``."""
+    job = _job(job)
+    chunks = job.make_chunks(scale) if chunks is None else chunks
+    executor = _executor(kind, workers)
+    try:
+        if executor is not None:
+            # Start every worker (and, for processes, import the job) first.
+            list(executor.map(job.func, chunks[:1] * workers))
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if executor is None:
+                list(map(job.func, chunks))
+            else:
+                list(executor.map(job.func, chunks))
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def default_workers() -> List[int]:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= max(cpus, 2):
+        counts.append(counts[-1] * 2)
+    if cpus not in counts:
+        counts.append(cpus)
+    return counts
+
+
+def scaling(job, kinds: Sequence[str] = KINDS, workers: Optional[Sequence[int]] = None,
+            scale: float = 1.0, repeat: int = 3) -> List[Point]:
+    """The scaling curve of ``job``: one point per executor and worker count."""
+    job = _job(job)
+    if not _picklable(job.func):
+        kinds = [kind for kind in kinds if kind != "processes"]
+    chunks = job.make_chunks(scale)
+    serial = measure(job, "serial", 1, chunks, repeat=repeat)
+    points = [Point(job.name, "serial", 1, serial, 1.0)] if "serial" in kinds else []
+    for kind in kinds:
+        if kind == "serial":
+            continue
+        for count in workers or default_workers():
+            seconds = measure(job, kind, count, chunks, repeat=repeat)
+            points.append(Point(job.name, _executor_name(kind), count, seconds, serial / seconds))
+    return points
+
+
+def default_candidates(job) -> List[Tuple[str, int]]:
+    """The ``(executor, workers)`` pairs ``calibrate`` times by default."""
+    cpus = os.cpu_count() or 1
+    candidates = [("serial", 1), ("threads", cpus), ("processes", cpus),
+                  ("threads", 4 * cpus)]   # oversubscribed, for blocking work
+    if not _picklable(_job(job).func):
+        candidates.remove(("processes", cpus))
+    return candidates
+
+
+def calibrate(job, scale: float = 0.25,
+              candidates: Optional[Sequence[Tuple[str, int]]] = None) -> Tuple[str, int]:
+    """Time ``job`` under each candidate and remember the fastest for ``pick``/``run``."""
+    job = _job(job)
+    candidates = default_candidates(job) if candidates is None else list(candidates)
+    if not candidates:
+        raise ValueError("no candidates to calibrate with")
+    chunks = job.make_chunks(scale)
+    choice = min(candidates, key=lambda c: measure(job, c[0], c[1], chunks, repeat=2))
+    _choices[job.name] = choice
+    return choice
+
+
+def pick(job) -> Tuple[str, int]:
+    """The fastest ``(executor, workers)`` for ``job``, as ``calibrate`` found it."""
+    job = _job(job)
+    if job.name not in _choices:
+        raise LookupError(f"job {job.name!r} is not calibrated; call calibrate({job.name!r}) first")
+    return _choices[job.name]
+
+
+def run(job, chunks: Sequence[Any]) -> List[Any]:
+    """Run ``job`` over ``chunks`` on a pool of the kind ``pick`` chose, kept for later calls."""
+    job = _job(job)
+    choice = pick(job)
+    if choice[0] == "serial":
+        return list(map(job.func, chunks))
+    idle = None
+    with _pools_lock:
+        kept = _pools.get(job.name)
+        if kept is None or kept[0] != choice:   # first call, or calibrated again
+            idle = _retire(job.name)
+            kept = _pools[job.name] = [choice, _executor(*choice), 0]
+        kept[2] += 1
+    if idle is not None:
+        idle.shutdown(wait=False)
+    try:
+        return list(kept[1].map(job.func, chunks))
+    finally:
+        with _pools_lock:
+            kept[2] -= 1
+            retired = not kept[2] and _pools.get(job.name) is not kept
+        if retired:
+            kept[1].shutdown()
+
+
+@atexit.register
+def shutdown() -> None:
+    """Shut down the pools ``run`` keeps."""
+    for name in list(_pools):
+        _close_pool(name)
+
+
+def _external(python: str, jobs: List[str], workers: Optional[Sequence[int]],
+              scale: float, repeat: int) -> List[Point]:
+    """Thread scaling measured by another interpreter running this module."""
+    command = [python, "-m", "pycourse.executors", *jobs, "--executors", "threads",
+               "--scale", str(scale), "--repeat", str(repeat), "--json", "-"]
+    if workers:
+        command += ["--workers", ",".join(map(str, workers))]
+    output = subprocess.run(command, cwd=COURSE_DIR, capture_output=True, text=True, check=True)
+    document = json.loads(output.stdout)
+    label = "free-threaded" if document["free_threaded"] else "threads"
+    return [Point(p["job"], f"{label} ({os.path.basename(python)})", p["workers"],
+                  p["seconds"], p["speedup"]) for p in document["points"]]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scaling curves of CPU-bound jobs per executor.")
+    parser.add_argument("jobs", nargs="*", help=f"jobs to run (default: all of {sorted(JOBS)})")
+    parser.add_argument("--executors", default=",".join(KINDS),
+                        help="comma-separated executors (default: %(default)s)")
+    parser.add_argument("--workers", help="comma-separated worker counts (default: 1, 2, 4, ... CPUs)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every job's work")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--python", action="append", default=[],
+                        help="another interpreter (e.g. a free-threaded build) to measure threads with")
+    parser.add_argument("--json", metavar="FILE", help="write the points as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    jobs = args.jobs or list(JOBS)
+    for name in jobs:
+        _job(name)
+    kinds = [k for k in args.executors.split(",") if k]
+    for kind in kinds:
+        if kind not in KINDS:
+            parser.error(f"unknown executor {kind!r}, expected one of {KINDS}")
+    workers = [int(w) for w in args.workers.split(",")] if args.workers else None
+
+    points: List[Point] = []
+    for name in jobs:
+        points += scaling(name, kinds, workers, args.scale, args.repeat)
+        for python in args.python:
+            points += _external(python, [name], workers, args.scale, args.repeat)
+
+    if args.json:
+        document = {"python": sys.version.split()[0], "free_threaded": FREE_THREADED,
+                    "cpus": os.cpu_count(), "points": [p._asdict() for p in points]}
+        if args.json == "-":
+            json.dump(document, sys.stdout, indent=2)
+            return
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+    print(f"Python {sys.version.split()[0]}{' (free-threaded)' if FREE_THREADED else ''}, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'job':<8}{'executor':<28}{'workers':>8}{'seconds':>10}{'speedup':>9}{'efficiency':>12}")
+    for p in points:
+        print(f"{p.job:<8}{p.executor:<28}{p.workers:>8}{p.seconds:>10.3f}{p.speedup:>8.2f}x"
+              f"{p.speedup / p.workers:>11.0%}")
+    best = {}
+    for p in points:
+        if p.job not in best or p.seconds < best[p.job].seconds:
+            best[p.job] = p
+    for name, p in best.items():
+        print(f"best for {name}: {p.executor} x{p.workers}")
+
+
+if __name__ == "__main__":
+    main()
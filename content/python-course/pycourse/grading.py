@@ -0,0 +1,534 @@
+"""Grade learner submissions against the course's reference functions.
+
+A submission is Python source that defines the exercise's function, e.g.
+``def add_numbers(a, b, c=0): ...``. Each test case calls it and the
+reference function from ``pycourse.core`` with the same arguments; the
+return value (or the type of the exception raised) and anything printed
+must match.
+
+    with GradingPool(workers=4) as pool:
+        results = pool.grade([Submission("s1", "add_numbers", source), ...])
+    results[0].passed, results[0].total, results[0].failures
+
+    python -m pycourse.grading submissions.jsonl --workers 4
+
+Submissions run in worker processes forked once, after the reference
+modules are imported, and are sent in batches. Every test case gets a CPU
+time cap (a ``SIGPROF`` interval timer) and every worker an address-space
+cap (``RLIMIT_AS``), a CPU backstop for code that swallows the timer
+(``RLIMIT_CPU``) and no file writes (``RLIMIT_FSIZE``). Code that blocks
+without using CPU (``time.sleep``, waiting on a lock) is caught by a
+wall-clock deadline per submission: its worker is killed. Workers send
+each result as soon as it is ready, so a worker that dies or is killed
+costs only the submission it was grading; the rest of its batch goes to
+the next free worker.
+
+Return values must match in type as well as value: ``True`` is not an
+answer for ``1``, nor ``8.0`` for ``8``.
+
+This isolates runaway submissions; it is not a security boundary against
+hostile code.
+"""
+
+import io
+import json
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from contextlib import redirect_stdout
+from importlib import import_module
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: only the per-test CPU timer applies, where available
+    resource = None
+
+DEFAULT_BATCH_SIZE = 32
+_HAS_CPU_TIMER = hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+# Set in worker processes by _apply_limits(); grading in-process runs uncapped.
+_cpu_timer = False
+_cpu_backstop = False
+
+
+# ============================================
+# Exercises
+# ============================================
+
+def call(*args, **kwargs) -> Tuple[tuple, Dict[str, Any]]:
+    """One test case: the arguments an exercise function is called with."""
+    return args, kwargs
+
+
+class Exercise(NamedTuple):
+    name: str                  # the name a submission must define
+    reference: str             # "module:function", or source that binds ``name``
+    cases: Tuple[Tuple[tuple, Dict[str, Any]], ...] = ()  # none: compare the value itself
+
+    @property
+    def total(self) -> int:
+        return len(self.cases) or 1
+
+
+EXERCISES: Dict[str, Exercise] = {exercise.name: exercise for exercise in (
+    Exercise("greet", "pycourse.core.functions:greet", (
+        call("Alice"), call(""), call("Ünïcode"),
+    )),
+    Exercise("greet_person", "pycourse.core.functions:greet_person", (
+        call(), call("John"), call(name="Bob"),
+    )),
+    Exercise("add_numbers", "pycourse.core.functions:add_numbers", (
+        call(5, 3), call(5, 3, 2), call(-1, 1), call(0, 0, 0), call(2.5, 0.5),
+        call(10 ** 12, 1, c=-1), call("a", "b", "c"),
+    )),
+    Exercise("sum_all", "pycourse.core.functions:sum_all", (
+        call(), call(1, 2, 3, 4, 5), call(-5, 5), call(*range(100)), call(0.5, 0.25),
+    )),
+    Exercise("print_info", "pycourse.core.functions:print_info", (
+        call(name="Alice", age=25, city="NYC"), call(),
+    )),
+    Exercise("square", "pycourse.core.functions:square", (
+        call(0), call(5), call(-3), call(1.5),
+    )),
+    Exercise("validate_age", "pycourse.core.exceptions:validate_age", (
+        call(25), call(0), call(-1), call(130), call(-100),
+    )),
+    Exercise("is_valid_email", "pycourse.core.regex:is_valid_email", (
+        call("test@example.com"), call("invalid-email"), call("a.b+c@d-e.org"),
+        call("bad@"), call("x@y.z"), call("two@@at.com"), call(""),
+    )),
+    # Value exercises: the submission binds the name at module level.
+    Exercise("squares", "squares = [x**2 for x in range(10)]"),
+    Exercise("squares_dict", "squares_dict = {x: x**2 for x in range(5)}"),
+    Exercise("map_squares", "numbers = [1, 2, 3, 4, 5]\n"
+                            "map_squares = list(map(lambda x: x**2, numbers))"),
+    Exercise("filter_evens", "numbers = [1, 2, 3, 4, 5]\n"
+                             "filter_evens = list(filter(lambda x: x % 2 == 0, numbers))"),
+    Exercise("reduce_sum", "from functools import reduce\nnumbers = [1, 2, 3, 4, 5]\n"
+                           "reduce_sum = reduce(lambda a, b: a + b, numbers)"),
+)}
+
+
+def reference_function(exercise: Exercise) -> Callable:
+    module, _, attribute = exercise.reference.partition(":")
+    return getattr(import_module(module), attribute)
+
+
+def reference_outcome(exercise: Exercise, case: int, cpu_seconds: float = 1.0) -> tuple:
+    """Run the reference for test ``case`` of ``exercise``; see ``_run_limited``."""
+    if not exercise.cases:
+        namespace, error = _execute(exercise.reference, f"<reference {exercise.name}>", cpu_seconds)
+        if error is not None:
+            raise RuntimeError(f"reference for {exercise.name} failed: {error}")
+        return ("return", namespace[exercise.name], "")
+    args, kwargs = exercise.cases[case]
+    return _run_limited(reference_function(exercise), args, kwargs, cpu_seconds)
+
+
+# ============================================
+# Submissions and results
+# ============================================
+
+class Submission(NamedTuple):
+    id: str
+    exercise: str
+    source: str
+
+
+class Limits(NamedTuple):
+    cpu_seconds: float = 1.0   # CPU time per test case (and for the module body)
+    memory_mb: int = 256       # address space a worker may add on top of its start-up size
+    wall_seconds: float = 30.0  # wall-clock time per submission, all its tests together
+
+
+class GradeResult(NamedTuple):
+    submission_id: str
+    exercise: str
+    passed: int
+    total: int
+    failures: Tuple[str, ...] = ()
+    error: Optional[str] = None  # set when no test could run
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.passed == self.total
+
+
+# ============================================
+# Running one test case (inside a worker)
+# ============================================
+
+class _CpuLimitExceeded(BaseException):
+    # BaseException, so a submission's ``except Exception`` does not swallow it.
+    pass
+
+
+def _on_cpu_limit(signum, frame):
+    raise _CpuLimitExceeded()
+
+
+def _run_limited(func: Callable, args: tuple, kwargs: Dict[str, Any], cpu_seconds: float) -> tuple:
+    """Call ``func`` under the CPU cap; return ``(kind, value, printed)``.
+
+    ``kind`` is ``"return"`` (value is the result), ``"raise"`` (value is the
+    exception type name), ``"cpu-limit"`` or ``"memory-limit"``.
+    """
+    printed = io.StringIO()
+    try:
+        try:
+            if _cpu_backstop:
+                _arm_cpu_backstop(cpu_seconds)
+            if _cpu_timer:
+                signal.setitimer(signal.ITIMER_PROF, cpu_seconds)
+            with redirect_stdout(printed):
+                outcome = ("return", func(*args, **kwargs))
+        finally:
+            if _cpu_timer:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+    except _CpuLimitExceeded:
+        outcome = ("cpu-limit", None)
+    except MemoryError:
+        outcome = ("memory-limit", None)
+    except Exception as e:
+        outcome = ("raise", type(e).__name__)
+    return outcome + (printed.getvalue(),)
+
+
+def _describe(outcome: tuple) -> str:
+    kind, value, printed = outcome
+    if kind == "return":
+        text = f"{_short(value)}"
+    elif kind == "raise":
+        text = f"raised {value}"
+    else:
+        text = f"hit the {kind.replace('-', ' ')}"
+    if printed:
+        text += f" and printed {_short(printed)}"
+    return text
+
+
+def _short(value: Any, width: int = 60) -> str:
+    try:
+        text = repr(value)
+    except Exception as e:
+        text = f"<unprintable {type(value).__name__}: {type(e).__name__}>"
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def _signature(args: tuple, kwargs: Dict[str, Any]) -> str:
+    parts = [_short(a, 20) for a in args] + [f"{k}={_short(v, 20)}" for k, v in kwargs.items()]
+    if len(parts) > 6:
+        parts = parts[:5] + [f"... {len(parts) - 5} more"]
+    return ", ".join(parts)
+
+
+def _same(expected: tuple, got: tuple) -> bool:
+    try:
+        return _same_value(expected, got)
+    except Exception:  # a returned object whose __eq__ raises
+        return False
+
+
+def _same_value(expected: Any, got: Any) -> bool:
+    # == alone would accept True for 1 and 8.0 for 8.
+    if type(expected) is not type(got):
+        return False
+    if type(expected) in (list, tuple):
+        return len(expected) == len(got) and all(map(_same_value, expected, got))
+    if type(expected) is dict:
+        return (expected.keys() == got.keys()
+                and all(_same_value(value, got[key]) for key, value in expected.items()))
+    return bool(expected == got)
+
+
+def _execute(source: str, filename: str, cpu_seconds: float) -> Tuple[Optional[dict], Optional[str]]:
+    """Run module source; return ``(namespace, None)`` or ``(None, error)``."""
+    namespace = {"__name__": "submission", "__builtins__": __builtins__}
+    try:
+        code = compile(source, filename, "exec")
+    except (SyntaxError, ValueError) as e:
+        return None, f"{type(e).__name__}: {e}"
+    kind, value, _ = _run_limited(exec, (code, namespace), {}, cpu_seconds)
+    if kind != "return":
+        return None, f"module body {_describe((kind, value, ''))}"
+    return namespace, None
+
+
+def grade_submission(submission: Submission, limits: Limits = Limits(),
+                     answers=None) -> GradeResult:
+    """Grade one submission in this process (workers call this per submission).
+
+    ``answers`` is a ``pycourse.answers.AnswerIndex``; expected outcomes it
+    holds are looked up instead of running the reference again.
+    """
+    exercise = EXERCISES.get(submission.exercise)
+    if exercise is None:
+        return GradeResult(submission.id, submission.exercise, 0, 0,
+                           error=f"unknown exercise {submission.exercise!r}")
+
+    def failed(error: str) -> GradeResult:
+        return GradeResult(submission.id, exercise.name, 0, exercise.total, error=error)
+
+    namespace, error = _execute(submission.source, f"<submission {submission.id}>", limits.cpu_seconds)
+    if error is not None:
+        return failed(error)
+    if exercise.name not in namespace:
+        return failed(f"submission does not define {exercise.name}")
+    submitted = namespace[exercise.name]
+    if exercise.cases and not callable(submitted):
+        return failed(f"{exercise.name} is not a function")
+
+    passed, failures = 0, []
+    for case in range(exercise.total):
+        expected = answers.expected(exercise.name, case) if answers is not None else None
+        if expected is None:
+            expected = reference_outcome(exercise, case, limits.cpu_seconds)
+        if exercise.cases:
+            args, kwargs = exercise.cases[case]
+            got = _run_limited(submitted, args, kwargs, limits.cpu_seconds)
+            label = f"{exercise.name}({_signature(args, kwargs)})"
+        else:
+            got, label = ("return", submitted, ""), exercise.name
+        if _same(expected, got):
+            passed += 1
+        else:
+            failures.append(f"{label}: expected {_describe(expected)}, got {_describe(got)}")
+    return GradeResult(submission.id, exercise.name, passed, exercise.total, tuple(failures))
+
+
+# ============================================
+# Worker processes
+# ============================================
+
+def _address_space() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _apply_limits(limits: Limits) -> None:
+    global _cpu_timer, _cpu_backstop
+    if _HAS_CPU_TIMER:
+        signal.signal(signal.SIGPROF, _on_cpu_limit)
+        _cpu_timer = True
+    if resource is None:
+        return
+    size = _address_space()
+    if size is not None and hasattr(resource, "RLIMIT_AS"):
+        _lower_soft_limit(resource.RLIMIT_AS, size + limits.memory_mb * 1024 * 1024)
+    _cpu_backstop = hasattr(resource, "RLIMIT_CPU")
+    if hasattr(resource, "RLIMIT_FSIZE"):
+        # Writing past the limit raises SIGXFSZ, which would kill the worker;
+        # ignored, the write fails with an OSError inside the submission.
+        signal.signal(signal.SIGXFSZ, signal.SIG_IGN)
+        _lower_soft_limit(resource.RLIMIT_FSIZE, 0)
+
+
+def _lower_soft_limit(which: int, value: int) -> None:
+    soft, hard = resource.getrlimit(which)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    if soft == resource.RLIM_INFINITY or value < soft:
+        resource.setrlimit(which, (value, hard))
+
+
+def _arm_cpu_backstop(cpu_seconds: float) -> None:
+    # The interval timer fires once; a submission that catches it and keeps
+    # spinning runs into RLIMIT_CPU instead, which kills the worker with
+    # SIGXCPU. The limit counts the process's whole lifetime, so it is moved
+    # forward before every call. Only the soft limit moves: a lowered hard
+    # limit could never be raised again.
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard == resource.RLIM_INFINITY or soft <= hard:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, limits: Limits, answers) -> None:
+    _apply_limits(limits)
+    while True:
+        try:
+            batch = conn.recv()
+        except EOFError:
+            return
+        if batch is None:
+            return
+        for submission in batch:
+            conn.send(grade_submission(submission, limits, answers))
+
+
+def _preload_references() -> None:
+    # Imported before forking, so every worker starts with them loaded.
+    for exercise in EXERCISES.values():
+        if exercise.cases:
+            reference_function(exercise)
+
+
+class _Worker:
+    def __init__(self, context, limits: Limits, answers):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, limits, answers),
+                                       daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.batch: Optional[List[int]] = None  # indices into the submissions being graded
+        self.deadline = 0.0  # time.monotonic() by which batch[0] must be graded
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class GradingPool:
+    """A fixed set of pre-forked grading workers fed with batches of submissions.
+
+    Expected outcomes come from the reference-answer index
+    (``pycourse.answers``), built on first use for the current course
+    version; ``use_answers=False`` runs the references for every test instead.
+    """
+
+    def __init__(self, workers: Optional[int] = None, limits: Limits = Limits(),
+                 batch_size: int = DEFAULT_BATCH_SIZE, use_answers: bool = True):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.limits = limits
+        self.batch_size = batch_size
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        _preload_references()
+        if use_answers:
+            from .answers import load_index
+
+            self.answers = load_index()
+        else:
+            self.answers = None
+        self._workers = [_Worker(self._context, limits, self.answers)
+                         for _ in range(workers or os.cpu_count() or 1)]
+        self.crashes = 0    # workers that died
+        self.timeouts = 0   # workers killed at the wall-clock deadline
+
+    def grade(self, submissions: Iterable[Submission]) -> List[GradeResult]:
+        """Grade every submission; results come back in the same order."""
+        submissions = list(submissions)
+        results: List[Optional[GradeResult]] = [None] * len(submissions)
+        pending = [list(range(i, min(i + self.batch_size, len(submissions))))
+                   for i in range(0, len(submissions), self.batch_size)]
+        pending.reverse()  # pop() from the end keeps submission order
+
+        def failed(i: int, error: str) -> GradeResult:
+            exercise = EXERCISES.get(submissions[i].exercise)
+            return GradeResult(submissions[i].id, submissions[i].exercise, 0,
+                               exercise.total if exercise else 0, error=error)
+
+        def abandon(worker: _Worker, kill: bool = False) -> int:
+            # Replace the worker, queue the rest of its batch again and
+            # return the submission it was grading.
+            batch, worker.batch = worker.batch, None
+            self._replace(worker, kill)
+            if len(batch) > 1:
+                pending.append(batch[1:])
+            return batch[0]
+
+        while pending or any(w.batch is not None for w in self._workers):
+            for worker in self._workers:
+                if worker.batch is None and pending:
+                    worker.batch = pending.pop()
+                    worker.deadline = time.monotonic() + self.limits.wall_seconds
+                    worker.conn.send([submissions[i] for i in worker.batch])
+            busy = {w.conn: w for w in self._workers if w.batch is not None}
+            timeout = max(0.0, min(w.deadline for w in busy.values()) - time.monotonic())
+            for conn in wait(list(busy), timeout):
+                worker = busy[conn]
+                try:
+                    result = conn.recv()
+                except (EOFError, OSError):
+                    self.crashes += 1
+                    i = abandon(worker)
+                    results[i] = failed(i, f"worker died (exit code {worker.process.exitcode})")
+                    continue
+                results[worker.batch.pop(0)] = result
+                worker.deadline = time.monotonic() + self.limits.wall_seconds
+                if not worker.batch:
+                    worker.batch = None
+            now = time.monotonic()
+            for worker in busy.values():
+                if worker.batch is not None and worker.deadline <= now:
+                    self.timeouts += 1
+                    i = abandon(worker, kill=True)
+                    results[i] = failed(i, f"hit the time limit ({self.limits.wall_seconds:g}s wall clock)")
+        return results
+
+    def _replace(self, worker: _Worker, kill: bool = False) -> None:
+        if kill:
+            worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+        self._workers[self._workers.index(worker)] = _Worker(self._context, self.limits, self.answers)
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def __enter__(self) -> "GradingPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+# ============================================
+# Command line
+# ============================================
+
+def load_submissions(path: str) -> List[Submission]:
+    """Read JSON lines of ``{"id": ..., "exercise": ..., "source": ...}``."""
+    submissions = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                record = json.loads(line)
+                submissions.append(Submission(str(record.get("id", number)),
+                                              record["exercise"], record["source"]))
+    return submissions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Grade submissions against the course exercises.")
+    parser.add_argument("submissions", help="JSON lines file of submissions")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--cpu-seconds", type=float, default=Limits().cpu_seconds)
+    parser.add_argument("--memory-mb", type=int, default=Limits().memory_mb)
+    parser.add_argument("--wall-seconds", type=float, default=Limits().wall_seconds)
+    parser.add_argument("--no-answers", action="store_true",
+                        help="run the references for every test instead of using pycourse.answers")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    limits = Limits(args.cpu_seconds, args.memory_mb, args.wall_seconds)
+    with GradingPool(args.workers, limits, args.batch_size, not args.no_answers) as pool:
+        results = pool.grade(load_submissions(args.submissions))
+    for result in results:
+        record = result._asdict()
+        record["failures"] = list(result.failures)
+        print(json.dumps(record, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""A ``list`` with O(1) membership tests and ``index()`` for read-heavy use.
+
+Chapter 5's ``2 in numbers`` scans the whole list. An ``IndexedList`` is a
+``list`` (same methods, same order, same ``==``) that also keeps a hash
+index from each value to its first position:
+
+    numbers = IndexedList([1, 2, 3, 4, 5])
+    2 in numbers                 # dict lookup once the index is built
+    numbers.index(4)             # 3, also a dict lookup
+    numbers.append(6)            # keeps the index up to date
+    numbers.insert(0, 0)         # shifts positions: drops the index
+
+The index is built lazily: after a mutation drops it, the next few lookups
+scan like a plain list, and only once ``BUILD_AFTER`` lookups happened
+without a mutation in between is it rebuilt. A workload that alternates
+one write with one read therefore costs what a list costs, instead of
+rebuilding the index every time (``python -m benchmarks.indexed``).
+
+``append``, ``extend``, ``+=`` and ``pop()`` from the end update the index
+in place; every other mutation (``insert``, ``remove``, ``pop(i)``,
+``del``, item and slice assignment, ``sort``, ``reverse``, ``clear``,
+``*=``) drops it. Values must be hashable for the index to be used; a list
+holding unhashable values simply keeps scanning. Pickling and copying
+keep the values and leave the index to be rebuilt
+(``python -m doctest pycourse/indexed.py`` checks the round trip).
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+BUILD_AFTER = 8   # lookups since the last index-dropping mutation before rebuilding
+
+
+class IndexedList(list):
+    """``list`` plus a lazily built ``value -> first position`` index."""
+
+    __slots__ = ("_index", "_lookups")
+
+    def __init__(self, iterable: Iterable[Any] = ()):
+        super().__init__(iterable)
+        self._index: Optional[Dict[Any, int]] = None
+        self._lookups = 0
+
+    # ----- lookups -----
+
+    def _current_index(self) -> Optional[Dict[Any, int]]:
+        if self._index is None:
+            self._lookups += 1
+            if self._lookups >= BUILD_AFTER:
+                self._build()
+        return self._index
+
+    def _build(self) -> None:
+        try:
+            # Built back to front, so each value ends up with its first position.
+            self._index = dict(zip(reversed(self), range(len(self) - 1, -1, -1)))
+        except TypeError:   # an unhashable value: stay a plain list
+            self._lookups = -(1 << 62)
+
+    def __contains__(self, value) -> bool:
+        index = self._current_index()
+        if index is not None:
+            try:
+                return value in index
+            except TypeError:
+                pass
+        return list.__contains__(self, value)
+
+    def index(self, value, start: int = 0, stop: int = 2**63 - 1) -> int:
+        index = self._current_index()
+        if index is not None:
+            try:
+                position = index.get(value)
+            except TypeError:
+                position = None
+            else:
+                if position is None:
+                    raise ValueError(f"{value!r} is not in list")
+                first, last, _ = slice(start, stop).indices(len(self))
+                if first <= position < last:
+                    return position
+        return list.index(self, value, start, stop)
+
+    def reindex(self) -> None:
+        """Build the index now instead of on a later lookup."""
+        self._lookups = 0
+        self._build()
+
+    @property
+    def indexed(self) -> bool:
+        return self._index is not None
+
+    # ----- mutations that keep the index -----
+
+    def append(self, value) -> None:
+        if self._index is not None:
+            try:
+                self._index.setdefault(value, len(self))
+            except TypeError:
+                self._drop()
+        list.append(self, value)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        if self._index is None:
+            list.extend(self, iterable)
+            return
+        start = len(self)
+        list.extend(self, iterable)
+        try:
+            setdefault = self._index.setdefault
+            for position in range(start, len(self)):
+                setdefault(self[position], position)
+        except TypeError:
+            self._drop()
+
+    def __iadd__(self, iterable: Iterable[Any]) -> "IndexedList":
+        self.extend(iterable)
+        return self
+
+    def pop(self, position: int = -1) -> Any:
+        if position not in (-1, len(self) - 1) or self._index is None:
+            self._drop()
+            return list.pop(self, position)
+        value = list.pop(self, position)
+        # The index holds the *first* position: it only changes if that was
+        # the popped one.
+        if self._index.get(value) == len(self):
+            del self._index[value]
+        return value
+
+    # ----- mutations that drop it -----
+
+    def _drop(self) -> None:
+        self._index = None
+        self._lookups = 0
+
+    def insert(self, position: int, value) -> None:
+        self._drop()
+        list.insert(self, position, value)
+
+    def remove(self, value) -> None:
+        self._drop()
+        list.remove(self, value)
+
+    def clear(self) -> None:
+        self._drop()
+        list.clear(self)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        self._drop()
+        list.sort(self, key=key, reverse=reverse)
+
+    def reverse(self) -> None:
+        self._drop()
+        list.reverse(self)
+
+    def __setitem__(self, position, value) -> None:
+        self._drop()
+        list.__setitem__(self, position, value)
+
+    def __delitem__(self, position) -> None:
+        self._drop()
+        list.__delitem__(self, position)
+
+    def __imul__(self, times: int) -> "IndexedList":
+        self._drop()
+        list.__imul__(self, times)
+        return self
+
+    def __repr__(self) -> str:
+        return f"IndexedList({list.__repr__(self)})"
+
+    def __reduce_ex__(self, protocol):
+        """Pickle and copy as the values alone; the index is rebuilt on demand.
+
+        >>> import copy, pickle
+        >>> numbers = IndexedList([3, 1, 4])
+        >>> numbers.reindex()
+        >>> restored = pickle.loads(pickle.dumps(numbers))
+        >>> restored, restored.index(4), restored.indexed
+        (IndexedList([3, 1, 4]), 2, False)
+        >>> copy.deepcopy(numbers) == numbers
+        True
+        """
+        return type(self), (list(self),)
@@ -0,0 +1,77 @@
+"""Import-on-first-use for modules only some chapters need.
+
+    data_classes = lazy_import("pycourse.core.data_classes")
+
+    def chapter_18():
+        person = data_classes.Person("Alice", 25, "NYC")   # imported here
+
+Running chapter 1 alone then never pays for ``dataclasses``, ``asyncio``
+or ``threading``. ``benchmarks/startup.py`` checks that this holds.
+
+This module is on every script's start-up path, so it does the work of
+``importlib.util.LazyLoader`` with the import system's own objects:
+``importlib.util`` alone pulls in ``contextlib``, ``functools`` and
+``collections``, which cost more than the chapters' modules save.
+"""
+
+import sys
+
+_ModuleType = type(sys)
+
+
+class _LazyModule(_ModuleType):
+    """A module whose code runs on the first attribute access."""
+
+    def __getattribute__(self, attr):
+        # Become an ordinary module first, so the loader and every later
+        # lookup see plain attribute access.
+        self.__class__ = _ModuleType
+        self.__spec__.loader.exec_module(self)
+        return getattr(self, attr)
+
+
+def _find_spec(name: str):
+    parent = name.rpartition(".")[0]
+    path = None
+    if parent:
+        __import__(parent)
+        path = sys.modules[parent].__path__
+    for finder in sys.meta_path:
+        find_spec = getattr(finder, "find_spec", None)
+        spec = find_spec(name, path) if find_spec is not None else None
+        if spec is not None:
+            return spec
+    return None
+
+
+def _module_from_spec(spec):
+    module = spec.loader.create_module(spec) or _ModuleType(spec.name)
+    module.__spec__ = spec
+    module.__loader__ = spec.loader
+    module.__package__ = spec.parent
+    if spec.submodule_search_locations is not None:
+        module.__path__ = spec.submodule_search_locations
+    if spec.has_location:
+        module.__file__ = spec.origin
+        module.__cached__ = spec.cached
+    return module
+
+
+def lazy_import(name: str):
+    """Return module ``name``, deferring its execution to first attribute access.
+
+    A module that is already imported is returned as is. A missing module
+    raises ``ModuleNotFoundError`` immediately, not on first use.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = _find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    module = _module_from_spec(spec)
+    module.__class__ = _LazyModule
+    sys.modules[name] = module
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
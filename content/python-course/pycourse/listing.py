@@ -0,0 +1,177 @@
+"""Code listings rendered from the real definitions in ``pycourse.core``.
+
+Instead of repeating a definition as ``print("   def count_up_to(n):")``
+lines, a chapter prints the source that actually runs:
+
+    print(listing(generators, "count_up_to"))
+    print(listing(decorators, "my_decorator", "say_hello"))
+
+Names are top-level functions, classes or assignments (``square =
+lambda ...``), or ``Class.method``. Decorators are included. The module
+is read from its source file and never executed, so listing
+``pycourse.core.async_tasks`` does not import ``asyncio``.
+
+Parsed definitions and rendered snippets are cached next to the bytecode
+in ``pycourse/__pycache__/listings.<cache_tag>.marshal``: a module is
+re-parsed only when its file changes, and a snippet is re-rendered only
+when the hash of its source changes.
+"""
+
+import os
+import sys
+
+from . import render as _render
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__",
+                          f"listings.{sys.implementation.cache_tag}.marshal")
+DEFAULT_INDENT = "   "
+
+# This module is on the scripts' start-up path (see benchmarks/startup.py):
+# the cache uses the built-in marshal format, and hashlib, ast and textwrap
+# are only imported on a cache miss.
+_cache = None
+_dirty = False
+
+
+def _load_cache() -> dict:
+    global _cache
+    if _cache is None:
+        import atexit
+        import marshal
+
+        try:
+            with open(CACHE_FILE, "rb") as f:
+                _cache = marshal.load(f)
+        except (OSError, ValueError, EOFError, TypeError):
+            _cache = {}
+        _cache.setdefault("modules", {})
+        _cache.setdefault("segments", {})
+        _cache.setdefault("rendered", {})
+        atexit.register(save_cache)
+    return _cache
+
+
+def save_cache() -> None:
+    """Write the cache back if it changed, dropping entries no module uses."""
+    global _dirty
+    if not _dirty:
+        return
+    import marshal
+
+    cache = _load_cache()
+    live = {sha for module in cache["modules"].values() for sha in module["definitions"].values()}
+    cache["segments"] = {sha: text for sha, text in cache["segments"].items() if sha in live}
+    cache["rendered"] = {key: text for key, text in cache["rendered"].items()
+                         if key.split(":", 1)[0] in live}
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp = CACHE_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump(cache, f)
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass  # read-only checkout: the cache is only an optimisation
+    _dirty = False
+
+
+def _module_name(module) -> str:
+    # type() and object.__getattribute__ read a module bound with
+    # pycourse.lazy.lazy_import without loading it; isinstance() would, as it
+    # looks up __class__ on the module.
+    return module if type(module) is str else object.__getattribute__(module, "__name__")
+
+
+def _module_path(module) -> str:
+    name = _module_name(module)
+    loaded = sys.modules.get(name)
+    spec = object.__getattribute__(loaded, "__spec__") if loaded is not None else None
+    if spec is None:
+        import importlib.util
+
+        spec = importlib.util.find_spec(name)
+    if spec is None or not spec.origin:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return spec.origin
+
+
+def _extract(source: str) -> dict:
+    """Map each top-level name (and ``Class.method``) to its source text."""
+    import ast
+    import textwrap
+
+    lines = source.splitlines()
+    found = {}
+
+    def segment(node):
+        first = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+        return textwrap.dedent("\n".join(lines[first - 1:node.end_lineno]))
+
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            found[node.name] = segment(node)
+            if isinstance(node, ast.ClassDef):
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        found[f"{node.name}.{item.name}"] = segment(item)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = segment(node)
+    return found
+
+
+def definitions(module) -> dict:
+    """Return ``{name: source_sha256}`` for a module, re-parsing only on change."""
+    global _dirty
+    cache = _load_cache()
+    path = _module_path(module)
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    entry = cache["modules"].get(path)
+    if entry is None or entry["stamp"] != stamp:
+        import hashlib
+
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        entry = {"stamp": stamp, "definitions": {}}
+        for name, text in _extract(source).items():
+            sha = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            entry["definitions"][name] = sha
+            cache["segments"][sha] = text
+        cache["modules"][path] = entry
+        _dirty = True
+    return entry["definitions"]
+
+
+def source(module, name: str) -> str:
+    """The unindented source of one definition, as ``listing`` shows it."""
+    known = definitions(module)
+    if name not in known:
+        raise LookupError(f"{_module_path(module)} has no top-level definition {name!r}")
+    return _load_cache()["segments"][known[name]]
+
+
+def listing(module, *names: str, indent: str = DEFAULT_INDENT) -> str:
+    """Render the named definitions of ``module`` as an indented listing.
+
+    Several names are separated by a blank line.
+    """
+    global _dirty
+    cache = _load_cache()
+    known = definitions(module)
+    parts = []
+    for name in names:
+        if name not in known:
+            raise LookupError(f"{_module_path(module)} has no top-level definition {name!r}")
+        key = f"{known[name]}:{indent}"
+        if key not in cache["rendered"]:
+            import textwrap
+
+            cache["rendered"][key] = textwrap.indent(cache["segments"][known[name]], indent)
+            _dirty = True
+        parts.append(cache["rendered"][key])
+    text = "\n\n".join(parts)
+    if _render.records is not None:   # --format ndjson: report it as a listing record
+        code = "\n\n".join(cache["segments"][known[name]] for name in names)
+        _render.records.expect_listing(_module_name(module), names, text, code)
+    return text
@@ -0,0 +1,295 @@
+"""Event-loop instrumentation for the chapter 25 ``asyncio`` runners.
+
+``asyncio.run(run_all())`` either finishes or it doesn't; when a
+``fetch_data``-style fan-out stalls there is nothing to look at. A
+``LoopMonitor`` records, while it is attached to a loop:
+
+* loop lag: how late a ticker that sleeps every ``interval`` wakes up
+  (a blocked loop shows up as lag);
+* every task created: name, coroutine, lifetime and how it ended;
+* callbacks (task steps included) that ran longer than ``slow_callback``;
+* how many tasks were pending, sampled with the lag.
+
+    monitor = LoopMonitor(interval=0.01, slow_callback=0.05)
+    monitor.run(run_all())                   # asyncio.run, instrumented
+    print(monitor.summary())
+    monitor.write_timeline("run_all.trace.json")
+
+    async def main():                        # or inside a running loop
+        async with LoopMonitor() as monitor:
+            await run_all()
+
+    with monitor.patch_asyncio_run():        # every asyncio.run() in the block
+        chapter_25()
+
+The timeline is in the Chrome trace event format: open it in Perfetto
+(ui.perfetto.dev) or ``chrome://tracing`` to see tasks as bars, slow
+callbacks, and lag and pending tasks as counters. ``pycourse.runner
+--loop-trace FILE`` runs a whole course under a monitor.
+
+Task lifetimes come from a task factory, so tasks created before the
+monitor attached (such as the task running ``main()`` when the monitor is
+entered with ``async with``) are not listed. Callback timing wraps
+``asyncio.Handle._run`` while any monitor is attached; loops without a
+monitor only pay a dictionary lookup per callback.
+"""
+
+import asyncio
+import json
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+DEFAULT_INTERVAL = 0.01
+DEFAULT_SLOW_CALLBACK = 0.05
+
+
+class TaskRecord(NamedTuple):
+    name: str
+    coroutine: str
+    created: float              # seconds since the monitor attached
+    finished: Optional[float]   # None while still pending
+    state: str                  # "pending", "done", "cancelled" or "failed"
+
+    @property
+    def lifetime(self) -> Optional[float]:
+        return None if self.finished is None else self.finished - self.created
+
+
+class SlowCallback(NamedTuple):
+    start: float
+    duration: float
+    description: str
+
+
+class Sample(NamedTuple):
+    time: float
+    lag: float
+    pending: int
+
+
+# ============================================
+# Callback timing (shared by every monitor)
+# ============================================
+
+_monitors: Dict[asyncio.AbstractEventLoop, "LoopMonitor"] = {}
+_original_run = asyncio.Handle._run
+
+
+def _timed_run(handle):
+    monitor = _monitors.get(handle._loop)
+    if monitor is None:
+        return _original_run(handle)
+    start = time.perf_counter()
+    try:
+        return _original_run(handle)
+    finally:
+        monitor._callback_ran(handle, start, time.perf_counter() - start)
+
+
+def _describe(handle) -> str:
+    callback = handle._callback
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        return f"{owner.get_name()} ({getattr(coro, '__qualname__', coro)})"
+    return getattr(callback, "__qualname__", repr(callback))
+
+
+def _coroutine_name(coro) -> str:
+    return getattr(coro, "__qualname__", type(coro).__name__)
+
+
+# ============================================
+# Monitor
+# ============================================
+
+class LoopMonitor:
+    """Loop lag, task lifetimes, slow callbacks and pending tasks of one loop."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL,
+                 slow_callback: float = DEFAULT_SLOW_CALLBACK):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.slow_callback = slow_callback
+        self.samples: List[Sample] = []
+        self.slow: List[SlowCallback] = []
+        self.callbacks = 0
+        self.busy = 0.0
+        self.elapsed = 0.0
+        self._records: List[list] = []   # [name, coro, created, finished, state] per task
+        # The records of unfinished tasks; weak, so the monitor does not keep
+        # a task (and its coroutine's frame) alive.
+        self._pending: "weakref.WeakKeyDictionary[asyncio.Task, list]" = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._previous_factory = None
+        self._ticker: Optional[asyncio.Task] = None
+        self._origin = 0.0
+
+    # ----- attaching -----
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is not None:
+            raise RuntimeError("monitor is already attached to a loop")
+        if loop in _monitors:
+            raise RuntimeError("loop already has a monitor")
+        if not self.samples and not self._records:
+            self._origin = time.perf_counter()
+        self._loop = loop
+        _monitors[loop] = self
+        asyncio.Handle._run = _timed_run
+        self._previous_factory = loop.get_task_factory()
+        loop.set_task_factory(self._task_factory)
+        self._ticker = asyncio.Task(self._tick(), loop=loop, name="loopmon-ticker")
+
+    def detach(self) -> None:
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        loop.set_task_factory(self._previous_factory)
+        del _monitors[loop]
+        if not _monitors:
+            asyncio.Handle._run = _original_run
+        self.elapsed = time.perf_counter() - self._origin
+
+    async def __aenter__(self) -> "LoopMonitor":
+        self.attach(asyncio.get_running_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.detach()
+
+    def run(self, coro, debug: Optional[bool] = None) -> Any:
+        """``asyncio.run(coro)`` with the monitor attached to its loop."""
+        with asyncio.Runner(debug=debug) as runner:
+            self.attach(runner.get_loop())
+            try:
+                return runner.run(coro)
+            finally:
+                self.detach()
+
+    @contextmanager
+    def patch_asyncio_run(self) -> Iterator["LoopMonitor"]:
+        """Route every ``asyncio.run`` call in the block through ``self.run``.
+
+        Uses ``pycourse.runtime.route_asyncio_run``, so it nests with
+        ``pycourse.runtime.patch_asyncio_run``: the inner block wins.
+        """
+        from .runtime import route_asyncio_run
+
+        with route_asyncio_run(self.run):
+            yield self
+
+    # ----- recording -----
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def _task_factory(self, loop, coro, **kwargs):
+        if self._previous_factory is not None:
+            task = self._previous_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        # loop.create_task(name=...) only names the task after the factory
+        # returns, so the name is read when the task finishes or is reported.
+        record = [None, _coroutine_name(coro), self._now(), None, "pending"]
+        self._records.append(record)
+        self._pending[task] = record
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        record = self._pending.pop(task, None)
+        if record is None:
+            return
+        record[0] = task.get_name()
+        record[3] = self._now()
+        if task.cancelled():
+            record[4] = "cancelled"
+        else:
+            record[4] = "failed" if task.exception() is not None else "done"
+
+    def _callback_ran(self, handle, start: float, duration: float) -> None:
+        self.callbacks += 1
+        self.busy += duration
+        if duration >= self.slow_callback:
+            self.slow.append(SlowCallback(start - self._origin, duration, _describe(handle)))
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            # The ticker itself is not one of the pending tasks.
+            self.samples.append(Sample(self._now(), lag, len(asyncio.all_tasks(loop)) - 1))
+
+    # ----- reporting -----
+
+    @property
+    def tasks(self) -> List[TaskRecord]:
+        for task, record in list(self._pending.items()):
+            record[0] = task.get_name()
+        return [TaskRecord(*record) for record in self._records]
+
+    def summary(self, top: int = 5) -> str:
+        elapsed = self.elapsed or self._now()
+        lags = sorted(s.lag for s in self.samples)
+        tasks = self.tasks
+        finished = [t for t in tasks if t.lifetime is not None]
+        states = {state: sum(t.state == state for t in tasks)
+                  for state in ("done", "cancelled", "failed", "pending")}
+        lines = [f"event loop: {elapsed:.3f} s, {self.callbacks} callbacks, "
+                 f"busy {self.busy / elapsed if elapsed else 0:.1%}"]
+        if lags:
+            lines.append(f"lag: mean {1000 * sum(lags) / len(lags):.2f} ms, "
+                         f"p95 {1000 * lags[int(0.95 * (len(lags) - 1))]:.2f} ms, "
+                         f"max {1000 * lags[-1]:.2f} ms "
+                         f"({len(lags)} samples every {1000 * self.interval:g} ms)")
+            lines.append(f"pending tasks: max {max(s.pending for s in self.samples)}")
+        lines.append(f"tasks: {len(tasks)} created, " + ", ".join(f"{n} {s}" for s, n in states.items()))
+        if finished:
+            lifetimes = [t.lifetime for t in finished]
+            lines.append(f"task lifetime: mean {1000 * sum(lifetimes) / len(lifetimes):.1f} ms, "
+                         f"max {1000 * max(lifetimes):.1f} ms")
+            for t in sorted(finished, key=lambda t: -t.lifetime)[:top]:
+                lines.append(f"  {1000 * t.lifetime:10.1f} ms  {t.name} ({t.coroutine}) {t.state}")
+        lines.append(f"slow callbacks (>= {1000 * self.slow_callback:g} ms): {len(self.slow)}")
+        for s in sorted(self.slow, key=lambda s: -s.duration)[:top]:
+            lines.append(f"  {1000 * s.duration:10.1f} ms  {s.description} at {s.start:.3f} s")
+        return "\n".join(lines)
+
+    def timeline(self) -> Dict[str, Any]:
+        """The recording as a Chrome trace event document."""
+        def us(seconds: float) -> float:
+            return round(seconds * 1e6, 1)
+
+        end = self.elapsed or self._now()
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "event loop"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "callbacks"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 2, "args": {"name": "tasks"}},
+        ]
+        for t in self.tasks:
+            events.append({"name": f"{t.name} ({t.coroutine})", "cat": "task", "ph": "X",
+                           "pid": 1, "tid": 2, "ts": us(t.created),
+                           "dur": us((t.finished if t.finished is not None else end) - t.created),
+                           "args": {"state": t.state}})
+        for s in self.slow:
+            events.append({"name": s.description, "cat": "slow callback", "ph": "X",
+                           "pid": 1, "tid": 1, "ts": us(s.start), "dur": us(s.duration)})
+        for s in self.samples:
+            events.append({"name": "lag (ms)", "ph": "C", "pid": 1, "ts": us(s.time),
+                           "args": {"lag": round(1000 * s.lag, 3)}})
+            events.append({"name": "pending tasks", "ph": "C", "pid": 1, "ts": us(s.time),
+                           "args": {"pending": s.pending}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_timeline(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.timeline(), f)
@@ -0,0 +1,274 @@
+"""Per-chapter and per-function profile of a course run.
+
+    python -m pycourse.profiler advanced --stacks advanced.folded
+    python -m pycourse.runner advanced --profile advanced.folded -o advanced.txt
+
+Every chapter is one section, named after its banner (``CHAPTER 14:
+DECORATORS``), or ``chapter N`` in a script without banners; the script's
+module body, header and footer get sections of their own. For each section the summary reports wall time
+(``perf_counter``), CPU time of all threads (``process_time``) and peak
+traced allocation (``tracemalloc``).
+
+Functions are attributed through ``sys.setprofile`` (and
+``threading.setprofile`` for chapter 24's threads), named by their
+qualified name without ``<locals>``: ``my_decorator.wrapper``,
+``count_up_to``, ``TodoApp.show_todos``. Only code from the course
+scripts and ``pycourse`` is shown; time spent in the standard library is
+charged to the course function that called it. The collapsed-stack file
+has one ``section;function;...;function <microseconds>`` line per stack,
+the input ``flamegraph.pl`` and speedscope expect.
+
+Profiling slows the run down several times over; compare sections with
+each other, not with an unprofiled run. Allocation peaks are exact for
+single-threaded chapters and approximate while threads run.
+"""
+
+import os
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from .render import banner, render
+
+COURSE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_OWN_FILE = os.path.abspath(__file__)
+
+
+class SectionStats(NamedTuple):
+    label: str
+    wall_ns: int
+    cpu_ns: int
+    peak_bytes: int
+
+
+class FunctionStats:
+    __slots__ = ("calls", "total_ns", "self_ns", "cpu_ns", "peak_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0
+        self.cpu_ns = 0
+        self.peak_bytes = 0
+
+
+class _Frame:
+    # One active call: where its time goes in the collapsed stacks, when it
+    # started, how much of it children used, and its allocation window.
+    __slots__ = ("code", "name", "path", "start_ns", "cpu_start_ns", "child_ns", "base", "peak")
+
+    def __init__(self, code, name, path, base):
+        self.code = code
+        self.name = name        # None for frames outside the course code
+        self.path = path
+        self.start_ns = time.perf_counter_ns()
+        self.cpu_start_ns = time.thread_time_ns()
+        self.child_ns = 0
+        self.base = base
+        self.peak = base
+
+
+def function_name(code) -> str:
+    """``my_decorator.<locals>.wrapper`` -> ``my_decorator.wrapper``."""
+    return getattr(code, "co_qualname", code.co_name).replace(".<locals>", "")
+
+
+class Profiler:
+    """Collects section timings, function statistics and collapsed stacks."""
+
+    def __init__(self, memory: bool = True, all_frames: bool = False):
+        self.memory = memory
+        self.all_frames = all_frames
+        self.sections: List[SectionStats] = []
+        self.functions: Dict[str, FunctionStats] = {}
+        self.stacks: Dict[str, int] = {}
+        self._label = "<setup>"
+        self._threads: Dict[int, List[_Frame]] = {}
+        self._shown: Dict[object, Optional[str]] = {}
+        self._banner_code = banner.__code__
+
+    # ----- what gets shown -----
+
+    def _display_name(self, code) -> Optional[str]:
+        name = self._shown.get(code, False)
+        if name is False:
+            filename = code.co_filename
+            # "<frozen importlib._bootstrap>" and friends are not paths.
+            visible = self.all_frames or (
+                not filename.startswith("<")
+                and os.path.abspath(filename).startswith(COURSE_DIR + os.sep)
+                and os.path.abspath(filename) != _OWN_FILE)
+            name = function_name(code) if visible else None
+            self._shown[code] = name
+        return name
+
+    def _memory(self):
+        return tracemalloc.get_traced_memory() if self.memory else (0, 0)
+
+    # ----- sys.setprofile callback -----
+
+    def _callback(self, frame, event, arg):
+        if event == "call":
+            stack = self._threads.get(threading.get_ident())
+            if stack is None:
+                # First event of a thread started inside the current section.
+                stack = [_Frame(None, None, f"{self._label};<thread>", self._memory()[0])]
+                self._threads[threading.get_ident()] = stack
+            code = frame.f_code
+            if code is self._banner_code and len(stack) <= 3:
+                self._retitle(frame.f_locals.get("title"))
+            parent = stack[-1]
+            current, peak = self._memory()
+            if self.memory:
+                parent.peak = max(parent.peak, peak)
+                tracemalloc.reset_peak()
+            name = self._display_name(code)
+            path = f"{parent.path};{name}" if name is not None else parent.path
+            stack.append(_Frame(code, name, path, current))
+        elif event == "return":
+            stack = self._threads.get(threading.get_ident())
+            if stack and len(stack) > 1 and stack[-1].code is frame.f_code:
+                self._finish(stack.pop(), stack[-1])
+
+    def _finish(self, entry: _Frame, parent: Optional[_Frame]) -> None:
+        elapsed = time.perf_counter_ns() - entry.start_ns
+        entry.peak = max(entry.peak, self._memory()[1])
+        if parent is not None:
+            parent.child_ns += elapsed
+            parent.peak = max(parent.peak, entry.peak)
+        self_ns = elapsed - entry.child_ns
+        self.stacks[entry.path] = self.stacks.get(entry.path, 0) + self_ns
+        if entry.name is not None:
+            stats = self.functions.get(entry.name)
+            if stats is None:
+                stats = self.functions[entry.name] = FunctionStats()
+            stats.calls += 1
+            stats.total_ns += elapsed
+            stats.self_ns += self_ns
+            stats.cpu_ns += time.thread_time_ns() - entry.cpu_start_ns
+            stats.peak_bytes = max(stats.peak_bytes, entry.peak - entry.base)
+
+    def _retitle(self, title) -> None:
+        # A chapter's section is named after its banner, which the chapter
+        # prints first; rename the root frame before any stack uses it.
+        if not title or not self._label.startswith("chapter "):
+            return
+        stack = self._threads.get(threading.get_ident())
+        old, self._label = self._label, str(title)
+        for entry in stack:
+            if entry.path == old or entry.path.startswith(old + ";"):
+                entry.path = self._label + entry.path[len(old):]
+
+    # ----- sections -----
+
+    def section(self, label: str, func: Callable, *args, **kwargs):
+        """Run ``func`` as one profiled section and return its result."""
+        self._label = label
+        ident = threading.get_ident()
+        root = _Frame(None, None, label, self._memory()[0])
+        self._threads = {ident: [root]}
+        if self.memory:
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter_ns(), time.process_time_ns()
+        threading.setprofile(self._callback)
+        sys.setprofile(self._callback)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.setprofile(None)
+            threading.setprofile(None)
+            wall, cpu = time.perf_counter_ns() - wall, time.process_time_ns() - cpu
+            stack = self._threads[ident]
+            while len(stack) > 1:  # frames left open by an exception
+                self._finish(stack.pop(), stack[-1])
+            self._finish(root, None)
+            self.sections.append(SectionStats(self._label, wall, cpu, root.peak - root.base))
+
+    def run(self, path: str, output_format: str = "text") -> None:
+        """Run a course script section by section, as ``python script --format FORMAT`` would."""
+        started = self.memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            # A run_name other than "__main__" defines the chapters without
+            # rendering them; render() below does what the script's main() does.
+            namespace = self.section("<module>", runpy.run_path, path, run_name="pycourse.profiled")
+            if hasattr(sys.stdout, "reconfigure"):
+                sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+            chapters = {number: self._wrap(f"chapter {number}", func)
+                        for number, func in namespace["CHAPTERS"].items()}
+            header, footer = namespace.get("header"), namespace.get("footer")
+            render(chapters, None, header and self._wrap("header", header),
+                   footer and self._wrap("footer", footer), output_format)
+        finally:
+            if started:
+                tracemalloc.stop()
+
+    def _wrap(self, label: str, func: Callable) -> Callable[[], None]:
+        return lambda: self.section(label, func)
+
+    # ----- reports -----
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, one ``frame;frame;... <microseconds>`` line each."""
+        lines = []
+        for path, ns in self.stacks.items():
+            us = ns // 1000
+            if us > 0:
+                lines.append(f"{path} {us}")
+        return "\n".join(lines) + "\n"
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+
+    def summary(self, top: int = 15) -> str:
+        """Per-section table, then the ``top`` functions by total time."""
+        label_width = max([len(s.label) for s in self.sections] + [7])
+        lines = [f"{'section':<{label_width}}{'wall ms':>10}{'cpu ms':>10}{'peak KiB':>10}"]
+        for s in self.sections:
+            lines.append(f"{s.label:<{label_width}}{s.wall_ns / 1e6:>10.2f}{s.cpu_ns / 1e6:>10.2f}"
+                         f"{s.peak_bytes / 1024:>10.1f}")
+        lines.append(f"{'total':<{label_width}}{sum(s.wall_ns for s in self.sections) / 1e6:>10.2f}"
+                     f"{sum(s.cpu_ns for s in self.sections) / 1e6:>10.2f}"
+                     f"{max([s.peak_bytes for s in self.sections] + [0]) / 1024:>10.1f}")
+
+        ranked = sorted(self.functions.items(), key=lambda item: item[1].total_ns, reverse=True)[:top]
+        if ranked:
+            name_width = max(len(name) for name, _ in ranked)
+            lines.append("")
+            lines.append(f"{'function':<{name_width}}{'calls':>7}{'total ms':>10}{'self ms':>10}"
+                         f"{'cpu ms':>10}{'peak KiB':>10}")
+            for name, f in ranked:
+                lines.append(f"{name:<{name_width}}{f.calls:>7}{f.total_ns / 1e6:>10.2f}"
+                             f"{f.self_ns / 1e6:>10.2f}{f.cpu_ns / 1e6:>10.2f}"
+                             f"{f.peak_bytes / 1024:>10.1f}")
+        return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    from .runner import COURSES, run_course
+
+    parser = argparse.ArgumentParser(description="Profile a course script per chapter and function.")
+    parser.add_argument("course", choices=sorted(COURSES))
+    parser.add_argument("--stacks", help="write collapsed stacks (flamegraph input) here")
+    parser.add_argument("--top", type=int, default=15, help="functions to list in the summary")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc (faster)")
+    parser.add_argument("--all-frames", action="store_true",
+                        help="show standard library frames instead of folding them into callers")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    profiler = Profiler(memory=not args.no_memory, all_frames=args.all_frames)
+    run_course(args.course, profiler=profiler)
+    if args.stacks:
+        profiler.write_collapsed(args.stacks)
+    print(profiler.summary(args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Compact storage for millions of chapter 6 ``person`` profiles.
+
+Chapter 6 builds ``{"name": ..., "age": ..., "city": ...}`` and then adds
+``email``, deletes ``city`` and pops keys again. Held by the million, each
+of those dicts costs a couple of hundred bytes. A ``ProfileStore`` keeps
+the schema keys as one list per key (8 bytes per profile per key) and the
+optional keys in a sparse overflow map holding only the profiles that
+have them:
+
+    store = ProfileStore(("name", "age", "city"))
+    alice = store.add(name="Alice", age=25, city="New York")
+    alice["email"] = "alice@example.com"      # goes to the overflow map
+    del alice["city"]
+    alice.get("country", "USA")
+    dict(alice)                               # {'name': 'Alice', 'age': 25, 'email': ...}
+
+    ages = store.get_many("age")              # one key across every profile
+    store.update_many("age", [a + 1 for a in ages])
+    store.update_many("email", ["x@example.com"], rows=[0])
+    store.extend_rows([("Bob", 30, "Lagos")])  # schema-ordered tuples, fastest to load
+
+``store[i]`` is a ``Profile``: a live, dict-like view of row ``i``. It
+supports everything chapter 6 does with a dict (``[]``, ``get``, ``pop``,
+``del``, ``in``, ``len``, ``keys``/``values``/``items``, ``update`` and
+iteration) but iterates schema keys first, then optional keys in the
+order the store first saw them, instead of insertion order. A view costs
+several times a dict lookup per key, so work across many profiles should
+go through ``get_many``/``update_many``/``delete_many``, which run a
+whole column at once (``python -m benchmarks.profiles``).
+"""
+
+import sys
+from itertools import repeat
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING = _Missing()   # a deleted (or never set) schema key
+
+
+class ProfileStore:
+    """Rows of a fixed key schema, plus a sparse map for any other key."""
+
+    def __init__(self, schema: Sequence[str], profiles: Iterable[Mapping[str, Any]] = ()):
+        if len(set(schema)) != len(schema):
+            raise ValueError(f"duplicate keys in schema {tuple(schema)}")
+        self.schema = tuple(schema)
+        self._columns: Dict[str, List[Any]] = {key: [] for key in self.schema}
+        self._missing: Dict[str, int] = dict.fromkeys(self.schema, 0)  # MISSING per column
+        self._overflow: Dict[str, Dict[int, Any]] = {}
+        self._rows = 0
+        self.extend(profiles)
+
+    # ----- rows -----
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, row: int) -> "Profile":
+        if row < 0:
+            row += self._rows
+        if not 0 <= row < self._rows:
+            raise IndexError("profile index out of range")
+        return Profile(self, row)
+
+    def __iter__(self) -> Iterator["Profile"]:
+        return (Profile(self, row) for row in range(self._rows))
+
+    def add(self, profile: Mapping[str, Any] = (), **fields) -> "Profile":
+        """Append one profile (a mapping and/or keyword fields); returns its view."""
+        row = self._rows
+        self.extend([{**dict(profile), **fields}])
+        return Profile(self, row)
+
+    def extend(self, profiles: Iterable[Mapping[str, Any]]) -> None:
+        profiles = profiles if isinstance(profiles, (list, tuple)) else list(profiles)
+        start = self._rows
+        for key, column in self._columns.items():
+            column.extend([p.get(key, MISSING) for p in profiles])
+        schema = self._columns.keys()
+        for row, profile in enumerate(profiles, start):
+            keys = profile.keys()
+            if keys != schema:
+                for key in keys - schema:
+                    self._overflow.setdefault(key, {})[row] = profile[key]
+                for key in schema - keys:
+                    self._missing[key] += 1
+        self._rows = start + len(profiles)
+
+    def extend_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Append profiles given as tuples of every schema value, in schema order."""
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        width = len(self.schema)
+        if any(len(row) != width for row in rows):
+            raise ValueError(f"every row needs {width} values: {self.schema}")
+        if rows:
+            for column, values in zip(self._columns.values(), zip(*rows)):
+                column.extend(values)
+        self._rows += len(rows)
+
+    # ----- one key across many rows -----
+
+    def keys(self) -> List[str]:
+        """Every key used by some profile: the schema, then optional keys."""
+        return list(self.schema) + list(self._overflow)
+
+    def _check_rows(self, rows: Iterable[int]) -> List[int]:
+        rows = list(rows)
+        for row in rows:
+            if not 0 <= row < self._rows:
+                raise IndexError(f"profile index {row} out of range")
+        return rows
+
+    def get_many(self, key: str, rows: Optional[Iterable[int]] = None,
+                 default: Any = None) -> List[Any]:
+        """``profile.get(key, default)`` for every row (or every row in ``rows``)."""
+        if rows is not None:
+            rows = self._check_rows(rows)
+        column = self._columns.get(key)
+        if column is not None:
+            values = column[:] if rows is None else [column[row] for row in rows]
+            if self._missing[key]:
+                return [default if value is MISSING else value for value in values]
+            return values
+        values = self._overflow.get(key, {})
+        rows = range(self._rows) if rows is None else rows
+        return list(map(values.get, rows, repeat(default)))
+
+    def update_many(self, key: str, values: Iterable[Any],
+                    rows: Optional[Iterable[int]] = None) -> None:
+        """``profile[key] = value`` for every row (or every row in ``rows``), in order."""
+        column = self._columns.get(key)
+        if rows is None:
+            values = list(values)
+            if len(values) != self._rows:
+                raise ValueError(f"expected {self._rows} values, got {len(values)}")
+            if column is not None:
+                column[:] = values
+                self._missing[key] = 0
+            elif values:
+                self._overflow[key] = dict(enumerate(values))
+            return
+        rows = self._check_rows(rows)
+        values = list(values)
+        if len(values) != len(rows):
+            raise ValueError(f"expected {len(rows)} values, one per row, got {len(values)}")
+        if column is not None:
+            restored = 0
+            for row, value in zip(rows, values):
+                restored += column[row] is MISSING
+                column[row] = value
+            self._missing[key] -= restored
+        elif rows:
+            self._overflow.setdefault(key, {}).update(zip(rows, values))
+
+    def delete_many(self, key: str, rows: Optional[Iterable[int]] = None) -> None:
+        """``profile.pop(key, None)`` for every row (or every row in ``rows``)."""
+        if rows is not None:
+            rows = self._check_rows(rows)
+        column = self._columns.get(key)
+        if column is not None:
+            if rows is None:
+                column[:] = [MISSING] * self._rows
+                self._missing[key] = self._rows
+            else:
+                deleted = 0
+                for row in rows:
+                    deleted += column[row] is not MISSING
+                    column[row] = MISSING
+                self._missing[key] += deleted
+        elif key in self._overflow:
+            if rows is None:
+                del self._overflow[key]
+            else:
+                values = self._overflow[key]
+                for row in rows:
+                    values.pop(row, None)
+                if not values:
+                    del self._overflow[key]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [dict(profile) for profile in self]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the store's own containers, not by the values."""
+        return (sys.getsizeof(self._columns) + sum(map(sys.getsizeof, self._columns.values()))
+                + sys.getsizeof(self._overflow) + sum(map(sys.getsizeof, self._overflow.values())))
+
+    def __repr__(self) -> str:
+        return f"ProfileStore({self.schema}, {self._rows} profiles)"
+
+
+class Profile(MutableMapping):
+    """A live dict-like view of one row of a ``ProfileStore``."""
+
+    __slots__ = ("store", "row")
+
+    def __init__(self, store: ProfileStore, row: int):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key: str) -> Any:
+        column = self.store._columns.get(key)
+        if column is not None:
+            value = column[self.row]
+            if value is not MISSING:
+                return value
+        else:
+            values = self.store._overflow.get(key)
+            if values is not None and self.row in values:
+                return values[self.row]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Faster than MutableMapping.get, which goes through a KeyError.
+        column = self.store._columns.get(key)
+        if column is not None:
+            value = column[self.row]
+            return default if value is MISSING else value
+        values = self.store._overflow.get(key)
+        return default if values is None else values.get(self.row, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        column = self.store._columns.get(key)
+        if column is not None:
+            if column[self.row] is MISSING:
+                self.store._missing[key] -= 1
+            column[self.row] = value
+        else:
+            self.store._overflow.setdefault(key, {})[self.row] = value
+
+    def __delitem__(self, key: str) -> None:
+        column = self.store._columns.get(key)
+        if column is not None and column[self.row] is not MISSING:
+            column[self.row] = MISSING
+            self.store._missing[key] += 1
+            return
+        values = self.store._overflow.get(key)
+        if values is None or self.row not in values:
+            raise KeyError(key)
+        del values[self.row]
+        if not values:
+            del self.store._overflow[key]
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, MISSING) is not MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        row = self.row
+        for key, column in self.store._columns.items():
+            if column[row] is not MISSING:
+                yield key
+        for key, values in self.store._overflow.items():
+            if row in values:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -0,0 +1,169 @@
+"""Structured NDJSON output of a course run, for the site build.
+
+    python python-advanced-course.py --format ndjson
+    python python-advanced-course.py --format ndjson --chapter 14
+    python -m pycourse.runner advanced --format ndjson -o advanced.ndjson
+
+Instead of the banner-formatted transcript, every line of output is one
+JSON record, in the order the text would have been printed:
+
+    {"type": "banner", "title": "PYTHON ADVANCED COURSE - COMPLETE TRAINING"}
+    {"type": "chapter", "chapter": 14, "title": "DECORATORS"}
+    {"type": "section", "chapter": 14, "section": "14.1", "title": "Basic Decorator"}
+    {"type": "listing", "chapter": 14, "section": "14.1", "module": "pycourse.core.decorators",
+     "names": ["my_decorator", "say_hello"], "code": "def my_decorator(func):\\n..."}
+    {"type": "output", "chapter": 14, "section": "14.1", "text": "   Execution:"}
+
+``chapter`` records come from ``pycourse.render.banner`` (with a ``null``
+title for a chapter that prints no banner), ``listing``
+records from ``pycourse.listing.listing`` (``code`` is the unindented
+source), ``banner`` records from the rule-title-rule headers and footers
+the scripts print themselves (other ``=`` rules are layout and dropped).
+``section`` records are the ``14.1 Title:``
+headings, and ``output`` records are everything else, one per run of
+non-blank lines, as printed. A consumer can build the whole course in one
+streaming pass: every record carries the chapter and section it belongs
+to (``null`` outside one).
+"""
+
+import json
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from .render import RULE
+
+FORMATS = ("text", "ndjson")
+
+_CHAPTER = re.compile(r"CHAPTER\s+(\d+):?\s*(.*)$")
+_SECTION = re.compile(r"(\d+\.\d+)\s+(.*?):?\s*$")
+
+
+class RecordWriter:
+    """A ``sys.stdout`` stand-in that turns printed chapters into NDJSON records."""
+
+    def __init__(self, target):
+        self._target = target
+        # Chapter 24's threads print concurrently.
+        self._lock = threading.RLock()
+        self._partial = ""
+        self._block: List[str] = []
+        self._rule: Optional[List[str]] = None   # lines seen since an opening rule
+        self._listing: Optional[Dict[str, Any]] = None
+        self._listing_text: Optional[str] = None
+        self._skip_newline = False
+        self.chapter_number: Optional[int] = None
+        self.section: Optional[str] = None
+        self._announced = True
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        self._target.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _context(self, kind: str, **fields: Any) -> Dict[str, Any]:
+        if not self._announced:
+            # A chapter that prints no banner still gets its chapter record.
+            self._announced = True
+            self.emit({"type": "chapter", "chapter": self.chapter_number, "title": None})
+        return {"type": kind, "chapter": self.chapter_number, "section": self.section, **fields}
+
+    # ----- explicit records -----
+
+    def start_chapter(self, number: Optional[int]) -> None:
+        """Called by ``pycourse.render`` before chapter ``number`` (None: the footer)."""
+        with self._lock:
+            self._lines("\n" if self._partial else "")
+            self._end_block()
+            self.chapter_number = number
+            self.section = None
+            self._announced = number is None
+
+    def chapter(self, title: str) -> None:
+        with self._lock:
+            self._end_block()
+            match = _CHAPTER.match(title)
+            if match:
+                self.chapter_number = int(match.group(1))
+            self.section = None
+            self._announced = True
+            self.emit({"type": "chapter", "chapter": self.chapter_number,
+                       "title": match.group(2) if match else title})
+
+    def expect_listing(self, module: str, names: Sequence[str], text: str, code: str) -> None:
+        """Report ``text`` as a listing record when it is printed next."""
+        with self._lock:
+            self._listing = {"module": module, "names": list(names), "code": code}
+            self._listing_text = text
+
+    # ----- file interface -----
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            if self._listing is not None and text == self._listing_text:
+                self._end_block()
+                self.emit(self._context("listing", **self._listing))
+                self._listing = self._listing_text = None
+                self._skip_newline = True   # the "\n" print() writes after it
+                return len(text)
+            pending = text
+            if self._skip_newline:
+                self._skip_newline = False
+                if pending.startswith("\n"):
+                    pending = pending[1:]
+            self._lines(pending)
+        return len(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def close(self) -> None:
+        """Emit what is still buffered; the target stays open."""
+        with self._lock:
+            if self._partial:
+                self._lines("\n")
+            if self._rule:
+                self._block.extend(self._rule)
+            self._rule = None
+            self._end_block()
+            self.flush()
+
+    # ----- parsing printed text -----
+
+    def _lines(self, text: str) -> None:
+        *complete, self._partial = (self._partial + text).split("\n")
+        for line in complete:
+            self._line(line.rstrip("\r"))
+
+    def _line(self, line: str) -> None:
+        if line == RULE:
+            if self._rule is None:
+                self._end_block()
+                self._rule = []
+            elif len(self._rule) == 1:
+                self.chapter_number = self.section = None
+                self.emit({"type": "banner", "title": self._rule[0].strip()})
+                self._rule = None
+            else:   # two rules in a row: the first one was decoration
+                self._rule = []
+            return
+        if self._rule is not None:
+            if not self._rule and line.strip():
+                self._rule.append(line)
+                return
+            # Not rule-title-rule after all: the rule was decoration.
+            self._block.extend(self._rule)
+            self._rule = None
+        if not line.strip():
+            self._end_block()
+            return
+        match = _SECTION.match(line)
+        if match:
+            self._end_block()
+            self.section = match.group(1)
+            self.emit(self._context("section", title=match.group(2)))
+            return
+        self._block.append(line)
+
+    def _end_block(self) -> None:
+        if self._block:
+            self.emit(self._context("output", text="\n".join(self._block)))
+            self._block = []
@@ -0,0 +1,177 @@
+"""Helpers the course scripts use to render their chapters.
+
+A course script defines one ``chapter_N()`` function per chapter, collects
+them in ``CHAPTERS`` and hands them to ``main()``:
+
+    CHAPTERS = {1: chapter_1, 2: chapter_2}
+
+    if __name__ == "__main__":
+        main(CHAPTERS, header, footer)
+
+``python python-basic-course.py --chapter 5`` then renders chapter 5 only,
+and ``--format ndjson`` prints JSON records instead of text (see
+``pycourse.records``).
+"""
+
+from __future__ import annotations
+
+import sys
+
+# This module is on every script's start-up path, so it avoids importing
+# typing, contextlib (``indented`` is a plain class) and collections.abc
+# (annotations are only read by type checkers), and argparse (which pulls in
+# re, gettext and shutil) is only used for --help and malformed arguments.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RULE = "=" * 60
+OUTPUT_INDENT = "   "
+
+# The pycourse.records.RecordWriter of an ``--format ndjson`` render.
+records = None
+
+
+def banner(title: str) -> None:
+    """Print a chapter banner: a blank line, the title between two rules."""
+    if records is not None:
+        records.chapter(title)
+        return
+    print("\n" + RULE)
+    print(title)
+    print(RULE)
+
+
+class _IndentWriter:
+    def __init__(self, target, prefix: str):
+        self._target = target
+        self._prefix = prefix
+        self._at_line_start = True
+
+    def write(self, text: str) -> int:
+        for piece in text.splitlines(keepends=True):
+            if self._at_line_start and piece.strip("\r\n"):
+                self._target.write(self._prefix)
+            self._target.write(piece)
+            self._at_line_start = piece.endswith("\n")
+        return len(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+
+class indented:
+    """Indent everything printed inside the ``with`` block by ``prefix``.
+
+    The shared definitions in ``pycourse.core`` print unindented lines;
+    the chapter renderers use this to nest that output under a listing.
+    """
+
+    def __init__(self, prefix: str = OUTPUT_INDENT):
+        self._prefix = prefix
+        self._saved = None
+
+    def __enter__(self) -> None:
+        self._saved = sys.stdout
+        sys.stdout = _IndentWriter(self._saved, self._prefix)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        sys.stdout = self._saved
+
+
+def render(chapters: dict[int, Callable[[], None]], numbers: list[int] | None = None,
+           header: Callable[[], None] | None = None,
+           footer: Callable[[], None] | None = None,
+           output_format: str = "text") -> None:
+    """Render the selected chapters, or the whole course with header and footer."""
+    if output_format == "text":
+        _render(chapters, numbers, header, footer)
+        return
+    global records
+    from .records import FORMATS, RecordWriter
+
+    if output_format not in FORMATS:
+        raise ValueError(f"unknown format {output_format!r}, expected one of {FORMATS}")
+    saved = sys.stdout
+    records = sys.stdout = RecordWriter(saved)
+    try:
+        _render(chapters, numbers, header, footer, records.start_chapter)
+        records.close()
+    finally:
+        records = None
+        sys.stdout = saved
+
+
+def _render(chapters, numbers, header, footer, start=None) -> None:
+    # ``start(number)`` is called before each chapter and ``start(None)``
+    # before the footer.
+    if numbers:
+        unknown = [n for n in numbers if n not in chapters]
+        if unknown:
+            raise KeyError(f"no chapter {unknown[0]} (have {min(chapters)}-{max(chapters)})")
+    elif header:
+        header()
+    for number in numbers or sorted(chapters):
+        if start:
+            start(number)
+        chapters[number]()
+    if footer and not numbers:
+        if start:
+            start(None)
+        footer()
+
+
+def main(chapters: dict[int, Callable[[], None]],
+         header: Callable[[], None] | None = None,
+         footer: Callable[[], None] | None = None,
+         argv: list[str] | None = None) -> None:
+    argv = argv if argv is not None else sys.argv[1:]
+    options = _parse_options(argv)
+    if options is None:
+        # Exits on --help and malformed arguments; otherwise the slow path
+        # accepts what the fast one declined (abbreviations, negative numbers).
+        args = _argument_parser().parse_args(argv)
+        options = args.chapters or [], args.format
+    numbers, output_format = options
+
+    # Chapter output contains ✓ and emoji; never let a narrow console
+    # encoding abort the run.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    try:
+        render(chapters, numbers, header, footer, output_format)
+    except KeyError as e:
+        _argument_parser().error(e.args[0])
+
+
+def _parse_options(argv: list[str]) -> tuple[list[int], str] | None:
+    """Parse ``--chapter N`` and ``--format F`` options; None if anything else is given."""
+    numbers = []
+    output_format = "text"
+    args = iter(argv)
+    for arg in args:
+        option, equals, value = arg.partition("=")
+        if option not in ("--chapter", "--format"):
+            return None
+        if not equals:
+            value = next(args, "")
+        if option == "--format":
+            if value not in ("text", "ndjson"):
+                return None
+            output_format = value
+        elif value.isdigit():
+            numbers.append(int(value))
+        else:
+            return None
+    return numbers, output_format
+
+
+def _argument_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chapter", type=int, action="append", dest="chapters",
+                        help="render only this chapter (repeatable)")
+    parser.add_argument("--format", choices=("text", "ndjson"), default="text",
+                        help="ndjson: one JSON record per chapter, section, listing and output block")
+    return parser
@@ -0,0 +1,202 @@
+"""Run a course script and capture its transcript.
+
+    python -m pycourse.runner basic -o basic.txt
+    python -m pycourse.runner basic --deterministic --cache-dir .transcripts
+    python -m pycourse.runner basic --profile basic.folded -o basic.txt
+    python -m pycourse.runner complete --loop-trace complete.trace.json
+    python -m pycourse.runner basic -o basic.txt --patch basic.patch.json
+    python -m pycourse.runner advanced --format ndjson -o advanced.ndjson
+
+With ``--deterministic`` the run is seeded, the clock frozen and threads
+run one at a time (see ``pycourse.determinism``), so the same script
+always yields the same bytes. Transcripts are identified by their SHA-256
+digest: ``-o`` is left untouched when the digest already matches, and
+``--cache-dir`` stores each transcript once as ``<digest>.txt``. ``--profile`` runs under
+``pycourse.profiler``: a per-chapter summary goes to stderr and the
+collapsed stacks to the given file. The script's ``asyncio.run`` calls
+run on the shared ``pycourse.runtime`` loop, and ``--loop-trace``
+attaches a ``pycourse.loopmon.LoopMonitor`` to that loop: its summary
+goes to stderr and the timeline to the given file. ``--patch`` compares the new transcript with the one
+already at ``-o`` chapter by chapter and writes a ``pycourse.transcripts``
+patch: only the changed chapters, or the whole text when chapters were
+added, removed or reordered. ``--format ndjson`` captures the
+``pycourse.records`` form of the run instead of the text transcript.
+"""
+
+import datetime
+import hashlib
+import io
+import json
+import os
+import runpy
+import sys
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, List, Optional
+
+from .determinism import DEFAULT_SEED, deterministic
+
+COURSE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COURSES = {
+    "basic": "python-basic-course.py",
+    "advanced": "python-advanced-course.py",
+    "complete": "python-complete-course.py",
+}
+
+
+def course_path(course: str) -> str:
+    if course not in COURSES:
+        raise ValueError(f"unknown course {course!r}, expected one of {sorted(COURSES)}")
+    return os.path.join(COURSE_DIR, COURSES[course])
+
+
+class _Captured:
+    data = b""
+
+
+@contextmanager
+def _capture_stdout() -> Iterator[_Captured]:
+    # The scripts reconfigure sys.stdout to UTF-8, so the capture target
+    # must be a TextIOWrapper over a byte buffer rather than a StringIO.
+    captured = _Captured()
+    raw = io.BytesIO()
+    wrapper = io.TextIOWrapper(raw, encoding="utf-8", errors="replace", write_through=True)
+    saved = sys.stdout
+    sys.stdout = wrapper
+    try:
+        yield captured
+    finally:
+        sys.stdout.flush()
+        captured.data = raw.getvalue()
+        sys.stdout = saved
+
+
+def run_course(course: str, is_deterministic: bool = False, seed: int = DEFAULT_SEED,
+               frozen_at: Optional[datetime.datetime] = None, profiler=None,
+               loop_monitor=None, output_format: str = "text") -> bytes:
+    """Execute a course script in-process and return its stdout as bytes.
+
+    ``profiler`` is a ``pycourse.profiler.Profiler`` to run the script under;
+    ``loop_monitor`` a ``pycourse.loopmon.LoopMonitor`` to attach to the
+    shared ``pycourse.runtime`` loop every ``asyncio.run`` in the script is
+    routed to. ``output_format`` is passed to the script as ``--format``.
+    """
+    from .runtime import get_runtime, patch_asyncio_run
+
+    path = course_path(course)
+    mode = deterministic(seed, frozen_at) if is_deterministic else nullcontext()
+    if loop_monitor is not None:
+        monitored = get_runtime().monitored(loop_monitor)
+    else:
+        monitored = nullcontext()
+    saved_argv = sys.argv
+    sys.argv = [path] if output_format == "text" else [path, "--format", output_format]
+    try:
+        with _capture_stdout() as captured, mode, patch_asyncio_run(), monitored:
+            if profiler is None:
+                runpy.run_path(path, run_name="__main__")
+            else:
+                profiler.run(path, output_format)
+    finally:
+        sys.argv = saved_argv
+    return captured.data
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write ``data`` to ``path`` unless it already holds the same bytes."""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if digest(f.read()) == digest(data):
+                return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def store(cache_dir: str, data: bytes) -> str:
+    """Store ``data`` content-addressed under ``cache_dir``; return its path."""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, digest(data) + ".txt")
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(data)
+    return path
+
+
+def _write_patch(path: str, output: str, data: bytes) -> None:
+    from .transcripts import make_patch, summary
+
+    base = None
+    if os.path.exists(output):
+        with open(output, "rb") as f:
+            base = f.read().decode("utf-8")
+    patch = make_patch(base, data.decode("utf-8"))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(patch, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    print(f"{path}: {summary(patch)}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a Python course script and capture its output.")
+    parser.add_argument("course", choices=sorted(COURSES))
+    parser.add_argument("-o", "--output", help="write the transcript here (skipped when unchanged)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="seed random, freeze the clock and serialise threads for reproducible output")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--frozen-time", type=datetime.datetime.fromisoformat,
+                        help="ISO timestamp (UTC) to freeze the clock at")
+    parser.add_argument("--cache-dir", help="also store the transcript as <digest>.txt here")
+    parser.add_argument("--profile", metavar="STACKS",
+                        help="profile the run: summary to stderr, collapsed stacks to this file")
+    parser.add_argument("--loop-trace", metavar="FILE",
+                        help="monitor the asyncio event loop: summary to stderr, timeline to this file")
+    parser.add_argument("--format", choices=("text", "ndjson"), default="text",
+                        help="ndjson: capture JSON records instead of the text transcript")
+    parser.add_argument("--patch", metavar="FILE",
+                        help="write a per-chapter patch from the previous -o transcript to this file")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+    if args.patch and not args.output:
+        parser.error("--patch needs -o: the transcript already there is the patch base")
+    if args.patch and args.format != "text":
+        parser.error("--patch splits text transcripts at their banners; it cannot be used with --format ndjson")
+
+    profiler = None
+    if args.profile:
+        from .profiler import Profiler
+
+        profiler = Profiler()
+    loop_monitor = None
+    if args.loop_trace:
+        from .loopmon import LoopMonitor
+
+        loop_monitor = LoopMonitor()
+    data = run_course(args.course, args.deterministic, args.seed, args.frozen_time, profiler,
+                      loop_monitor, args.format)
+    if profiler is not None:
+        profiler.write_collapsed(args.profile)
+        print(profiler.summary(), file=sys.stderr)
+    if loop_monitor is not None:
+        loop_monitor.write_timeline(args.loop_trace)
+        print(loop_monitor.summary(), file=sys.stderr)
+    if args.patch:
+        _write_patch(args.patch, args.output, data)
+    if args.output:
+        changed = write_if_changed(args.output, data)
+        print(f"{args.output}: {'written' if changed else 'unchanged'}", file=sys.stderr)
+    if args.cache_dir:
+        print(f"stored {store(args.cache_dir, data)}", file=sys.stderr)
+    if not args.output and not args.cache_dir:
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+    print(f"sha256 {digest(data)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""One long-lived event loop that synchronous code hands coroutines to.
+
+Chapter 25 calls ``asyncio.run(main())`` and then ``asyncio.run(run_all())``.
+Every ``asyncio.run`` creates an event loop, a default executor and a
+signal wakeup fd, runs the coroutine, then cancels leftovers and closes it
+all again. That is fine once per script and expensive once per request. An
+``AsyncRuntime`` starts one loop on a background thread and keeps it:
+
+    runtime = get_runtime()              # shared, started on first use
+    result = runtime.run(fetch_data())   # blocks this thread until done
+    future = runtime.submit(fetch_data())   # a concurrent.futures.Future
+    results = [f.result() for f in map(runtime.submit, coroutines)]
+
+    with AsyncRuntime() as runtime:      # a private loop, closed on exit
+        runtime.run(main())
+
+``run(coro)`` is the drop-in for ``asyncio.run(coro)``; with ``timeout``
+the coroutine is cancelled when it takes longer. ``call(func, *args)``
+runs a plain function on the loop thread (for loop-bound objects such as
+``pycourse.loopmon.LoopMonitor``). Everything the coroutines share lives
+on that one thread, so they can keep connections, caches and queues
+across calls.
+
+The course scripts themselves keep calling ``asyncio.run``; the tooling
+routes those calls onto the shared loop with ``patch_asyncio_run()``,
+which is how ``pycourse.runner`` and ``pycourse.worker`` run chapter 25:
+
+    with patch_asyncio_run():
+        runpy.run_path("python-complete-course.py", run_name="__main__")
+
+``route_asyncio_run(route)`` is the patch underneath, shared with
+``pycourse.loopmon.LoopMonitor.patch_asyncio_run``: blocks nest, and the
+innermost one handles each call.
+
+``run`` and ``call`` wait for the loop thread, so calling them from a
+coroutine already running on it would deadlock: they raise
+``RuntimeError`` instead; ``await`` the coroutine there. ``close()``
+cancels whatever is still running, like ``asyncio.run`` does at exit; the
+shared runtime is closed at interpreter exit. ``python -m
+benchmarks.runtime`` compares the per-call cost with ``asyncio.run``.
+"""
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, List, Optional
+
+
+class AsyncRuntime:
+    """An event loop running on its own daemon thread until ``close()``."""
+
+    def __init__(self, name: str = "async-runtime", debug: bool = False):
+        self.name = name
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_debug(debug)
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                _cancel_all_tasks(self.loop)
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+                self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            finally:
+                asyncio.set_event_loop(None)
+                self.loop.close()
+
+    def __enter__(self) -> "AsyncRuntime":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return not self._thread.is_alive()
+
+    def _check(self, coro=None, wait: bool = True) -> None:
+        if self.closed:
+            problem = f"{self.name} is closed"
+        elif wait and threading.current_thread() is self._thread:
+            problem = f"cannot wait for {self.name} from its own loop thread; await instead"
+        else:
+            return
+        if asyncio.iscoroutine(coro):
+            coro.close()   # refused: don't leave it to warn "never awaited"
+        raise RuntimeError(problem)
+
+    # ----- submitting work -----
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """Schedule ``coro`` on the loop; return a ``concurrent.futures.Future``."""
+        self._check(coro, wait=False)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run ``coro`` on the loop and return its result (``asyncio.run`` without the loop setup)."""
+        self._check(coro)
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call ``func(*args)`` on the loop thread and return its result."""
+        self._check()
+        future: Future = Future()
+
+        def step():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        self.loop.call_soon_threadsafe(step)
+        return future.result()
+
+    @contextmanager
+    def monitored(self, monitor) -> Iterator[Any]:
+        """Attach a ``pycourse.loopmon.LoopMonitor`` to the loop for the block."""
+        self.call(monitor.attach, self.loop)
+        try:
+            yield monitor
+        finally:
+            self.call(monitor.detach)
+
+    def close(self) -> None:
+        """Cancel what is still running, shut the loop down and join its thread."""
+        if self.closed:
+            return
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(f"cannot close {self.name} from its own loop thread")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    # What asyncio.run does with the tasks left over when main() returns.
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler({
+                "message": "unhandled exception during AsyncRuntime.close()",
+                "exception": task.exception(),
+                "task": task,
+            })
+
+
+# ============================================
+# Shared runtime
+# ============================================
+
+_shared: Optional[AsyncRuntime] = None
+_shared_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """The process-wide runtime, started on first use (and again after ``close()``)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None or _shared.closed:
+            _shared = AsyncRuntime("shared-async-runtime")
+        return _shared
+
+
+def run(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """``get_runtime().run(coro)``: ``asyncio.run`` on the shared loop."""
+    return get_runtime().run(coro, timeout)
+
+
+# ============================================
+# Routing asyncio.run
+# ============================================
+
+# The one place asyncio.run is replaced: patch_asyncio_run here and
+# LoopMonitor.patch_asyncio_run both push a route, and the innermost active
+# route handles each call. asyncio.run is restored when the last one ends.
+_real_asyncio_run = asyncio.run
+_routes: List[Callable[[Any, Optional[bool]], Any]] = []
+_routes_lock = threading.Lock()
+
+
+def _routed_run(main, *, debug=None):
+    with _routes_lock:
+        route = _routes[-1] if _routes else None
+    if route is None:   # kept by someone after the block ended
+        return _real_asyncio_run(main, debug=debug)
+    return route(main, debug)
+
+
+@contextmanager
+def route_asyncio_run(route: Callable[[Any, Optional[bool]], Any]) -> Iterator[None]:
+    """Send every ``asyncio.run(main, debug=...)`` in the block to ``route(main, debug)``."""
+    with _routes_lock:
+        _routes.append(route)
+        asyncio.run = _routed_run
+    try:
+        yield
+    finally:
+        with _routes_lock:
+            # Blocks may end out of order (on different threads); drop this one.
+            for i in range(len(_routes) - 1, -1, -1):
+                if _routes[i] is route:
+                    del _routes[i]
+                    break
+            if not _routes:
+                asyncio.run = _real_asyncio_run
+
+
+@contextmanager
+def patch_asyncio_run(runtime: Optional[AsyncRuntime] = None) -> Iterator[None]:
+    """Route every ``asyncio.run`` call in the block to ``runtime``.
+
+    Without ``runtime`` the calls go to the shared one, which is only
+    started if ``asyncio.run`` is actually called.
+    """
+    with route_asyncio_run(lambda main, debug: (runtime or get_runtime()).run(main)):
+        yield
+
+
+@atexit.register
+def _close_shared() -> None:
+    if _shared is not None:
+        _shared.close()
@@ -0,0 +1,512 @@
+"""Where does the course cover X? An index of every chapter section.
+
+    python -m pycourse.search build              # (re)index changed chapters
+    python -m pycourse.search query regex email  # keyword search
+    python -m pycourse.search query deco         # the last word is a prefix
+    python -m pycourse.search section 23.2       # one section by number
+
+The three course scripts are parsed with ``ast``, never run. Each
+``chapter_N`` function is cut into documents at its ``print("\\nN.M Title:")``
+headings (the code before the first heading is the chapter's own
+document), and every document is indexed by:
+
+* the words of its section title (and, weighted lower, its chapter title,
+  taken from ``banner("CHAPTER N: ...")`` or the ``# N. TITLE`` comment);
+* identifiers: names, attributes, functions, arguments, imported names
+  and the names passed to ``listing()``;
+* code tokens: the words inside string literals, which is where the
+  printed example code lives, and in the ``pycourse.core`` definitions
+  the chapter shows with ``listing()``.
+
+In code:
+
+    index = SearchIndex.load()          # or SearchIndex.build()
+    index.search("async gather")        # [Hit(course='advanced', chapter=25, section='25.2', ...)]
+    index.section("14.2")               # [Hit(...)] in every course that has it
+    index.complete("comp")              # ['comparison', 'complete', 'comprehension', ...]
+
+The index is one marshal file next to the bytecode
+(``pycourse/__pycache__/search.<cache_tag>.marshal``): a sorted term list
+and, per term, its postings as delta-encoded ``(document, weight)``
+varints. Loading it reads that one file; lookups are a bisect over the
+terms plus a dict merge, well under a millisecond. ``build`` re-parses a
+script only when its size or mtime changed, and re-extracts only the
+chapters whose source text (or listed definitions) changed; every other
+chapter's documents are reused from the previous index.
+"""
+
+import marshal
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .listing import definitions, source
+from .runner import COURSES, course_path
+
+INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__",
+                          f"search.{sys.implementation.cache_tag}.marshal")
+FORMAT = 3
+
+# Per-field weights; a term keeps its highest weight within a document.
+TITLE, CHAPTER_TITLE, IDENTIFIER, TOKEN = 8, 4, 2, 1
+
+_WORD = re.compile(r"[a-z_][a-z0-9_]*|\d+")
+_HEADING = re.compile(r"\s*(\d+\.\d+)\s+([^:\n]*)")
+_CHAPTER_BANNER = re.compile(r"CHAPTER\s+(\d+):?\s*(.*)", re.IGNORECASE)
+_CHAPTER_COMMENT = re.compile(r"#\s*(?:CHAPTER\s+)?(\d+)[.:]\s*(.+)", re.IGNORECASE)
+
+
+class Hit(NamedTuple):
+    course: str
+    chapter: int
+    section: Optional[str]     # "14.2", or None for the chapter's own document
+    title: str
+    line: int
+    score: int
+
+
+# ============================================
+# Extraction
+# ============================================
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _leading_text(node) -> Optional[str]:
+    """The literal text a ``str`` or f-string node starts with."""
+    import ast
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        text = ""
+        for part in node.values:
+            if not (isinstance(part, ast.Constant) and isinstance(part.value, str)):
+                break
+            text += part.value
+        return text
+    return None
+
+
+def _call_name(node) -> Optional[str]:
+    import ast
+
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name):
+            return node.func.id
+        if isinstance(node.func, ast.Attribute):
+            return node.func.attr
+    return None
+
+
+def _chapter_title(function, lines: List[str]) -> str:
+    import ast
+
+    for node in ast.walk(function):
+        if _call_name(node) == "banner" and node.args:
+            match = _CHAPTER_BANNER.match(_leading_text(node.args[0]) or "")
+            if match:
+                return match.group(2).strip()
+    # The "# N. TITLE" comment banner above the function.
+    for line in reversed(lines[max(0, function.lineno - 6):function.lineno - 1]):
+        match = _CHAPTER_COMMENT.match(line.strip())
+        if match:
+            return match.group(2).strip()
+    return function.name
+
+
+def _aliases(tree) -> Dict[str, str]:
+    """Module-level names bound to modules: ``regex = lazy_import("pycourse.core.regex")``."""
+    import ast
+
+    aliases = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and _call_name(node.value) == "lazy_import"
+                and node.value.args and isinstance(node.value.args[0], ast.Constant)):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    aliases[target.id] = node.value.args[0].value
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                aliases[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+    return aliases
+
+
+def _listed(node, aliases: Dict[str, str]) -> List[Tuple[str, str]]:
+    """``(module, name)`` of each definition a ``listing(...)`` call shows."""
+    import ast
+
+    if _call_name(node) != "listing" or not node.args or not isinstance(node.args[0], ast.Name):
+        return []
+    module = aliases.get(node.args[0].id)
+    if module is None:
+        return []
+    return [(module, arg.value) for arg in node.args[1:]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str)]
+
+
+def _listed_sha(module: str, name: str) -> str:
+    try:
+        return definitions(module).get(name, "")
+    except (ImportError, OSError, SyntaxError):
+        return ""
+
+
+def _listed_source(module: str, name: str) -> str:
+    try:
+        return source(module, name)
+    except (LookupError, ImportError, OSError, SyntaxError):
+        return ""
+
+
+def _extract_chapter(function, lines: List[str], aliases: Dict[str, str]) -> List[tuple]:
+    """``(section, title, line, {term: weight})`` for each document of a chapter."""
+    import ast
+
+    chapter_title = _chapter_title(function, lines)
+    starts = [(function.lineno, None, chapter_title)]
+    for node in ast.walk(function):
+        if _call_name(node) == "print" and node.args:
+            match = _HEADING.match(_leading_text(node.args[0]) or "")
+            if match:
+                starts.append((node.lineno, match.group(1), match.group(2).strip().strip("\"'")))
+    starts.sort(key=lambda start: start[0])
+    first_lines = [line for line, _, _ in starts]
+    documents = [{} for _ in starts]
+
+    def add(position: int, words: Iterable[str], weight: int) -> None:
+        terms = documents[position]
+        for word in words:
+            if terms.get(word, 0) < weight:
+                terms[word] = weight
+
+    for position, (_, section, title) in enumerate(starts):
+        add(position, _words(title), TITLE)
+        add(position, _words(chapter_title), TITLE if section is None else CHAPTER_TITLE)
+    for node in ast.walk(function):
+        lineno = getattr(node, "lineno", None)
+        if lineno is None or node is function:
+            continue
+        position = max(0, bisect_left(first_lines, lineno + 1) - 1)
+        if isinstance(node, ast.Name):
+            names = [node.id]
+        elif isinstance(node, ast.Attribute):
+            names = [node.attr]
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names = [node.name]
+        elif isinstance(node, ast.arg):
+            names = [node.arg]
+        elif isinstance(node, ast.keyword) and node.arg:
+            names = [node.arg]
+        elif isinstance(node, ast.alias) and node.name != "*":
+            names = (node.asname or node.name).split(".")
+        else:
+            names = []
+        for module, name in _listed(node, aliases):
+            names += name.split(".")
+            add(position, _words(_listed_source(module, name)), TOKEN)
+        for name in names:
+            add(position, [name.lower()], IDENTIFIER)
+            add(position, _words(name.replace("_", " ")), TOKEN)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            add(position, _words(node.value), TOKEN)
+    return [(section, title, line, terms)
+            for (line, section, title), terms in zip(starts, documents)]
+
+
+def _chapters(path: str, previous: Dict[int, tuple]) -> Tuple[Dict[int, tuple], int, list]:
+    """``{number: (sha, documents)}`` for a script, how many chapters were
+    re-extracted, and every ``(module, name)`` it lists."""
+    import ast
+    import hashlib
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    lines = text.splitlines()
+    tree = ast.parse(text)
+    aliases = _aliases(tree)
+    chapters = {}
+    extracted = 0
+    listed = []
+    for node in tree.body:
+        match = re.fullmatch(r"chapter_(\d+)", getattr(node, "name", ""))
+        if not isinstance(node, ast.FunctionDef) or not match:
+            continue
+        number = int(match.group(1))
+        # The comment banner above the function is part of what is indexed,
+        # and so are the definitions it lists.
+        digest = hashlib.sha256("\n".join(lines[max(0, node.lineno - 6):node.end_lineno]).encode("utf-8"))
+        for child in ast.walk(node):
+            for module, name in _listed(child, aliases):
+                listed.append((module, name))
+                digest.update(_listed_sha(module, name).encode("ascii"))
+        sha = digest.hexdigest()
+        if number in previous and previous[number][0] == sha:
+            chapters[number] = previous[number]
+        else:
+            chapters[number] = (sha, _extract_chapter(node, lines, aliases))
+            extracted += 1
+    return chapters, extracted, listed
+
+
+def _listed_digest(listed: list) -> str:
+    import hashlib
+
+    return hashlib.sha256("".join(_listed_sha(m, n) for m, n in listed).encode("ascii")).hexdigest()
+
+
+def _changed(script: str, entry: tuple) -> bool:
+    _, mtime_ns, size, listed, listed_digest, _ = entry
+    try:
+        stat = os.stat(script)
+    except OSError:
+        return True
+    return ((stat.st_mtime_ns, stat.st_size) != (mtime_ns, size)
+            or _listed_digest(listed) != listed_digest)
+
+
+# ============================================
+# Postings encoding
+# ============================================
+
+def _encode(postings: List[Tuple[int, int]]) -> bytes:
+    """Sorted ``(document, weight)`` pairs as delta-encoded varints."""
+    out = bytearray()
+    previous = 0
+    for document, weight in postings:
+        for value in (document - previous, weight):
+            while value >= 0x80:
+                out.append(value & 0x7F | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = document
+    return bytes(out)
+
+
+def _decode(data: bytes) -> Dict[int, int]:
+    postings = {}
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value)
+        value = shift = 0
+    document = 0
+    for i in range(0, len(values), 2):
+        document += values[i]
+        postings[document] = values[i + 1]
+    return postings
+
+
+# ============================================
+# Index
+# ============================================
+
+class SearchIndex:
+    """Course sections, the sorted term list and each term's postings."""
+
+    def __init__(self, documents: List[tuple], postings: Dict[str, bytes], sources: dict):
+        self.documents = documents                 # (course, chapter, section, title, line)
+        self.terms = sorted(postings)
+        self._postings = postings
+        self._decoded: Dict[str, Dict[int, int]] = {}
+        # path -> (course, mtime_ns, size, listed, listed digest, chapters)
+        self.sources = sources
+        self.stats = {"files": 0, "chapters": 0}   # re-parsed by the last build()
+
+    # ----- building and storage -----
+
+    @classmethod
+    def build(cls, path: str = INDEX_FILE, courses: Iterable[str] = tuple(COURSES),
+              force: bool = False) -> "SearchIndex":
+        """Index ``courses``, reusing unchanged chapters of the index at ``path``."""
+        data = {} if force else cls._read(path)
+        previous = data.get("sources", {})
+        sources = {}
+        stats = {"files": 0, "chapters": 0}
+        for course in courses:
+            script = course_path(course)
+            old = previous.get(script)
+            if old and old[0] == course and not _changed(script, old):
+                sources[script] = old
+                continue
+            chapters, extracted, listed = _chapters(script, old[5] if old else {})
+            stats["files"] += 1
+            stats["chapters"] += extracted
+            stat = os.stat(script)
+            sources[script] = (course, stat.st_mtime_ns, stat.st_size, listed,
+                               _listed_digest(listed), chapters)
+        if data and not stats["files"] and sources.keys() == previous.keys():
+            index = cls(data["documents"], data["postings"], data["sources"])
+        else:
+            index = cls._from_sources(sources)
+            index.save(path)
+        index.stats = stats
+        return index
+
+    @classmethod
+    def _from_sources(cls, sources: dict) -> "SearchIndex":
+        documents = []
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for course, _, _, _, _, chapters in sources.values():
+            for number in sorted(chapters):
+                for section, title, line, terms in chapters[number][1]:
+                    document = len(documents)
+                    documents.append((course, number, section, title, line))
+                    for term, weight in terms.items():
+                        postings.setdefault(term, []).append((document, weight))
+        return cls(documents, {term: _encode(p) for term, p in postings.items()}, sources)
+
+    @staticmethod
+    def _read(path: str) -> dict:
+        try:
+            with open(path, "rb") as f:
+                data = marshal.load(f)
+        except (OSError, ValueError, EOFError, TypeError):
+            return {}
+        return data if isinstance(data, dict) and data.get("format") == FORMAT else {}
+
+    @classmethod
+    def load(cls, path: str = INDEX_FILE) -> "SearchIndex":
+        """The index at ``path``, built first if there is none."""
+        data = cls._read(path)
+        if not data:
+            return cls.build(path)
+        index = cls(data["documents"], data["postings"], data["sources"])
+        return index
+
+    def save(self, path: str = INDEX_FILE) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump({"format": FORMAT, "documents": self.documents,
+                          "postings": self._postings, "sources": self.sources}, f)
+        os.replace(tmp, path)
+
+    @property
+    def stale(self) -> bool:
+        """Whether a course script, or a definition it lists, changed since the build."""
+        return any(_changed(script, entry) for script, entry in self.sources.items())
+
+    # ----- lookups -----
+
+    def _postings_of(self, term: str) -> Dict[int, int]:
+        postings = self._decoded.get(term)
+        if postings is None:
+            postings = self._decoded[term] = _decode(self._postings[term])
+        return postings
+
+    def complete(self, prefix: str, limit: int = 20) -> List[str]:
+        """Indexed terms starting with ``prefix``, in order."""
+        prefix = prefix.lower()
+        start = bisect_left(self.terms, prefix)
+        found = []
+        for term in self.terms[start:]:
+            if not term.startswith(prefix) or len(found) == limit:
+                break
+            found.append(term)
+        return found
+
+    def _matches(self, word: str, prefix: bool) -> Dict[int, int]:
+        if not prefix:
+            return self._postings_of(word) if word in self._postings else {}
+        scores: Dict[int, int] = {}
+        for term in self.complete(word, limit=len(self.terms)):
+            # An exact match counts double a longer term it is a prefix of.
+            bonus = 2 if term == word else 1
+            for document, weight in self._postings_of(term).items():
+                score = weight * bonus
+                if scores.get(document, 0) < score:
+                    scores[document] = score
+        return scores
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Hit]:
+        """Sections matching every word of ``query``, best first.
+
+        With ``prefix`` the last word also matches longer terms (``deco``
+        finds ``decorator``); the other words must match whole terms.
+        """
+        words = _words(query)
+        if not words:
+            return []
+        scores: Optional[Dict[int, int]] = None
+        for i, word in enumerate(words):
+            matches = self._matches(word, prefix and i == len(words) - 1)
+            if scores is None:
+                scores = dict(matches)
+            else:
+                scores = {d: s + matches[d] for d, s in scores.items() if d in matches}
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [Hit(*self.documents[document], score) for document, score in ranked]
+
+    def section(self, number: str) -> List[Hit]:
+        """The section numbered ``number`` (``"23.2"``), or chapter ``"23"``'s own document."""
+        if "." in number:
+            return [Hit(*d, 0) for d in self.documents if d[2] == number]
+        return [Hit(*d, 0) for d in self.documents if d[2] is None and str(d[1]) == number]
+
+
+def _format(hit: Hit) -> str:
+    where = f"{hit.course} ch.{hit.chapter}" + (f" §{hit.section}" if hit.section else "")
+    return f"{where:<22} {hit.title:<40} {COURSES[hit.course]}:{hit.line}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Search the course sections.")
+    parser.add_argument("--index", default=INDEX_FILE, help="index file (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("build", help="index the course scripts (changed chapters only)")
+    command.add_argument("--force", action="store_true", help="re-extract every chapter")
+    command = commands.add_parser("query", help="sections matching every word")
+    command.add_argument("words", nargs="+")
+    command.add_argument("--limit", type=int, default=10)
+    command.add_argument("--exact", action="store_true", help="no prefix matching for the last word")
+    command = commands.add_parser("section", help="look a section up by number (23.2)")
+    command.add_argument("number")
+    command = commands.add_parser("complete", help="indexed terms with this prefix")
+    command.add_argument("prefix")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    if args.command == "build":
+        start = time.perf_counter()
+        index = SearchIndex.build(args.index, force=args.force)
+        print(f"{len(index.documents)} sections, {len(index.terms)} terms; re-parsed "
+              f"{index.stats['files']} files, {index.stats['chapters']} chapters in "
+              f"{1000 * (time.perf_counter() - start):.1f} ms "
+              f"({os.path.getsize(args.index)} bytes)", file=sys.stderr)
+        return 0
+
+    index = SearchIndex.load(args.index)
+    if index.stale:
+        index = SearchIndex.build(args.index)
+    start = time.perf_counter()
+    if args.command == "query":
+        results = index.search(" ".join(args.words), args.limit, prefix=not args.exact)
+    elif args.command == "section":
+        results = index.section(args.number)
+    else:
+        results = index.complete(args.prefix)
+    elapsed = time.perf_counter() - start
+    for result in results:
+        print(result if isinstance(result, str) else _format(result))
+    print(f"{len(results)} results in {1e6 * elapsed:.0f} us", file=sys.stderr)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Lazy, range-backed versions of chapter 5's list comprehensions.
+
+``[x**2 for x in range(10)]`` and ``[x for x in range(20) if x % 2 == 0]``
+build every element before ``evens[:5]`` shows five of them. The views
+here compute elements on demand, so a hundred million squares take a few
+hundred bytes:
+
+    squares = power_view(range(10**8), 2)     # [x**2 for x in range(10**8)]
+    squares[12_345]                           # 152399025, computed on access
+    squares[:5].tolist()                      # [0, 1, 4, 9, 16]
+    152399025 in squares                      # integer square root: O(1)
+    squares.index(152399025)                  # 12345, O(1)
+
+    evens = multiples(range(20), 2)           # [x for x in range(20) if x % 2 == 0]
+    evens                                     # range(0, 20, 2): already lazy
+    evens[:5], 2 in evens, len(evens)         # O(1), like any range
+
+    cubes_plus = MappedView(lambda x: x**3 + 1, range(10**8))
+
+Every view supports ``len``, indexing (negative too), slicing (which gives
+another view, without computing anything), iteration, ``reversed``,
+``in``, ``index`` and ``count``. ``in``, ``index`` and ``count`` scan a
+``MappedView`` element by element, since an arbitrary function cannot be
+inverted; ``PowerView`` over a ``range`` inverts ``x**k`` with an integer
+root for an ``int`` value and asks the range, so they are O(1) there.
+"""
+
+from collections.abc import Sequence
+from math import gcd, isqrt
+from typing import Any, Callable, List
+
+
+class MappedView(Sequence):
+    """``[func(x) for x in base]``, computed one element at a time."""
+
+    __slots__ = ("func", "base")
+
+    def __init__(self, func: Callable[[Any], Any], base: Sequence):
+        self.func = func
+        self.base = base
+
+    def _view(self, base: Sequence) -> "MappedView":
+        return MappedView(self.func, base)
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(self.base[index])
+        return self.func(self.base[index])
+
+    def __iter__(self):
+        return map(self.func, self.base)
+
+    def __reversed__(self):
+        return map(self.func, reversed(self.base))
+
+    def __contains__(self, value) -> bool:
+        return value in map(self.func, self.base)
+
+    def index(self, value, start: int = 0, stop: int = None) -> int:
+        base = self.base[start:stop]
+        for i, item in enumerate(map(self.func, base)):
+            if item is value or item == value:
+                return range(len(self.base))[start:stop][i]
+        raise ValueError(f"{value!r} is not in view")
+
+    def count(self, value) -> int:
+        return sum(1 for item in map(self.func, self.base) if item is value or item == value)
+
+    def tolist(self) -> List[Any]:
+        return list(map(self.func, self.base))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MappedView):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        name = getattr(self.func, "__qualname__", repr(self.func))
+        return f"MappedView({name}, {self.base!r})"
+
+
+class PowerView(MappedView):
+    """``[x**exponent for x in base]``; ``in``/``index``/``count`` in O(1) over a ``range``."""
+
+    __slots__ = ("exponent",)
+
+    def __init__(self, base: Sequence, exponent: int):
+        if not isinstance(exponent, int) or exponent < 1:
+            raise ValueError(f"exponent must be a positive integer, not {exponent!r}")
+        super().__init__(lambda x, _k=exponent: x ** _k, base)
+        self.exponent = exponent
+
+    def _view(self, base: Sequence) -> "PowerView":
+        return PowerView(base, self.exponent)
+
+    # Inline ``x ** k`` rather than calling the lambda once per element.
+    def __iter__(self):
+        k = self.exponent
+        return (x ** k for x in self.base)
+
+    def __reversed__(self):
+        k = self.exponent
+        return (x ** k for x in reversed(self.base))
+
+    def tolist(self) -> List[int]:
+        k = self.exponent
+        return [x ** k for x in self.base]
+
+    def _by_roots(self, value) -> bool:
+        # Only a range base holds nothing but ints, and only an exact int
+        # compares like one: a list base may hold 1.5 (1.5**2 == 2.25) and
+        # True == 1 without being an int.
+        return type(value) is int and isinstance(self.base, range)
+
+    def _roots(self, value: int) -> List[int]:
+        """The integers ``x`` with ``x**exponent == value``."""
+        k = self.exponent
+        if value < 0:
+            if k % 2 == 0:
+                return []
+            root = -_iroot(-value, k)
+            return [root] if root ** k == value else []
+        root = _iroot(value, k)
+        if root ** k != value:
+            return []
+        return [root, -root] if k % 2 == 0 and root else [root]
+
+    def __contains__(self, value) -> bool:
+        if not self._by_roots(value):
+            return super().__contains__(value)
+        return any(root in self.base for root in self._roots(value))
+
+    def index(self, value, start: int = 0, stop: int = None) -> int:
+        if not self._by_roots(value):
+            return super().index(value, start, stop)
+        positions = range(len(self.base))[start:stop]
+        found = [self.base.index(root) for root in self._roots(value) if root in self.base]
+        found = [i for i in found if i in positions]
+        if not found:
+            raise ValueError(f"{value!r} is not in view")
+        return min(found)
+
+    def count(self, value) -> int:
+        if not self._by_roots(value):
+            return super().count(value)
+        return sum(self.base.count(root) for root in self._roots(value))
+
+    def __repr__(self) -> str:
+        return f"PowerView({self.base!r}, {self.exponent})"
+
+
+def _iroot(value: int, k: int) -> int:
+    """The largest integer ``r`` with ``r**k <= value``, for ``value >= 0``."""
+    if k == 1 or value < 2:
+        return value
+    if k == 2:
+        return isqrt(value)
+    # Newton's method, starting above the root so it decreases monotonically.
+    root = 1 << -(-value.bit_length() // k)
+    while True:
+        smaller = ((k - 1) * root + value // root ** (k - 1)) // k
+        if smaller >= root:
+            return root
+        root = smaller
+
+
+def power_view(base: Sequence, exponent: int = 2) -> PowerView:
+    """``[x**exponent for x in base]`` as a lazy view."""
+    return PowerView(base, exponent)
+
+
+def multiples(base: range, modulus: int, remainder: int = 0) -> range:
+    """``[x for x in base if x % modulus == remainder]``, as a ``range``.
+
+    The elements of a range that leave a given remainder are themselves
+    evenly spaced, so the result needs no view at all.
+    """
+    if modulus == 0:
+        raise ZeroDivisionError("integer modulo by zero")
+    period = abs(modulus) // gcd(base.step, modulus)
+    for first in range(min(period, len(base))):
+        if base[first] % modulus == remainder:
+            return base[first::period]
+    return base[0:0]
@@ -0,0 +1,227 @@
+"""Batch versions of chapter 8's string methods.
+
+Chapter 8 calls ``text.lower()``, ``text.title()``, ``text.replace(...)``
+one string at a time. A ``StringChain`` records the same calls once and
+applies all of them to every string of a list or stream:
+
+    normalize = StringChain().strip().lower().replace("  ", " ").title()
+    names = normalize(raw_names)                      # list in, list out
+    for name in normalize.stream(open("names.txt")):  # lazy, one line at a time
+        ...
+    names = normalize(raw_names, processes=4)         # chunks across processes
+    names = normalize(raw_names, backend="numpy")     # numpy.strings / numpy.char
+
+The chain is compiled into one list comprehension (``[s.strip().lower()...
+for s in strings]``), so each string goes through every step in a single
+pass, no list is built between steps, and the result runs exactly as fast
+as the hand-written comprehension would. ``split`` must come last; it turns each string into a
+list of parts.
+
+The NumPy backend is optional: it uses ``numpy.strings`` with
+``StringDType`` on NumPy 2 and ``numpy.char`` on older versions, and raises
+``ImportError`` when NumPy is not installed. It works a whole array per
+step, so it is worth measuring (``python -m benchmarks.strings``) before
+choosing it over the default ``"python"`` backend. Results are always the
+Python backend's: a chain with a step NumPy has no function for
+(``casefold``), or applied to strings or arguments containing ``"\\x00"``
+(which ``<U`` arrays drop at the end and ``numpy.strings`` strips as
+whitespace), runs on the Python backend instead.
+"""
+
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNK_SIZE = 10_000
+BACKENDS = ("python", "numpy")
+
+# Chapter 8 methods plus the strip family, with the arguments they accept.
+_METHODS = {
+    "lower": 0, "upper": 0, "title": 0, "capitalize": 0, "casefold": 0, "swapcase": 0,
+    "strip": 1, "lstrip": 1, "rstrip": 1, "replace": 3, "split": 2,
+}
+
+
+class StringChain:
+    """A recorded sequence of ``str`` method calls, applied to many strings."""
+
+    def __init__(self, steps: Tuple[Tuple[str, tuple], ...] = ()):
+        self.steps = tuple(steps)
+        self._function = None  # (per string, list, generator), compiled on first use
+
+    # ----- building -----
+
+    def _then(self, method: str, *args) -> "StringChain":
+        # Trailing defaults are dropped, so repr() and the compiled call read
+        # like the method calls they stand for.
+        defaults = {"strip": (None,), "lstrip": (None,), "rstrip": (None,),
+                    "replace": (None, None, -1), "split": (None, -1)}.get(method, ())
+        while args and args[-1] == defaults[len(args) - 1]:
+            args = args[:-1]
+        if self.steps and self.steps[-1][0] == "split":
+            raise ValueError("split() must be the last step of a chain")
+        if len(args) > _METHODS[method]:
+            raise TypeError(f"{method}() takes at most {_METHODS[method]} arguments")
+        for arg in args:
+            if not (arg is None or type(arg) in (str, int)):
+                raise TypeError(f"{method}() arguments must be str, int or None, not {type(arg).__name__}")
+        return StringChain(self.steps + ((method, args),))
+
+    def lower(self) -> "StringChain":
+        return self._then("lower")
+
+    def upper(self) -> "StringChain":
+        return self._then("upper")
+
+    def title(self) -> "StringChain":
+        return self._then("title")
+
+    def capitalize(self) -> "StringChain":
+        return self._then("capitalize")
+
+    def casefold(self) -> "StringChain":
+        return self._then("casefold")
+
+    def swapcase(self) -> "StringChain":
+        return self._then("swapcase")
+
+    def strip(self, chars: Optional[str] = None) -> "StringChain":
+        return self._then("strip", chars)
+
+    def lstrip(self, chars: Optional[str] = None) -> "StringChain":
+        return self._then("lstrip", chars)
+
+    def rstrip(self, chars: Optional[str] = None) -> "StringChain":
+        return self._then("rstrip", chars)
+
+    def replace(self, old: str, new: str, count: int = -1) -> "StringChain":
+        return self._then("replace", old, new, count)
+
+    def split(self, sep: Optional[str] = None, maxsplit: int = -1) -> "StringChain":
+        return self._then("split", sep, maxsplit)
+
+    def __repr__(self) -> str:
+        calls = "".join(f".{method}({', '.join(map(repr, args))})" for method, args in self.steps)
+        return f"StringChain(){calls}"
+
+    # ----- compiling -----
+
+    def _expression(self) -> str:
+        # Arguments are str, int or None, so repr() is an exact literal and
+        # the compiled code is the same as a hand-written method chain.
+        expression = "s"
+        for method, args in self.steps:
+            expression = f"{expression}.{method}({', '.join(map(repr, args))})"
+        return expression
+
+    def _compiled(self) -> Tuple[Callable, Callable, Callable]:
+        if self._function is None:
+            expression = self._expression()
+            self._function = (eval(f"lambda s: {expression}", {}),
+                              eval(f"lambda strings: [{expression} for s in strings]", {}),
+                              eval(f"lambda strings: ({expression} for s in strings)", {}))
+        return self._function
+
+    @property
+    def function(self) -> Callable[[str], Any]:
+        """The whole chain as one ``str -> result`` function."""
+        return self._compiled()[0]
+
+    def __getstate__(self):
+        # The compiled lambda cannot be pickled; workers recompile it.
+        return self.steps
+
+    def __setstate__(self, steps):
+        self.steps = steps
+        self._function = None
+
+    # ----- applying -----
+
+    def __call__(self, strings: Iterable[str], processes: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, backend: str = "python") -> List[Any]:
+        """Apply the chain to every string; results keep the input order.
+
+        ``processes`` > 1 splits the input into ``chunk_size`` chunks and
+        spreads them over that many worker processes.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown backend {backend!r}, expected one of {BACKENDS}")
+        if processes and processes > 1:
+            results = []
+            for chunk in self._map_chunks(strings, processes, chunk_size, backend):
+                results.extend(chunk)
+            return results
+        if backend == "numpy":
+            return _numpy_apply(self, list(strings))
+        return self._compiled()[1](strings)
+
+    def stream(self, strings: Iterable[str], processes: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """Lazily apply the chain; with ``processes``, a few chunks are in flight at a time."""
+        if processes and processes > 1:
+            for chunk in self._map_chunks(strings, processes, chunk_size, "python"):
+                yield from chunk
+        else:
+            yield from self._compiled()[2](strings)
+
+    def _apply_chunk(self, chunk: List[str], backend: str) -> List[Any]:
+        return self(chunk, backend=backend)
+
+    def _map_chunks(self, strings: Iterable[str], processes: int, chunk_size: int,
+                    backend: str) -> Iterator[List[Any]]:
+        from concurrent.futures import ProcessPoolExecutor
+
+        iterator = iter(strings)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            # Keep two chunks per process queued: enough to stay busy, while
+            # an unbounded stream is never read ahead further than that.
+            in_flight = [pool.submit(self._apply_chunk, chunk, backend)
+                         for chunk in islice(chunks, 2 * processes)]
+            while in_flight:
+                done = in_flight.pop(0)
+                for chunk in islice(chunks, 1):
+                    in_flight.append(pool.submit(self._apply_chunk, chunk, backend))
+                yield done.result()
+
+
+# ============================================
+# NumPy backend
+# ============================================
+
+def numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _numpy_apply(chain: StringChain, strings: List[str]) -> List[Any]:
+    import numpy as np
+
+    if hasattr(np, "strings") and hasattr(np, "dtypes") and hasattr(np.dtypes, "StringDType"):
+        module, dtype = np.strings, np.dtypes.StringDType()
+    else:
+        module, dtype = np.char, str
+    functions = [getattr(module, method, None) or getattr(np.char, method, None)
+                 for method, _ in chain.steps]
+    # casefold has no NumPy function, <U arrays drop trailing NULs and
+    # numpy.strings strips NULs as whitespace: those chains run in Python,
+    # so the backend never changes a result.
+    missing = any(function is None and method != "split"
+                  for function, (method, _) in zip(functions, chain.steps))
+    nul = (any("\x00" in arg for _, args in chain.steps for arg in args if type(arg) is str)
+           or any("\x00" in text for text in strings))
+    if missing or nul:
+        return chain._compiled()[1](strings)
+    array = np.array(strings, dtype=dtype)
+    for function, (method, args) in zip(functions, chain.steps):
+        if method == "split":
+            # split has no vectorized form (it yields a list per string), and
+            # it is always the last step.
+            return [text.split(*args) for text in array.tolist()]
+        if method == "replace" and len(args) == 3 and args[2] < 0:
+            array = function(array, args[0], args[1])
+        else:
+            array = function(array, *args)
+    return array.tolist()
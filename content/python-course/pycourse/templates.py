@@ -0,0 +1,192 @@
+"""Precompiled output templates for reports over many records.
+
+Chapter 8.2 formats one line three ways: f-strings, ``.format`` and ``%``.
+A report over thousands of learners formats the same layout thousands of
+times; ``.format`` re-parses the layout on every call. A ``Template``
+parses a ``.format``-style layout once and compiles it into an f-string:
+
+    row = Template("  {index}. [{status}] {task}")
+    row.render(index=0, status="O", task="Learn Python")
+    lines = row.render_many(records)          # records: mappings
+    text = row.join(records)                  # one string, rows joined by "\\n"
+    BANNER.render_values(titles)              # one-field layouts take bare values
+
+    pair = Template("{0:>4} {1}")             # positional: records are tuples
+    pair.render_many([(1, "a"), (2, "b")])
+
+Field names may use attribute and index lookups (``{0.name}``,
+``{todo[task]}``), conversions (``!r``) and format specs (``:>10``), as in
+``str.format``. ``BANNER`` and ``TODO_ROW`` render the chapter banner and
+the ``TodoApp.show_todos`` rows; ``banners()`` and ``todo_rows()`` render
+many of them at once.
+"""
+
+import _string
+import keyword
+from typing import Any, Dict, Iterable, List, Sequence, TextIO, Tuple
+
+
+class Template:
+    """A ``str.format`` layout compiled once into an f-string."""
+
+    __slots__ = ("layout", "fields", "positional", "_one", "_many", "_values")
+
+    def __init__(self, layout: str):
+        self.layout = layout
+        parts, keys = _parse(layout)
+        fields = tuple(first for _, first, _, _ in parts if first is not None)
+        positional = all(isinstance(f, int) for f in fields)
+        if not positional and any(isinstance(f, int) for f in fields):
+            raise ValueError(f"cannot mix positional and named fields in {layout!r}")
+        self.fields: Tuple[Any, ...] = fields
+        self.positional = positional
+        namespace: Dict[str, Any] = dict(keys, _getattr=getattr)
+        one = _source(parts, lambda first: f"r[{first}]")
+        self._one = eval(f"lambda r: {one}", namespace)
+        if positional and fields:
+            # Unpacking a tuple into locals is cheaper than indexing it once
+            # per field, so rows of a positional layout are unpacked.
+            names = ", ".join(f"_{i}" for i in range(max(fields) + 1))
+            many = _source(parts, lambda first: f"_{first}")
+            self._many = eval(f"lambda rows: [{many} for ({names},) in rows]", namespace)
+        else:
+            self._many = eval(f"lambda rows: [{one} for r in rows]", namespace)
+        if len(set(fields)) == 1:
+            each = _source(parts, lambda first: "v")
+            self._values = eval(f"lambda values: [{each} for v in values]", namespace)
+        else:
+            self._values = None
+
+    def __repr__(self) -> str:
+        return f"Template({self.layout!r})"
+
+    def render(self, *args, **kwargs) -> str:
+        """Render one record given as arguments, like ``layout.format(...)``."""
+        return self._one(args if self.positional else kwargs)
+
+    def render_row(self, row) -> str:
+        """Render one record: a tuple for positional layouts, else a mapping."""
+        return self._one(row)
+
+    def render_many(self, rows: Iterable) -> List[str]:
+        """Render every record. Rows of a positional layout are tuples of
+        exactly ``max(fields) + 1`` values."""
+        return self._many(rows)
+
+    def render_values(self, values: Iterable) -> List[str]:
+        """Render a layout with a single field once per value, no record needed."""
+        if self._values is None:
+            raise ValueError(f"{self!r} does not have exactly one field")
+        return self._values(values)
+
+    def join(self, rows: Iterable, sep: str = "\n") -> str:
+        return sep.join(self._many(rows))
+
+    def write(self, rows: Iterable, file: TextIO, end: str = "\n") -> None:
+        """Write each rendered record followed by ``end``."""
+        file.write(end.join(self._many(rows)))
+        file.write(end)
+
+
+def _parse(layout: str):
+    """Split ``layout`` into (literal, first field, lookups, conversion and
+    spec) parts; string keys are bound to ``_kN`` constants in ``keys``."""
+    parts: List[Tuple[str, Any, Tuple[str, ...], str]] = []
+    keys: Dict[str, Any] = {}
+    auto, manual = 0, False
+    for literal, field_name, spec, conversion in _string.formatter_parser(layout):
+        literal = literal.replace("{", "{{").replace("}", "}}")
+        if field_name is None:
+            parts.append((literal, None, (), ""))
+            continue
+        first, rest = _string.formatter_field_name_split(field_name)
+        if first == "":
+            if manual:
+                raise ValueError("cannot switch from manual field numbering to automatic")
+            first, auto = auto, auto + 1
+        elif isinstance(first, int):
+            if auto:
+                raise ValueError("cannot switch from automatic field numbering to manual")
+            manual = True
+        else:
+            first = _constant(keys, first)
+        lookups = []
+        for is_attribute, key in rest:
+            if is_attribute:
+                if not key:
+                    raise ValueError("Empty attribute in format string")
+                # Any name that is not a plain attribute is looked up with
+                # getattr() as str.format does, never pasted into the source.
+                if _plain(key):
+                    lookups.append(f".{key}")
+                else:
+                    lookups.append(f", {_constant(keys, key)})")
+            elif isinstance(key, int):
+                lookups.append(f"[{key}]")
+            else:
+                lookups.append(f"[{_constant(keys, key)}]")
+        if conversion not in (None, "r", "s", "a"):
+            raise ValueError(f"Unknown conversion specifier {conversion}")
+        if spec and ("{" in spec or "'" in spec or '"' in spec or "\\" in spec):
+            raise ValueError(f"unsupported format spec {spec!r} in {layout!r}")
+        parts.append((literal, first, tuple(lookups),
+                      (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "")))
+    return parts, keys
+
+
+def _plain(key: str) -> bool:
+    # Non-ASCII names are NFKC-normalised by the compiler but not by getattr().
+    return key.isascii() and key.isidentifier() and not keyword.iskeyword(key)
+
+
+def _source(parts, access) -> str:
+    # Inside the braces there are only ASCII identifiers, _kN constants,
+    # integers, dots, brackets, commas, a conversion and a spec without
+    # quotes, braces or backslashes, so repr() of the body is a valid
+    # f-string literal whatever the layout's text has.
+    body = "".join(literal if first is None else
+                   literal + "{" + _lookup(access(first), lookups) + tail + "}"
+                   for literal, first, lookups, tail in parts)
+    return "f" + repr(body)
+
+
+def _lookup(expression: str, lookups) -> str:
+    # A ", _kN)" lookup closes a _getattr() call around everything before it.
+    for lookup in lookups:
+        if lookup.startswith(","):
+            expression = f"_getattr({expression}{lookup}"
+        else:
+            expression += lookup
+    return expression
+
+
+def _constant(keys: Dict[str, Any], value: str) -> str:
+    for name, existing in keys.items():
+        if existing == value:
+            return name
+    name = f"_k{len(keys)}"
+    keys[name] = value
+    return name
+
+
+# ============================================
+# Course layouts
+# ============================================
+
+RULE = "=" * 60
+BANNER = Template("\n" + RULE + "\n{title}\n" + RULE)   # pycourse.render.banner
+TODO_ROW = Template("  {0}. [{1}] {2}")                  # TodoApp.show_todos
+
+
+def banners(titles: Iterable[str]) -> str:
+    """Every title's chapter banner, as printed by ``banner(title)`` one after another."""
+    return "\n".join(BANNER.render_values(titles))
+
+
+def todo_rows(todos: Sequence[dict]) -> List[str]:
+    """The lines ``TodoApp.show_todos`` prints for ``todos`` (without the empty case)."""
+    # zip() reuses its result tuple once the row has been unpacked, so no
+    # record is allocated per todo.
+    return TODO_ROW.render_many(zip(range(len(todos)),
+                                    ["X" if todo["completed"] else "O" for todo in todos],
+                                    [todo["task"] for todo in todos]))
@@ -0,0 +1,240 @@
+"""Per-chapter transcript diffs and patches for publishing only what changed.
+
+A transcript is split at its banners (a title line between two ``=`` rules,
+see ``pycourse.render.banner``) into sections: the text before the first
+banner, then one section per chapter banner, header and footer included.
+Joined back together the sections are the transcript, byte for byte.
+
+    python -m pycourse.transcripts manifest basic.txt          # section hashes
+    python -m pycourse.transcripts diff old.txt new.txt        # per-chapter unified diffs
+    python -m pycourse.transcripts patch old.txt new.txt -o basic.patch.json
+    python -m pycourse.transcripts apply old.txt basic.patch.json -o new.txt
+    python -m pycourse.runner basic -o basic.txt --patch basic.patch.json
+
+A *manifest* lists every section's key (``chapter-14`` for ``CHAPTER 14:
+...``, a slug of the title otherwise), title, SHA-256 and size, plus the
+digest of the whole transcript. A *patch* takes a transcript from a base
+digest to a target digest and carries the target's manifest:
+
+``unchanged``  same digest, nothing to upload
+``patch``      same sections in the same order: only the changed ones' text
+``full``       sections were added, removed or reordered: the whole text
+
+A publisher that kept the last manifest can therefore upload just the
+``changed`` sections and stitch the rest from what it already has;
+``apply`` does exactly that and checks both digests. ``make_patch`` also
+accepts the base as a manifest, so the previous transcript itself is not
+needed.
+"""
+
+import hashlib
+import json
+import re
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from .render import RULE
+
+MANIFEST_FORMAT = "pycourse-transcript-manifest/1"
+PATCH_FORMAT = "pycourse-transcript-patch/1"
+PREAMBLE = "preamble"
+
+_CHAPTER = re.compile(r"CHAPTER\s+(\d+)\b", re.IGNORECASE)
+
+
+class Section(NamedTuple):
+    key: str
+    title: str
+    text: str
+
+    @property
+    def sha256(self) -> str:
+        return _sha256(self.text)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _key(title: str, seen: Dict[str, int]) -> str:
+    match = _CHAPTER.match(title)
+    if match:
+        key = f"chapter-{match.group(1)}"
+    else:
+        key = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "section"
+    seen[key] = seen.get(key, 0) + 1
+    return key if seen[key] == 1 else f"{key}-{seen[key]}"
+
+
+def split(text: str) -> List[Section]:
+    """The sections of ``text``; ``"".join`` of their texts gives ``text`` back."""
+    lines = text.splitlines(keepends=True)
+    starts = [i for i in range(len(lines) - 2)
+              if lines[i].rstrip("\r\n") == RULE and lines[i + 2].rstrip("\r\n") == RULE
+              and lines[i + 1].strip() and lines[i + 1].rstrip("\r\n") != RULE]
+    sections: List[Section] = []
+    seen: Dict[str, int] = {}
+    preamble = "".join(lines[:starts[0] if starts else len(lines)])
+    if preamble:
+        sections.append(Section(PREAMBLE, "", preamble))
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        title = lines[start + 1].strip()
+        sections.append(Section(_key(title, seen), title, "".join(lines[start:end])))
+    return sections
+
+
+# ============================================
+# Manifests and patches
+# ============================================
+
+def manifest(text: str) -> Dict[str, Any]:
+    """Digest of ``text`` and key, title, hash and size of each section."""
+    return {
+        "format": MANIFEST_FORMAT,
+        "sha256": _sha256(text),
+        "sections": [{"key": s.key, "title": s.title, "sha256": s.sha256,
+                      "bytes": len(s.text.encode("utf-8"))} for s in split(text)],
+    }
+
+
+def _as_manifest(base: Union[str, Dict[str, Any], None]) -> Optional[Dict[str, Any]]:
+    if base is None or isinstance(base, dict):
+        if base is not None and base.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"not a {MANIFEST_FORMAT} document")
+        return base
+    return manifest(base)
+
+
+def make_patch(base: Union[str, Dict[str, Any], None], text: str) -> Dict[str, Any]:
+    """The patch from ``base`` (a transcript, its manifest, or None) to ``text``."""
+    old = _as_manifest(base)
+    new = manifest(text)
+    patch: Dict[str, Any] = {"format": PATCH_FORMAT, "base": old["sha256"] if old else None,
+                             "target": new["sha256"], "manifest": new}
+    if old is not None and old["sha256"] == new["sha256"]:
+        patch["mode"] = "unchanged"
+    elif old is not None and [s["key"] for s in old["sections"]] == [s["key"] for s in new["sections"]]:
+        old_hashes = [s["sha256"] for s in old["sections"]]
+        patch["mode"] = "patch"
+        patch["changed"] = {s.key: s.text for s, h in zip(split(text), old_hashes) if s.sha256 != h}
+    else:
+        patch["mode"] = "full"
+        patch["text"] = text
+    return patch
+
+
+def apply_patch(base: Optional[str], patch: Dict[str, Any]) -> str:
+    """The target transcript of ``patch``, rebuilt from ``base``; checks both digests."""
+    if patch.get("format") != PATCH_FORMAT:
+        raise ValueError(f"not a {PATCH_FORMAT} document")
+    mode = patch["mode"]
+    if mode == "full":
+        text = patch["text"]
+    else:
+        if base is None or _sha256(base) != patch["base"]:
+            raise ValueError("base transcript does not match the patch's base digest")
+        if mode == "unchanged":
+            return base
+        changed = patch["changed"]
+        text = "".join(changed.get(s.key, s.text) for s in split(base))
+    if _sha256(text) != patch["target"]:
+        raise ValueError("patched transcript does not match the patch's target digest")
+    return text
+
+
+def summary(patch: Dict[str, Any]) -> str:
+    sections = patch["manifest"]["sections"]
+    size = sum(s["bytes"] for s in sections)
+    if patch["mode"] == "unchanged":
+        return f"unchanged ({len(sections)} sections)"
+    if patch["mode"] == "full":
+        return f"full: {len(sections)} sections, {size} bytes"
+    changed = patch["changed"]
+    shipped = sum(len(t.encode("utf-8")) for t in changed.values())
+    keys = ", ".join(changed) or "none"
+    return f"patch: {len(changed)} of {len(sections)} sections changed ({keys}), {shipped} of {size} bytes"
+
+
+def diff(old: str, new: str, context: int = 3) -> str:
+    """Unified diffs of the sections that changed, one per section key."""
+    import difflib
+
+    old_sections = {s.key: s for s in split(old)}
+    new_sections = {s.key: s for s in split(new)}
+    keys = list(new_sections) + [k for k in old_sections if k not in new_sections]
+    chunks = []
+    for key in keys:
+        a = old_sections[key].text if key in old_sections else ""
+        b = new_sections[key].text if key in new_sections else ""
+        if a != b:
+            chunks.extend(difflib.unified_diff(a.splitlines(keepends=True), b.splitlines(keepends=True),
+                                               f"a/{key}", f"b/{key}", n=context))
+    return "".join(line if line.endswith("\n") else line + "\n" for line in chunks)
+
+
+# ============================================
+# Command line
+# ============================================
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _write(path: Optional[str], text: str) -> None:
+    if path in (None, "-"):
+        sys.stdout.write(text)
+        return
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def _dump(document: Dict[str, Any]) -> str:
+    return json.dumps(document, ensure_ascii=False, indent=1) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Per-chapter transcript manifests, diffs and patches.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("manifest", help="section hashes of a transcript")
+    command.add_argument("transcript")
+    command = commands.add_parser("diff", help="unified diffs of the changed sections")
+    command.add_argument("old")
+    command.add_argument("new")
+    command = commands.add_parser("patch", help="the patch from OLD (transcript or manifest) to NEW")
+    command.add_argument("old")
+    command.add_argument("new")
+    command.add_argument("-o", "--output")
+    command = commands.add_parser("apply", help="rebuild the target of PATCH from BASE")
+    command.add_argument("base", help="the base transcript ('-' when the patch is a full one)")
+    command.add_argument("patch")
+    command.add_argument("-o", "--output")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    if args.command == "manifest":
+        _write(None, _dump(manifest(_read(args.transcript))))
+    elif args.command == "diff":
+        text = diff(_read(args.old), _read(args.new))
+        _write(None, text)
+        return 1 if text else 0
+    elif args.command == "patch":
+        old = _read(args.old)
+        base = json.loads(old) if args.old.endswith(".json") else old
+        patch = make_patch(base, _read(args.new))
+        _write(args.output, _dump(patch))
+        print(summary(patch), file=sys.stderr)
+    else:
+        with open(args.patch, encoding="utf-8") as f:
+            patch = json.load(f)
+        try:
+            text = apply_patch(None if args.base == "-" else _read(args.base), patch)
+        except ValueError as e:
+            parser.error(str(e))
+        _write(args.output, text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Long-lived render worker for the course scripts.
+
+Spawning ``python python-advanced-course.py`` per transcript pays for
+interpreter start-up and every import each time. The worker loads the
+course scripts once and then renders chapters on request:
+
+    python -m pycourse.worker                  # JSON lines on stdin/stdout
+    python -m pycourse.worker --socket /tmp/course.sock
+
+Each request is one JSON object per line, each response one line back:
+
+    {"id": 1, "course": "advanced", "chapter": 14}
+    {"id": 1, "ok": true, "output": "\\n=====...CHAPTER 14: DECORATORS..."}
+
+Other request fields: ``"chapters": [14, 15]`` (omit both for the whole
+course), ``"deterministic": true`` and ``"seed": 0`` (see
+``pycourse.determinism``), and ``"format": "ndjson"`` for the
+``pycourse.records`` form of the output (NDJSON text in ``"output"``). ``{"op": "ping"}`` answers ``{"ok": true}``;
+``{"op": "shutdown"}`` stops the worker.
+"""
+
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import types
+from contextlib import nullcontext, redirect_stdout
+from typing import Any, Dict, List, Optional
+
+from .determinism import DEFAULT_SEED, deterministic
+from .render import render
+from .runner import COURSES, course_path
+from .runtime import patch_asyncio_run
+
+# Modules the chapters pull in; importing them up front is what keeps the
+# worker warm.
+WARM_MODULES = ("json", "re", "asyncio", "threading", "dataclasses", "typing",
+                "math", "random", "datetime", "functools")
+
+
+class CourseWorker:
+    """Holds the loaded course scripts and renders chapters from them."""
+
+    def __init__(self, courses=tuple(COURSES)):
+        for name in WARM_MODULES:
+            __import__(name)
+        self._courses = {}
+        for course in courses:
+            # A run_name other than "__main__" defines the chapters without
+            # rendering them.
+            namespace = runpy.run_path(course_path(course), run_name=f"pycourse.course_{course}")
+            # Scripts bind pycourse.core modules with lazy_import; touching
+            # them here moves that cost out of the first request.
+            for value in list(namespace.values()):
+                if isinstance(value, types.ModuleType):
+                    getattr(value, "__name__")
+            self._courses[course] = namespace
+
+    def render(self, course: str, chapters: Optional[List[int]] = None,
+               is_deterministic: bool = False, seed: int = DEFAULT_SEED,
+               output_format: str = "text") -> str:
+        if course not in self._courses:
+            raise ValueError(f"unknown course {course!r}, expected one of {sorted(self._courses)}")
+        namespace = self._courses[course]
+        buffer = io.StringIO()
+        mode = deterministic(seed) if is_deterministic else nullcontext()
+        # Chapter 25's asyncio.run calls reuse the worker's one event loop.
+        with redirect_stdout(buffer), mode, patch_asyncio_run():
+            render(namespace["CHAPTERS"], chapters, namespace.get("header"), namespace.get("footer"),
+                   output_format)
+        return buffer.getvalue()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one protocol request; errors are reported, never raised."""
+        response: Dict[str, Any] = {"id": request.get("id")}
+        try:
+            op = request.get("op", "render")
+            if op == "ping":
+                pass
+            elif op == "render":
+                chapters = request.get("chapters")
+                if "chapter" in request:
+                    chapters = [request["chapter"]]
+                response["output"] = self.render(request["course"], chapters,
+                                                 request.get("deterministic", False),
+                                                 request.get("seed", DEFAULT_SEED),
+                                                 request.get("format", "text"))
+            else:
+                raise ValueError(f"unknown op {op!r}")
+        except Exception as e:
+            response.update(ok=False, error=f"{type(e).__name__}: {e}")
+            return response
+        response["ok"] = True
+        return response
+
+    def serve(self, reader, writer) -> None:
+        """Serve JSON-lines requests from ``reader`` until EOF or shutdown."""
+        for line in reader:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                request, response = {}, {"id": None, "ok": False, "error": f"bad request: {e}"}
+            else:
+                if request.get("op") == "shutdown":
+                    writer.write(json.dumps({"id": request.get("id"), "ok": True}) + "\n")
+                    writer.flush()
+                    return
+                response = self.handle(request)
+            writer.write(json.dumps(response, ensure_ascii=False) + "\n")
+            writer.flush()
+
+
+def serve_socket(worker: CourseWorker, path: str) -> None:
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+            writer = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+            worker.serve(reader, writer)
+
+    # Rendering swaps sys.stdout, so connections are served one at a time.
+    if os.path.exists(path):
+        os.unlink(path)
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+
+# ============================================
+# Client
+# ============================================
+
+class WorkerClient:
+    """Spawn a worker subprocess and talk to it over its stdin/stdout."""
+
+    def __init__(self, python: str = sys.executable):
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self._process = subprocess.Popen(
+            [python, "-m", "pycourse.worker"], cwd=package_dir,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, encoding="utf-8",
+        )
+        self._next_id = 0
+
+    def request(self, **fields) -> Dict[str, Any]:
+        self._next_id += 1
+        fields["id"] = self._next_id
+        self._process.stdin.write(json.dumps(fields) + "\n")
+        self._process.stdin.flush()
+        line = self._process.stdout.readline()
+        if not line:
+            raise RuntimeError("worker exited")
+        return json.loads(line)
+
+    def render(self, course: str, chapter: Optional[int] = None, **options) -> str:
+        if chapter is not None:
+            options["chapter"] = chapter
+        response = self.request(course=course, **options)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response["output"]
+
+    def close(self) -> None:
+        if self._process.poll() is None:
+            self.request(op="shutdown")
+            self._process.wait()
+
+    def __enter__(self) -> "WorkerClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve course chapter renders from a warm interpreter.")
+    parser.add_argument("--socket", help="listen on this Unix socket instead of stdin/stdout")
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    worker = CourseWorker()
+    if args.socket:
+        serve_socket(worker, args.socket)
+        return
+    sys.stdin.reconfigure(encoding="utf-8")
+    sys.stdout.reconfigure(encoding="utf-8")
+    worker.serve(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""Bounded work queues with batching consumers, for asyncio and for threads.
+
+Chapters 24-25 fan work out by hand: one ``threading.Thread`` per job, or
+``asyncio.gather`` over every coroutine at once. A work queue instead runs
+a fixed number of consumers over a bounded queue:
+
+    async def fetch(item):
+        await asyncio.sleep(0.1)
+        return {"data": item}
+
+    async with AsyncWorkQueue(fetch, workers=3, maxsize=100) as queue:
+        futures = [await queue.put(i) for i in range(10)]   # waits while full
+        results = await queue.map(range(10))                # put all, gather in order
+    print(queue.stats())
+
+    with ThreadWorkQueue(save_rows, workers=4, batch_size=50) as queue:
+        queue.map(rows)                   # save_rows gets lists of up to 50 rows
+
+Both engines share the same interface:
+
+``handler``
+    Called once per item (``batch_size=None``) or once per batch of up to
+    ``batch_size`` items, given as a list, returning one result per item.
+    ``AsyncWorkQueue`` accepts coroutine functions and plain functions.
+``put(item)``
+    Enqueues ``item`` and returns a future for its result. When ``maxsize``
+    items are waiting it blocks (awaits, for asyncio) until a consumer makes
+    room: that is the backpressure. ``put_nowait`` raises ``QueueFull``
+    instead.
+``map(items)``
+    ``put`` every item, then return the results in order.
+``join()``
+    Waits until every item put so far has been handled.
+``close(cancel=False)``
+    Stops accepting items, lets the consumers drain what is queued and
+    waits for them to exit. With ``cancel=True`` queued items are dropped
+    and their futures cancelled. Leaving the ``with`` block closes.
+``stats()``
+    A ``QueueStats``: items submitted, completed and failed, current and
+    maximum depth, batches and mean batch size, and in milliseconds the
+    time items waited in the queue and their end-to-end latency (mean,
+    max / 95th percentile over the last ``LATENCY_SAMPLES`` items).
+
+A handler that raises fails the futures of its item or batch; the
+consumer carries on with the next one.
+"""
+
+import asyncio
+import inspect
+import queue as _queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAXSIZE = 1000
+LATENCY_SAMPLES = 10_000
+
+QueueFull = _queue.Full
+_STOP = object()   # one per consumer, queued behind the remaining items on close()
+
+
+class QueueStats(NamedTuple):
+    submitted: int
+    completed: int
+    failed: int
+    depth: int
+    max_depth: int
+    batches: int
+    mean_batch: float
+    wait_mean_ms: float
+    wait_max_ms: float
+    latency_mean_ms: float
+    latency_p95_ms: float
+
+
+class _Metrics:
+    """Counters and latency samples; every update holds ``lock``."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.submitted = self.completed = self.failed = 0
+        self.max_depth = self.batches = self.batched_items = 0
+        self.waits = deque(maxlen=LATENCY_SAMPLES)
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def put(self, depth: int) -> None:
+        with self.lock:
+            self.submitted += 1
+            if depth > self.max_depth:
+                self.max_depth = depth
+
+    def dequeued(self, enqueued: List[float], now: float) -> None:
+        with self.lock:
+            self.batches += 1
+            self.batched_items += len(enqueued)
+            self.waits.extend(now - t for t in enqueued)
+
+    def done(self, enqueued: List[float], ok: bool) -> None:
+        now = time.perf_counter()
+        with self.lock:
+            if ok:
+                self.completed += len(enqueued)
+            else:
+                self.failed += len(enqueued)
+            self.latencies.extend(now - t for t in enqueued)
+
+    def snapshot(self, depth: int) -> QueueStats:
+        with self.lock:
+            waits, latencies = list(self.waits), sorted(self.latencies)
+            return QueueStats(
+                self.submitted, self.completed, self.failed, depth, self.max_depth,
+                self.batches, self.batched_items / self.batches if self.batches else 0.0,
+                1000 * sum(waits) / len(waits) if waits else 0.0,
+                1000 * max(waits) if waits else 0.0,
+                1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                1000 * latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+            )
+
+
+class _WorkQueue:
+    """What both engines share: arguments, batching rules and metrics."""
+
+    def __init__(self, handler: Callable, workers: int = DEFAULT_WORKERS,
+                 maxsize: int = DEFAULT_MAXSIZE, batch_size: Optional[int] = None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if maxsize < 0:
+            raise ValueError("maxsize must be 0 (unbounded) or more")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be None or at least 1")
+        self.handler = handler
+        self.workers = workers
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.closed = False
+        self._metrics = _Metrics()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise RuntimeError("work queue is closed")
+
+    def _take(self, first, get_nowait, empty) -> List[Any]:
+        """``first`` plus whatever is queued right now, up to ``batch_size``."""
+        batch = [first]
+        while first is not _STOP and len(batch) < (self.batch_size or 1):
+            try:
+                entry = get_nowait()
+            except empty:
+                break
+            batch.append(entry)
+            if entry is _STOP:
+                break
+        return batch
+
+    def _results(self, items: List[Any], results) -> List[Any]:
+        if self.batch_size is None:
+            return [results]
+        results = list(results)
+        if len(results) != len(items):
+            raise ValueError(f"batch handler returned {len(results)} results for {len(items)} items")
+        return results
+
+
+# ============================================
+# asyncio engine
+# ============================================
+
+class AsyncWorkQueue(_WorkQueue):
+    """``workers`` consumer tasks over a bounded ``asyncio.Queue``."""
+
+    def __init__(self, handler: Callable, workers: int = DEFAULT_WORKERS,
+                 maxsize: int = DEFAULT_MAXSIZE, batch_size: Optional[int] = None):
+        super().__init__(handler, workers, maxsize, batch_size)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def _start(self) -> None:
+        # Created on first use, inside the running loop.
+        if self._queue is None:
+            self._check_open()
+            self._queue = asyncio.Queue(self.maxsize)
+            self._tasks = [asyncio.ensure_future(self._consume()) for _ in range(self.workers)]
+
+    async def __aenter__(self) -> "AsyncWorkQueue":
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close(cancel=exc_type is not None)
+
+    async def put(self, item: Any) -> "asyncio.Future":
+        self._start()
+        self._check_open()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future, time.perf_counter()))
+        if self.closed and all(task.done() for task in self._tasks):
+            # Waited for room while close() ran: the item landed behind the
+            # _STOP sentinels, after the consumers exited.
+            self._drop_queued()
+        self._metrics.put(self._queue.qsize())
+        return future
+
+    def put_nowait(self, item: Any) -> "asyncio.Future":
+        self._start()
+        self._check_open()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((item, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            raise QueueFull from None
+        self._metrics.put(self._queue.qsize())
+        return future
+
+    async def map(self, items: Iterable[Any]) -> List[Any]:
+        futures = [await self.put(item) for item in items]
+        return list(await asyncio.gather(*futures))
+
+    async def join(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, cancel: bool = False) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self._queue is None:
+            return
+        if cancel:
+            self._drop_queued()
+        for _ in self._tasks:
+            await self._queue.put(_STOP)
+        await asyncio.gather(*self._tasks)
+        # Items of put() calls that were waiting for room are behind the
+        # sentinels; no consumer is left to take them.
+        self._drop_queued()
+
+    def _drop_queued(self) -> None:
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+            self._queue.task_done()
+
+    def stats(self) -> QueueStats:
+        return self._metrics.snapshot(self._queue.qsize() if self._queue else 0)
+
+    async def _consume(self) -> None:
+        queue = self._queue
+        while True:
+            batch = self._take(await queue.get(), queue.get_nowait, asyncio.QueueEmpty)
+            stop = batch[-1] is _STOP
+            entries = [entry for entry in batch if entry is not _STOP and not entry[1].done()]
+            try:
+                if entries:
+                    await self._handle(entries)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            if stop:
+                return
+
+    async def _handle(self, entries) -> None:
+        items = [item for item, _, _ in entries]
+        enqueued = [t for _, _, t in entries]
+        self._metrics.dequeued(enqueued, time.perf_counter())
+        try:
+            result = self.handler(items if self.batch_size else items[0])
+            if inspect.isawaitable(result):
+                result = await result
+            results = self._results(items, result)
+        except Exception as e:
+            self._metrics.done(enqueued, ok=False)
+            for _, future, _ in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self._metrics.done(enqueued, ok=True)
+        for (_, future, _), value in zip(entries, results):
+            if not future.done():
+                future.set_result(value)
+
+
+# ============================================
+# Thread engine
+# ============================================
+
+class ThreadWorkQueue(_WorkQueue):
+    """``workers`` consumer threads over a bounded ``queue.Queue``."""
+
+    def __init__(self, handler: Callable, workers: int = DEFAULT_WORKERS,
+                 maxsize: int = DEFAULT_MAXSIZE, batch_size: Optional[int] = None):
+        super().__init__(handler, workers, maxsize, batch_size)
+        self._queue: _queue.Queue = _queue.Queue(maxsize)
+        # Held by put() from the closed check to the enqueue, and by close()
+        # to set closed: no item can land behind the _STOP sentinels. put()
+        # waits for room without it, so producers do not queue up behind
+        # one blocked producer.
+        self._close_lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._consume, name=f"workqueue-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> "ThreadWorkQueue":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(cancel=exc_type is not None)
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> Future:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        future: Future = Future()
+        entry = (item, future, time.perf_counter())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        queue = self._queue
+        while True:
+            with self._close_lock:
+                self._check_open()
+                try:
+                    queue.put_nowait(entry)
+                    break
+                except _queue.Full:
+                    pass
+            with queue.not_full:
+                # queue.full() takes the mutex not_full is built on.
+                while not self.closed and 0 < queue.maxsize <= len(queue.queue):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise QueueFull
+                    queue.not_full.wait(remaining)
+        self._metrics.put(queue.qsize())
+        return future
+
+    def put_nowait(self, item: Any) -> Future:
+        future: Future = Future()
+        with self._close_lock:
+            self._check_open()
+            self._queue.put_nowait((item, future, time.perf_counter()))
+        self._metrics.put(self._queue.qsize())
+        return future
+
+    def map(self, items: Iterable[Any]) -> List[Any]:
+        futures = [self.put(item) for item in items]
+        return [future.result() for future in futures]
+
+    def join(self) -> None:
+        self._queue.join()
+
+    def close(self, cancel: bool = False) -> None:
+        with self._close_lock:
+            if self.closed:
+                return
+            self.closed = True
+        with self._queue.not_full:
+            # Producers waiting for room find the queue closed, rather than
+            # taking get()'s wake-ups from the _STOP puts below.
+            self._queue.not_full.notify_all()
+        if cancel:
+            while True:
+                try:
+                    _, future, _ = self._queue.get_nowait()
+                except _queue.Empty:
+                    break
+                future.cancel()
+                self._queue.task_done()
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self) -> QueueStats:
+        return self._metrics.snapshot(self._queue.qsize())
+
+    def _consume(self) -> None:
+        queue = self._queue
+        while True:
+            batch = self._take(queue.get(), queue.get_nowait, _queue.Empty)
+            stop = batch[-1] is _STOP
+            # set_running_or_notify_cancel() skips items cancelled while queued.
+            entries = [entry for entry in batch
+                       if entry is not _STOP and entry[1].set_running_or_notify_cancel()]
+            try:
+                if entries:
+                    self._handle(entries)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            if stop:
+                return
+
+    def _handle(self, entries) -> None:
+        items = [item for item, _, _ in entries]
+        enqueued = [t for _, _, t in entries]
+        self._metrics.dequeued(enqueued, time.perf_counter())
+        try:
+            results = self._results(items, self.handler(items if self.batch_size else items[0]))
+        except Exception as e:
+            self._metrics.done(enqueued, ok=False)
+            for _, future, _ in entries:
+                future.set_exception(e)
+            return
+        self._metrics.done(enqueued, ok=True)
+        for (_, future, _), value in zip(entries, results):
+            future.set_result(value)
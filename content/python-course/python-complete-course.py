@@ -2,677 +2,665 @@
 # PYTHON COMPLETE COURSE - BEGINNER TO ADVANCED
 # ============================================
 
+from pycourse.lazy import lazy_import
+from pycourse.listing import listing
+from pycourse.render import main
+
+async_tasks = lazy_import("pycourse.core.async_tasks")
+context_managers = lazy_import("pycourse.core.context_managers")
+data_classes = lazy_import("pycourse.core.data_classes")
+decorators = lazy_import("pycourse.core.decorators")
+exceptions = lazy_import("pycourse.core.exceptions")
+functions = lazy_import("pycourse.core.functions")
+generators = lazy_import("pycourse.core.generators")
+oop = lazy_import("pycourse.core.oop")
+regex = lazy_import("pycourse.core.regex")
+threads = lazy_import("pycourse.core.threads")
+type_hints = lazy_import("pycourse.core.type_hints")
+
+
 # ============================================
 # 1. PYTHON BASICS
 # ============================================
 
-# Variables and Data Types
-name = "Alice"           # string
-age = 25                 # int
-height = 5.7             # float
-is_student = True        # bool
-hobbies = ["reading", "coding"]  # list
-person = {"name": "Bob", "age": 30}  # dict
+def chapter_1():
+    # Variables and Data Types
+    name = "Alice"           # string
+    age = 25                 # int
+    height = 5.7             # float
+    is_student = True        # bool
+    hobbies = ["reading", "coding"]  # list
+    person = {"name": "Bob", "age": 30}  # dict
+
+    # Print and Input
+    print("Hello, World!")
+    print(f"My name is {name} and I'm {age} years old")
 
-# Print and Input
-print("Hello, World!")
-print(f"My name is {name} and I'm {age} years old")
+    # Input (uncomment to use interactively)
+    # user_input = input("Enter your name: ")
+    # print(f"Hello, {user_input}!")
 
-# Input (uncomment to use interactively)
-# user_input = input("Enter your name: ")
-# print(f"Hello, {user_input}!")
 
 # ============================================
 # 2. CONDITIONALS
 # ============================================
 
-age = 18
+def chapter_2():
+    age = 18
 
-if age < 13:
-    print("Child")
-elif age < 20:
-    print("Teenager")
-else:
-    print("Adult")
+    if age < 13:
+        print("Child")
+    elif age < 20:
+        print("Teenager")
+    else:
+        print("Adult")
+
+    # One-liner
+    status = "Adult" if age >= 18 else "Minor"
 
-# One-liner
-status = "Adult" if age >= 18 else "Minor"
 
 # ============================================
 # 3. LOOPS
 # ============================================
 
-# For Loop
-for i in range(5):
-    print(i)  # 0, 1, 2, 3, 4
+def chapter_3():
+    # For Loop
+    for i in range(5):
+        print(i)  # 0, 1, 2, 3, 4
+
+    for i in range(1, 6):
+        print(i)  # 1, 2, 3, 4, 5
 
-for i in range(1, 6):
-    print(i)  # 1, 2, 3, 4, 5
+    # Loop through list
+    fruits = ["apple", "banana", "cherry"]
+    for fruit in fruits:
+        print(fruit)
 
-# Loop through list
-fruits = ["apple", "banana", "cherry"]
-for fruit in fruits:
-    print(fruit)
+    # While Loop
+    count = 0
+    while count < 5:
+        print(count)
+        count += 1
 
-# While Loop
-count = 0
-while count < 5:
-    print(count)
-    count += 1
+    # Break and Continue
+    for i in range(10):
+        if i == 3:
+            continue  # Skip 3
+        if i == 7:
+            break  # Stop at 7
+        print(i)
 
-# Break and Continue
-for i in range(10):
-    if i == 3:
-        continue  # Skip 3
-    if i == 7:
-        break  # Stop at 7
-    print(i)
 
 # ============================================
 # 4. FUNCTIONS
 # ============================================
 
-# Basic function
-def greet(name):
-    return f"Hello, {name}!"
-
-print(greet("Alice"))
-
-# Function with default parameters
-def greet_person(name="Guest"):
-    return f"Hello, {name}!"
-
-print(greet_person())  # Hello, Guest!
-print(greet_person("John"))  # Hello, John!
+def chapter_4():
+    from pycourse.core.functions import greet, greet_person, add_numbers, sum_all, print_info, square, add
 
-# Function with multiple parameters
-def add_numbers(a, b, c=0):
-    return a + b + c
+    print(listing(functions, "greet", "greet_person", "add_numbers",
+                  "sum_all", "print_info", "square", "add"))
+    print()
 
-print(add_numbers(5, 3))  # 8
-print(add_numbers(5, 3, 2))  # 10
+    # Basic function
+    print(greet("Alice"))
 
-# Function with *args
-def sum_all(*args):
-    return sum(args)
+    # Function with default parameters
+    print(greet_person())  # Hello, Guest!
+    print(greet_person("John"))  # Hello, John!
 
-print(sum_all(1, 2, 3, 4, 5))  # 15
+    # Function with multiple parameters
+    print(add_numbers(5, 3))  # 8
+    print(add_numbers(5, 3, 2))  # 10
 
-# Function with **kwargs
-def print_info(**kwargs):
-    for key, value in kwargs.items():
-        print(f"{key}: {value}")
+    # Function with *args
+    print(sum_all(1, 2, 3, 4, 5))  # 15
 
-print_info(name="Alice", age=25, city="NYC")
+    # Function with **kwargs
+    print_info(name="Alice", age=25, city="NYC")
 
-# Lambda functions
-square = lambda x: x ** 2
-print(square(5))  # 25
+    # Lambda functions
+    print(square(5))  # 25
+    print(add(3, 4))  # 7
 
-add = lambda a, b: a + b
-print(add(3, 4))  # 7
 
 # ============================================
 # 5. LISTS
 # ============================================
 
-# Create lists
-numbers = [1, 2, 3, 4, 5]
-mixed = [1, "hello", 3.14, True]
+def chapter_5():
+    # Create lists
+    numbers = [1, 2, 3, 4, 5]
+    mixed = [1, "hello", 3.14, True]
+
+    # Access elements
+    print(numbers[0])  # 1
+    print(numbers[-1])  # 5 (last element)
 
-# Access elements
-print(numbers[0])  # 1
-print(numbers[-1])  # 5 (last element)
+    # Slicing
+    print(numbers[1:4])  # [2, 3, 4]
+    print(numbers[:3])  # [1, 2, 3]
+    print(numbers[2:])  # [3, 4, 5]
 
-# Slicing
-print(numbers[1:4])  # [2, 3, 4]
-print(numbers[:3])  # [1, 2, 3]
-print(numbers[2:])  # [3, 4, 5]
+    # Modify lists
+    numbers.append(6)  # Add to end
+    numbers.insert(0, 0)  # Add at index
+    numbers.remove(3)  # Remove value
+    last = numbers.pop()  # Remove and return last
 
-# Modify lists
-numbers.append(6)  # Add to end
-numbers.insert(0, 0)  # Add at index
-numbers.remove(3)  # Remove value
-last = numbers.pop()  # Remove and return last
+    # List operations
+    print(len(numbers))  # Length
+    print(3 in numbers)  # Check if exists
 
-# List operations
-print(len(numbers))  # Length
-print(3 in numbers)  # Check if exists
+    # List comprehension
+    squares = [x**2 for x in range(10)]
+    evens = [x for x in range(20) if x % 2 == 0]
 
-# List comprehension
-squares = [x**2 for x in range(10)]
-evens = [x for x in range(20) if x % 2 == 0]
 
 # ============================================
 # 6. DICTIONARIES
 # ============================================
 
-# Create dictionary
-person = {
-    "name": "Alice",
-    "age": 25,
-    "city": "New York"
-}
+def chapter_6():
+    # Create dictionary
+    person = {
+        "name": "Alice",
+        "age": 25,
+        "city": "New York"
+    }
 
-# Access values
-print(person["name"])  # Alice
-print(person.get("age"))  # 25
-print(person.get("country", "USA"))  # Default value
+    # Access values
+    print(person["name"])  # Alice
+    print(person.get("age"))  # 25
+    print(person.get("country", "USA"))  # Default value
 
-# Modify dictionary
-person["age"] = 26  # Update
-person["email"] = "alice@example.com"  # Add new
+    # Modify dictionary
+    person["age"] = 26  # Update
+    person["email"] = "alice@example.com"  # Add new
 
-# Remove items
-del person["city"]
-email = person.pop("email")
+    # Remove items
+    del person["city"]
+    email = person.pop("email")
 
-# Loop through dictionary
-for key in person:
-    print(f"{key}: {person[key]}")
+    # Loop through dictionary
+    for key in person:
+        print(f"{key}: {person[key]}")
 
-for key, value in person.items():
-    print(f"{key}: {value}")
+    for key, value in person.items():
+        print(f"{key}: {value}")
+
+    # Dictionary comprehension
+    squares = {x: x**2 for x in range(5)}
 
-# Dictionary comprehension
-squares = {x: x**2 for x in range(5)}
 
 # ============================================
 # 7. TUPLES AND SETS
 # ============================================
 
-# Tuples (immutable)
-coordinates = (10, 20)
-x, y = coordinates  # Unpacking
+def chapter_7():
+    # Tuples (immutable)
+    coordinates = (10, 20)
+    x, y = coordinates  # Unpacking
+
+    # Sets (unique elements)
+    unique_numbers = {1, 2, 3, 3, 4}  # {1, 2, 3, 4}
 
-# Sets (unique elements)
-unique_numbers = {1, 2, 3, 3, 4}  # {1, 2, 3, 4}
+    # Set operations
+    set1 = {1, 2, 3}
+    set2 = {3, 4, 5}
 
-# Set operations
-set1 = {1, 2, 3}
-set2 = {3, 4, 5}
+    print(set1 | set2)  # Union: {1, 2, 3, 4, 5}
+    print(set1 & set2)  # Intersection: {3}
+    print(set1 - set2)  # Difference: {1, 2}
 
-print(set1 | set2)  # Union: {1, 2, 3, 4, 5}
-print(set1 & set2)  # Intersection: {3}
-print(set1 - set2)  # Difference: {1, 2}
 
 # ============================================
 # 8. STRING MANIPULATION
 # ============================================
 
-text = "Hello, World!"
+def chapter_8():
+    text = "Hello, World!"
 
-# String methods
-print(text.lower())  # "hello, world!"
-print(text.upper())  # "HELLO, WORLD!"
-print(text.capitalize())  # "Hello, world!"
-print(text.title())  # "Hello, World!"
-print(text.replace("World", "Python"))  # "Hello, Python!"
-print(text.split(", "))  # ["Hello", "World!"]
-print("Hello" in text)  # True
-print(len(text))  # 13
+    # String methods
+    print(text.lower())  # "hello, world!"
+    print(text.upper())  # "HELLO, WORLD!"
+    print(text.capitalize())  # "Hello, world!"
+    print(text.title())  # "Hello, World!"
+    print(text.replace("World", "Python"))  # "Hello, Python!"
+    print(text.split(", "))  # ["Hello", "World!"]
+    print("Hello" in text)  # True
+    print(len(text))  # 13
 
-# String formatting
-name = "Alice"
-age = 25
+    # String formatting
+    name = "Alice"
+    age = 25
 
-print(f"My name is {name} and I'm {age}")  # f-string
-print("My name is {} and I'm {}".format(name, age))
-print("My name is %s and I'm %d" % (name, age))
+    print(f"My name is {name} and I'm {age}")  # f-string
+    print("My name is {} and I'm {}".format(name, age))
+    print("My name is %s and I'm %d" % (name, age))
 
-# Multi-line strings
-multiline = """
+    # Multi-line strings
+    multiline = """
 This is a
 multi-line string
 """
 
+
 # ============================================
 # 9. FILE HANDLING
 # ============================================
 
-# Write to file
-with open("example.txt", "w") as f:
-    f.write("Hello, World!\n")
-    f.write("Python is awesome!")
+def chapter_9():
+    # Write to file
+    with open("example.txt", "w") as f:
+        f.write("Hello, World!\n")
+        f.write("Python is awesome!")
+
+    # Read from file
+    with open("example.txt", "r") as f:
+        content = f.read()
+        print(content)
 
-# Read from file
-with open("example.txt", "r") as f:
-    content = f.read()
-    print(content)
+    # Read line by line
+    with open("example.txt", "r") as f:
+        for line in f:
+            print(line.strip())
 
-# Read line by line
-with open("example.txt", "r") as f:
-    for line in f:
-        print(line.strip())
+    # Read all lines
+    with open("example.txt", "r") as f:
+        lines = f.readlines()
+        print(f"Total lines: {len(lines)}")
 
-# Read all lines
-with open("example.txt", "r") as f:
-    lines = f.readlines()
-    print(f"Total lines: {len(lines)}")
 
 # ============================================
 # 10. EXCEPTION HANDLING
 # ============================================
 
-try:
-    result = 10 / 0
-except ZeroDivisionError:
-    print("Cannot divide by zero!")
-except Exception as e:
-    print(f"Error: {e}")
-else:
-    print("No errors occurred")
-finally:
-    print("This always runs")
+def chapter_10():
+    try:
+        result = 10 / 0
+    except ZeroDivisionError:
+        print("Cannot divide by zero!")
+    except Exception as e:
+        print(f"Error: {e}")
+    else:
+        print("No errors occurred")
+    finally:
+        print("This always runs")
 
-# Raise exceptions
-def validate_age(age):
-    if age < 0:
-        raise ValueError("Age cannot be negative")
-    return age
+    # Raise exceptions, custom exception
+    print(listing(exceptions, "validate_age", "MyError"))
+    print()
 
-# Custom exception
-class MyError(Exception):
-    pass
 
 # ============================================
 # 11. CLASSES AND OOP
 # ============================================
 
-class Person:
-    # Class attribute
-    species = "Homo sapiens"
-    
-    # Constructor
-    def __init__(self, name, age):
-        self.name = name  # Instance attribute
-        self.age = age
-    
-    # Instance method
-    def greet(self):
-        return f"Hello, I'm {self.name}"
-    
-    # Method with parameters
-    def have_birthday(self):
-        self.age += 1
-        return f"Happy birthday! Now I'm {self.age}"
-    
-    # String representation
-    def __str__(self):
-        return f"Person({self.name}, {self.age})"
-
-# Create objects
-person1 = Person("Alice", 25)
-person2 = Person("Bob", 30)
-
-print(person1.greet())  # Hello, I'm Alice
-print(person1.have_birthday())  # Happy birthday! Now I'm 26
-print(person1)  # Person(Alice, 26)
+def chapter_11():
+    from pycourse.core.oop import Person
+
+    print(listing(oop, "Person"))
+    print()
+
+    # Create objects
+    person1 = Person("Alice", 25)
+    person2 = Person("Bob", 30)
+
+    print(person1.greet())  # Hello, I'm Alice
+    print(person1.have_birthday())  # Happy birthday! Now I'm 26
+    print(person1)  # Person(Alice, 26)
+
 
 # ============================================
 # 12. INHERITANCE
 # ============================================
 
-class Animal:
-    def __init__(self, name):
-        self.name = name
-    
-    def speak(self):
-        return "Some sound"
+def chapter_12():
+    from pycourse.core.oop import Dog, Cat
 
-class Dog(Animal):
-    def speak(self):  # Override
-        return "Woof!"
-    
-    def fetch(self):
-        return f"{self.name} is fetching"
+    print(listing(oop, "Animal", "Dog", "Cat"))
+    print()
 
-class Cat(Animal):
-    def speak(self):  # Override
-        return "Meow!"
+    dog = Dog("Buddy")
+    cat = Cat("Whiskers")
 
-dog = Dog("Buddy")
-cat = Cat("Whiskers")
+    print(dog.speak())  # Woof!
+    print(dog.fetch())  # Buddy is fetching
+    print(cat.speak())  # Meow!
 
-print(dog.speak())  # Woof!
-print(dog.fetch())  # Buddy is fetching
-print(cat.speak())  # Meow!
 
 # ============================================
 # 13. MODULES AND PACKAGES
 # ============================================
 
-# Import modules
-import math
-import random
-from datetime import datetime
+def chapter_13():
+    # Import modules
+    import math
+    import random
+    from datetime import datetime
 
-print(math.sqrt(16))  # 4.0
-print(random.randint(1, 10))  # Random number
-print(datetime.now())  # Current date/time
+    print(math.sqrt(16))  # 4.0
+    print(random.randint(1, 10))  # Random number
+    print(datetime.now())  # Current date/time
 
-# Create your own module
-# Save as mymodule.py:
-"""
-def greet(name):
-    return f"Hello, {name}!"
-"""
+    # Create your own module
+    # Save as mymodule.py:
+    """
+    def greet(name):
+        return f"Hello, {name}!"
+    """
+
+    # Import your module
+    # import mymodule
+    # print(mymodule.greet("Alice"))
 
-# Import your module
-# import mymodule
-# print(mymodule.greet("Alice"))
 
 # ============================================
 # 14. DECORATORS
 # ============================================
 
-# Basic decorator
-def my_decorator(func):
-    def wrapper():
-        print("Before function")
-        func()
-        print("After function")
-    return wrapper
-
-@my_decorator
-def say_hello():
-    print("Hello!")
+def chapter_14():
+    from pycourse.core.decorators import say_hello, greet
 
-say_hello()
+    # Basic decorator, decorator with arguments
+    print(listing(decorators, "my_decorator", "say_hello", "repeat", "greet"))
+    print()
 
-# Decorator with arguments
-def repeat(times):
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            for _ in range(times):
-                func(*args, **kwargs)
-        return wrapper
-    return decorator
+    say_hello()
+    greet("Alice")
 
-@repeat(3)
-def greet(name):
-    print(f"Hello, {name}!")
-
-greet("Alice")
 
 # ============================================
 # 15. GENERATORS
 # ============================================
 
-# Generator function
-def count_up_to(n):
-    count = 1
-    while count <= n:
-        yield count
-        count += 1
+def chapter_15():
+    from pycourse.core.generators import count_up_to
+
+    # Generator function
+    print(listing(generators, "count_up_to"))
+    print()
 
-for num in count_up_to(5):
-    print(num)  # 1, 2, 3, 4, 5
+    for num in count_up_to(5):
+        print(num)  # 1, 2, 3, 4, 5
+
+    # Generator expression
+    squares = (x**2 for x in range(10))
+    for square in squares:
+        print(square)
 
-# Generator expression
-squares = (x**2 for x in range(10))
-for square in squares:
-    print(square)
 
 # ============================================
 # 16. LAMBDA, MAP, FILTER, REDUCE
 # ============================================
 
-numbers = [1, 2, 3, 4, 5]
+def chapter_16():
+    numbers = [1, 2, 3, 4, 5]
+
+    # Map
+    squares = list(map(lambda x: x**2, numbers))
+    print(squares)  # [1, 4, 9, 16, 25]
 
-# Map
-squares = list(map(lambda x: x**2, numbers))
-print(squares)  # [1, 4, 9, 16, 25]
+    # Filter
+    evens = list(filter(lambda x: x % 2 == 0, numbers))
+    print(evens)  # [2, 4]
 
-# Filter
-evens = list(filter(lambda x: x % 2 == 0, numbers))
-print(evens)  # [2, 4]
+    # Reduce
+    from functools import reduce
+    sum_all = reduce(lambda a, b: a + b, numbers)
+    print(sum_all)  # 15
 
-# Reduce
-from functools import reduce
-sum_all = reduce(lambda a, b: a + b, numbers)
-print(sum_all)  # 15
 
 # ============================================
 # 17. CONTEXT MANAGERS
 # ============================================
 
-# Using with statement
-print("\n--- Context Manager Example ---")
-with open("example.txt", "r") as f:
-    content = f.read()
-    print(f"File content: {content[:20]}...")
-# File automatically closed
+def chapter_17():
+    # Using with statement
+    print("\n--- Context Manager Example ---")
+    with open("example.txt", "r") as f:
+        content = f.read()
+        print(f"File content: {content[:20]}...")
+    # File automatically closed
+
+    from pycourse.core.context_managers import MyContext
+
+    # Custom context manager
+    print(listing(context_managers, "MyContext"))
+    print()
 
-# Custom context manager
-class MyContext:
-    def __enter__(self):
-        print("Entering context")
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        print("Exiting context")
+    with MyContext() as ctx:
+        print("Inside context")
 
-with MyContext() as ctx:
-    print("Inside context")
 
 # ============================================
 # 18. DATA CLASSES (Python 3.7+)
 # ============================================
 
-from dataclasses import dataclass
+def chapter_18():
+    from pycourse.core.data_classes import Person
 
-@dataclass
-class Person:
-    name: str
-    age: int
-    city: str = "Unknown"  # Default value
+    print(listing(data_classes, "Person"))
+    print()
+
+    person = Person("Alice", 25, "NYC")
+    print(person.name)  # Alice
+    print(person)  # Person(name='Alice', age=25, city='NYC')
 
-person = Person("Alice", 25, "NYC")
-print(person.name)  # Alice
-print(person)  # Person(name='Alice', age=25, city='NYC')
 
 # ============================================
 # 19. TYPE HINTS (Optional)
 # ============================================
 
-def greet(name: str) -> str:
-    return f"Hello, {name}"
+def chapter_19():
+    print(listing(type_hints, "greet", "add", "process_items", "get_user", "process"))
+    print()
 
-def add(a: int, b: int) -> int:
-    return a + b
 
-from typing import List, Dict, Optional, Union
+# ============================================
+# 20. COMPLETE EXAMPLE - TODO APP
+# ============================================
 
-def process_items(items: List[str]) -> None:
-    for item in items:
-        print(item)
+def chapter_20():
+    # The advanced course's pycourse/core/todo.py decorates this output with
+    # check marks; the complete course keeps it plain.
+    class TodoApp:
+        def __init__(self):
+            self.todos = []
 
-def get_user(user_id: int) -> Optional[Dict]:
-    return {"id": user_id, "name": "Alice"}
+        def add_todo(self, task):
+            self.todos.append({"task": task, "completed": False})
+            print(f"Added: {task}")
 
-def process(value: Union[int, str]) -> str:
-    return str(value)
+        def complete_todo(self, index):
+            if 0 <= index < len(self.todos):
+                self.todos[index]["completed"] = True
+                print(f"Completed: {self.todos[index]['task']}")
+            else:
+                print("Invalid index")
 
-# ============================================
-# 20. COMPLETE EXAMPLE - TODO APP
-# ============================================
+        def show_todos(self):
+            if not self.todos:
+                print("No todos!")
+                return
+
+            for i, todo in enumerate(self.todos):
+                status = "X" if todo["completed"] else "O"
+                print(f"{i}. [{status}] {todo['task']}")
+
+        def remove_todo(self, index):
+            if 0 <= index < len(self.todos):
+                removed = self.todos.pop(index)
+                print(f"Removed: {removed['task']}")
+            else:
+                print("Invalid index")
+
+    # Usage
+    app = TodoApp()
+    app.add_todo("Learn Python")
+    app.add_todo("Build a project")
+    app.add_todo("Practice coding")
+    app.show_todos()
+    app.complete_todo(0)
+    app.show_todos()
 
-class TodoApp:
-    def __init__(self):
-        self.todos = []
-    
-    def add_todo(self, task):
-        self.todos.append({"task": task, "completed": False})
-        print(f"Added: {task}")
-    
-    def complete_todo(self, index):
-        if 0 <= index < len(self.todos):
-            self.todos[index]["completed"] = True
-            print(f"Completed: {self.todos[index]['task']}")
-        else:
-            print("Invalid index")
-    
-    def show_todos(self):
-        if not self.todos:
-            print("No todos!")
-            return
-        
-        for i, todo in enumerate(self.todos):
-            status = "X" if todo["completed"] else "O"
-            print(f"{i}. [{status}] {todo['task']}")
-    
-    def remove_todo(self, index):
-        if 0 <= index < len(self.todos):
-            removed = self.todos.pop(index)
-            print(f"Removed: {removed['task']}")
-        else:
-            print("Invalid index")
-
-# Usage
-app = TodoApp()
-app.add_todo("Learn Python")
-app.add_todo("Build a project")
-app.add_todo("Practice coding")
-app.show_todos()
-app.complete_todo(0)
-app.show_todos()
 
 # ============================================
 # 21. WORKING WITH APIs (Requires Internet)
 # ============================================
 
-# Uncomment to use with real API
-"""
-import requests
-
-# GET request
-response = requests.get("https://jsonplaceholder.typicode.com/posts/1")
-data = response.json()
-print(data)
-
-# POST request
-new_data = {"title": "foo", "body": "bar", "userId": 1}
-response = requests.post(
-    "https://jsonplaceholder.typicode.com/posts",
-    json=new_data
-)
-print(response.json())
-
-# With error handling
-try:
-    response = requests.get("https://api.example.com/data")
-    response.raise_for_status()
+def chapter_21():
+    # Uncomment to use with real API
+    """
+    import requests
+
+    # GET request
+    response = requests.get("https://jsonplaceholder.typicode.com/posts/1")
     data = response.json()
-except requests.exceptions.RequestException as e:
-    print(f"API Error: {e}")
-"""
+    print(data)
+
+    # POST request
+    new_data = {"title": "foo", "body": "bar", "userId": 1}
+    response = requests.post(
+        "https://jsonplaceholder.typicode.com/posts",
+        json=new_data
+    )
+    print(response.json())
+
+    # With error handling
+    try:
+        response = requests.get("https://api.example.com/data")
+        response.raise_for_status()
+        data = response.json()
+    except requests.exceptions.RequestException as e:
+        print(f"API Error: {e}")
+    """
+
 
 # ============================================
 # 22. WORKING WITH JSON
 # ============================================
 
-import json
+def chapter_22():
+    import json
 
-# Python to JSON
-data = {"name": "Alice", "age": 25}
-json_string = json.dumps(data)
+    # Python to JSON
+    data = {"name": "Alice", "age": 25}
+    json_string = json.dumps(data)
 
-# JSON to Python
-data = json.loads(json_string)
+    # JSON to Python
+    data = json.loads(json_string)
 
-# Write JSON to file
-with open("data.json", "w") as f:
-    json.dump(data, f, indent=2)
+    # Write JSON to file
+    with open("data.json", "w") as f:
+        json.dump(data, f, indent=2)
+
+    # Read JSON from file
+    with open("data.json", "r") as f:
+        data = json.load(f)
 
-# Read JSON from file
-with open("data.json", "r") as f:
-    data = json.load(f)
 
 # ============================================
 # 23. REGULAR EXPRESSIONS
 # ============================================
 
-import re
+def chapter_23():
+    import re
+
+    text = "My email is test@example.com and phone is 123-456-7890"
 
-text = "My email is test@example.com and phone is 123-456-7890"
+    # Search
+    match = re.search(r"\w+@\w+\.\w+", text)
+    print(match.group())  # test@example.com
 
-# Search
-match = re.search(r"\w+@\w+\.\w+", text)
-print(match.group())  # test@example.com
+    # Find all
+    emails = re.findall(r"\w+@\w+\.\w+", text)
+    phones = re.findall(r"\d{3}-\d{3}-\d{4}", text)
 
-# Find all
-emails = re.findall(r"\w+@\w+\.\w+", text)
-phones = re.findall(r"\d{3}-\d{3}-\d{4}", text)
+    # Replace
+    new_text = re.sub(r"\d", "#", text)
 
-# Replace
-new_text = re.sub(r"\d", "#", text)
+    # Validate email
+    print(listing(regex, "is_valid_email"))
+    print()
 
-# Validate email
-def is_valid_email(email):
-    pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    return bool(re.match(pattern, email))
 
 # ============================================
 # 24. MULTITHREADING
 # ============================================
 
-import threading
-import time
+def chapter_24():
+    import threading
+    from pycourse.core.threads import print_numbers, print_letters
 
-def print_numbers():
-    for i in range(5):
-        time.sleep(1)
-        print(i)
+    print(listing(threads, "print_numbers", "print_letters"))
+    print()
 
-def print_letters():
-    for letter in "ABCDE":
-        time.sleep(1)
-        print(letter)
+    # Create threads
+    t1 = threading.Thread(target=print_numbers)
+    t2 = threading.Thread(target=print_letters)
 
-# Create threads
-t1 = threading.Thread(target=print_numbers)
-t2 = threading.Thread(target=print_letters)
+    # Start threads
+    t1.start()
+    t2.start()
 
-# Start threads
-t1.start()
-t2.start()
+    # Wait for threads
+    t1.join()
+    t2.join()
 
-# Wait for threads
-t1.join()
-t2.join()
+    print("Done!")
 
-print("Done!")
 
 # ============================================
 # 25. ASYNC/AWAIT (Python 3.5+)
 # ============================================
 
-import asyncio
+def chapter_25():
+    import asyncio
+    from pycourse.core.async_tasks import main, run_all
 
-async def fetch_data():
-    print("Fetching data...")
-    await asyncio.sleep(2)
-    print("Data fetched")
-    return {"data": "sample"}
+    print(listing(async_tasks, "fetch_data", "main", "run_all"))
+    print()
 
-async def main():
-    result = await fetch_data()
-    print(result)
+    # Run async function
+    asyncio.run(main())
 
-# Run async function
-asyncio.run(main())
-
-# Run multiple tasks concurrently
-async def run_all():
-    await asyncio.gather(
-        fetch_data(),
-        fetch_data(),
-        fetch_data()
-    )
+    # Run multiple tasks concurrently
+    asyncio.run(run_all())
 
-asyncio.run(run_all())
 
 # ============================================
 # PYTHON COURSE COMPLETE!
 # ============================================
+
+CHAPTERS = {
+    1: chapter_1,
+    2: chapter_2,
+    3: chapter_3,
+    4: chapter_4,
+    5: chapter_5,
+    6: chapter_6,
+    7: chapter_7,
+    8: chapter_8,
+    9: chapter_9,
+    10: chapter_10,
+    11: chapter_11,
+    12: chapter_12,
+    13: chapter_13,
+    14: chapter_14,
+    15: chapter_15,
+    16: chapter_16,
+    17: chapter_17,
+    18: chapter_18,
+    19: chapter_19,
+    20: chapter_20,
+    21: chapter_21,
+    22: chapter_22,
+    23: chapter_23,
+    24: chapter_24,
+    25: chapter_25,
+}
+
+if __name__ == "__main__":
+    main(CHAPTERS)
@@ -0,0 +1,32 @@
+import asyncio
+
+from pycourse.aio import AsyncFiles
+
+
+def test_files_serve_one_event_loop_after_another(tmp_path):
+    files = AsyncFiles(max_workers=2)
+    paths = [str(tmp_path / f"{i}.json") for i in range(5)]
+
+    async def save():
+        await files.save_many([(p, {"n": i}) for i, p in enumerate(paths)], kind="json")
+
+    async def load():
+        return await files.load_many(paths, kind="json")
+
+    async def close():
+        await files.aclose()
+
+    asyncio.run(save())
+    assert asyncio.run(load()) == [{"n": i} for i in range(5)]
+    asyncio.run(close())
+
+
+def test_writes_to_one_path_keep_call_order(tmp_path):
+    path = str(tmp_path / "note.txt")
+
+    async def main():
+        async with AsyncFiles(max_workers=4) as files:
+            await files.save_many([(path, str(i)) for i in range(20)])
+            return await files.read_text(path)
+
+    assert asyncio.run(main()) == "19"
@@ -0,0 +1,61 @@
+import datetime
+import queue
+import random
+import threading
+import time
+
+from pycourse.determinism import FROZEN_AT, deterministic
+
+
+def test_random_and_clock_are_pinned_and_restored():
+    with deterministic(seed=3):
+        first = [random.random() for _ in range(3)]
+        assert datetime.datetime.now() == FROZEN_AT
+        assert datetime.date.today() == FROZEN_AT.date()
+        assert time.time() == FROZEN_AT.replace(tzinfo=datetime.timezone.utc).timestamp()
+    with deterministic(seed=3):
+        assert [random.random() for _ in range(3)] == first
+    assert datetime.datetime.now() != FROZEN_AT
+
+
+def test_aware_frozen_at_is_converted_to_utc():
+    tz = datetime.timezone(datetime.timedelta(hours=5))
+    frozen = datetime.datetime(2024, 1, 1, 17, 0, tzinfo=tz)
+    with deterministic(frozen_at=frozen):
+        assert datetime.datetime.now() == datetime.datetime(2024, 1, 1, 12, 0)
+        assert datetime.datetime.now(tz) == frozen
+        assert time.time() == frozen.timestamp()
+
+
+def test_threads_run_in_start_order():
+    order = []
+
+    def work(name):
+        time.sleep(0.01 if name == "a" else 0)
+        order.append(name)
+
+    with deterministic():
+        for name in "abc":
+            threading.Thread(target=work, args=(name,)).start()
+    assert order == ["a", "b", "c"]
+
+
+def test_waiting_threads_run_with_serialize_threads_off():
+    items = queue.Queue(maxsize=1)
+    received = []
+
+    def produce():
+        for i in range(3):
+            items.put(i)
+
+    def consume():
+        for _ in range(3):
+            received.append(items.get())
+
+    with deterministic(serialize_threads=False):
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+    assert received == [0, 1, 2]
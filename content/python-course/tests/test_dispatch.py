@@ -0,0 +1,63 @@
+import gc
+import weakref
+
+from pycourse import dispatch
+from pycourse.dispatch import SlottedCat, SlottedDog, TypeBatch, method_for
+
+
+def test_call_keeps_the_order_objects_were_added():
+    animals = [SlottedDog("Rex"), SlottedCat("Tom"), SlottedDog("Fido")]
+    assert TypeBatch(animals).call("speak") == [a.speak() for a in animals]
+
+
+def test_classmethods_and_staticmethods_are_bound_per_object():
+    class Base:
+        @classmethod
+        def kind(cls):
+            return cls.__name__
+
+        @staticmethod
+        def double(x):
+            return 2 * x
+
+    class Child(Base):
+        pass
+
+    assert method_for(Child, "kind")(Child()) == "Child"
+    assert method_for(Child, "double")(Child(), 4) == 8
+    cached = dispatch._methods[Child]["kind"]
+    method_for(Child, "kind")
+    assert dispatch._methods[Child]["kind"] is cached   # a hit, not a new entry
+
+
+def test_redefining_a_method_is_picked_up():
+    class Dog(SlottedDog):
+        __slots__ = ()
+
+    assert method_for(Dog, "speak")(Dog("Rex")) == SlottedDog("Rex").speak()
+    Dog.speak = lambda self: "Grr"
+    assert method_for(Dog, "speak")(Dog("Rex")) == "Grr"
+
+
+def test_the_cache_does_not_keep_classes_alive():
+    class Loud(SlottedDog):
+        __slots__ = ()
+
+        def speak(self):
+            return super().speak().upper()   # a __class__ cell: refers to Loud
+
+        @classmethod
+        def create(cls, name):
+            return cls(name)
+
+        @property
+        def label(self):
+            return self.name
+
+    TypeBatch([Loud("Rex")]).call("speak")
+    for name in ("create", "label", "__repr__"):
+        method_for(Loud, name)
+    alive = weakref.ref(Loud)
+    del Loud
+    gc.collect()
+    assert alive() is None
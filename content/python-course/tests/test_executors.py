@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+from pycourse import executors
+
+
+@pytest.fixture
+def sleep_job():
+    job = executors.register("test-sleep", executors._sleep_job, lambda scale: [0.001] * 4)
+    yield job
+    executors._close_pool(job.name)
+    executors._choices.pop(job.name, None)
+    del executors.JOBS[job.name]
+
+
+def test_run_needs_an_explicit_calibration(sleep_job):
+    with pytest.raises(LookupError, match="calibrate"):
+        executors.pick(sleep_job)
+    with pytest.raises(LookupError):
+        executors.run(sleep_job, [0.001])
+    assert executors.calibrate(sleep_job, candidates=[("threads", 2)]) == ("threads", 2)
+    assert executors.run(sleep_job, [0.001, 0.002]) == [0.001, 0.002]
+
+
+def test_recalibrating_waits_for_runs_on_the_old_pool(sleep_job):
+    executors.calibrate(sleep_job, candidates=[("threads", 2)])
+    started, results = threading.Event(), []
+
+    def slow_run():
+        started.set()
+        results.append(executors.run(sleep_job, [0.2] * 4))
+
+    worker = threading.Thread(target=slow_run)
+    worker.start()
+    started.wait()
+    executors.calibrate(sleep_job, candidates=[("threads", 3)])
+    assert executors.run(sleep_job, [0.01]) == [0.01]   # replaces the kept pool
+    worker.join()
+    assert results == [[0.2] * 4]
@@ -0,0 +1,56 @@
+import sys
+
+import pytest
+
+from pycourse.grading import GradingPool, Limits, Submission, _same, grade_submission
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the limits need fork and resource")
+
+CORRECT = "def square(x):\n    return x ** 2\n"
+
+
+def test_grade_submission_in_process():
+    assert grade_submission(Submission("ok", "square", CORRECT)).ok
+    wrong = grade_submission(Submission("wrong", "square", "def square(x):\n    return x * 2\n"))
+    assert (wrong.passed, wrong.total) == (1, 4)
+    assert grade_submission(Submission("s", "nope", "")).error == "unknown exercise 'nope'"
+    assert "does not define" in grade_submission(Submission("s", "square", "x = 1\n")).error
+
+
+@pytest.mark.parametrize("expected, got", [(1, True), (8, 8.0), ([1, 2], [1, 2.0]),
+                                           ({"a": 1}, {"a": True}), ((1,), [1])])
+def test_same_compares_types(expected, got):
+    assert _same(("return", expected, ""), ("return", expected, ""))
+    assert not _same(("return", expected, ""), ("return", got, ""))
+
+
+def test_squares_of_floats_are_not_ints():
+    result = grade_submission(Submission("f", "squares", "squares = [float(x**2) for x in range(10)]\n"))
+    assert result.passed == 0
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with GradingPool(workers=1, limits=Limits(cpu_seconds=0.2, wall_seconds=2),
+                     batch_size=8, use_answers=False) as pool:
+        yield pool
+
+
+def test_limits_cost_only_the_offending_submission(pool):
+    submissions = [
+        Submission("ok-1", "square", CORRECT),
+        Submission("sleeps", "square", "import time\n\ndef square(x):\n    time.sleep(10 ** 9)\n"),
+        Submission("waits", "square", "import threading\n\ndef square(x):\n"
+                                      "    threading.Event().wait()\n"),
+        Submission("spins", "square", "def square(x):\n    while True:\n        pass\n"),
+        Submission("exits", "square", "import os\n\ndef square(x):\n    os._exit(3)\n"),
+        Submission("ok-2", "square", CORRECT),
+    ]
+    graded = pool.grade(submissions)
+    assert [result.submission_id for result in graded] == [s.id for s in submissions]
+    results = {result.submission_id: result for result in graded}
+    assert results["ok-1"].ok and results["ok-2"].ok
+    assert results["sleeps"].error == results["waits"].error == "hit the time limit (2s wall clock)"
+    assert results["spins"].passed == 0 and "cpu limit" in results["spins"].failures[0]
+    assert results["exits"].error == "worker died (exit code 3)"
+    assert pool.timeouts == 2 and pool.crashes == 1
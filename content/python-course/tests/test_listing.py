@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from pycourse import listing
+from pycourse.core import generators
+
+
+def test_listing_shows_the_definition_source():
+    text = listing.listing(generators, "count_up_to")
+    assert text.startswith("   def count_up_to(")
+    assert listing.source("pycourse.core.generators", "count_up_to") in textwrap.dedent(text)
+
+
+def test_listing_a_lazy_module_leaves_it_unloaded():
+    # A fresh interpreter: the test session may already have imported asyncio.
+    check = textwrap.dedent("""
+        import sys
+        from pycourse.lazy import _LazyModule, lazy_import
+        from pycourse.listing import listing
+
+        async_tasks = lazy_import("pycourse.core.async_tasks")
+        assert "async def fetch_data" in listing(async_tasks, "fetch_data", "main")
+        assert type(async_tasks) is _LazyModule
+        assert "asyncio" not in sys.modules
+    """)
+    course = os.path.dirname(os.path.dirname(os.path.abspath(listing.__file__)))
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=course)
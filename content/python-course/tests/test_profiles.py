@@ -0,0 +1,65 @@
+import pytest
+
+from pycourse.profiles import ProfileStore
+
+PEOPLE = [
+    {"name": "Alice", "age": 25, "city": "New York"},
+    {"name": "Bob", "age": 30},
+    {"name": "Chen", "age": 41, "city": "Lagos", "email": "chen@example.com"},
+]
+
+
+@pytest.fixture
+def store():
+    return ProfileStore(("name", "age", "city"), PEOPLE)
+
+
+def test_profiles_behave_like_the_dicts(store):
+    assert store.to_dicts() == PEOPLE
+    alice = store[0]
+    alice["email"] = "alice@example.com"
+    del alice["city"]
+    assert dict(alice) == {"name": "Alice", "age": 25, "email": "alice@example.com"}
+    assert alice.get("country", "USA") == "USA"
+    assert alice.pop("email") == "alice@example.com"
+    assert "email" not in alice and store[-1]["email"] == "chen@example.com"
+    with pytest.raises(KeyError):
+        del store[1]["city"]
+    with pytest.raises(IndexError):
+        store[3]
+
+
+def test_bulk_operations(store):
+    assert store.get_many("city", default="?") == ["New York", "?", "Lagos"]
+    assert store.get_many("email", rows=[2, 0]) == ["chen@example.com", None]
+    store.update_many("age", [26, 31], rows=[0, 1])
+    store.update_many("city", ["Paris"], rows=[1])
+    assert store.get_many("age") == [26, 31, 41] and store[1]["city"] == "Paris"
+    store.delete_many("email")
+    assert "email" not in store.keys()
+    store.update_many("email", ["a", "b", "c"])
+    store.delete_many("email", rows=[0, 1, 2])
+    assert "email" not in store.keys()
+
+
+@pytest.mark.parametrize("rows", [[-1], [3], [0, 99]])
+def test_every_bulk_operation_rejects_bad_rows(store, rows):
+    for call in (lambda: store.get_many("age", rows=rows),
+                 lambda: store.get_many("email", rows=rows),
+                 lambda: store.update_many("age", [0] * len(rows), rows=rows),
+                 lambda: store.delete_many("city", rows=rows)):
+        with pytest.raises(IndexError):
+            call()
+    assert store.to_dicts() == PEOPLE
+
+
+def test_update_many_checks_value_counts_and_adds_no_empty_keys(store):
+    with pytest.raises(ValueError):
+        store.update_many("age", [1, 2], rows=[0])
+    with pytest.raises(ValueError):
+        store.update_many("age", [1])
+    store.update_many("nickname", [], rows=[])
+    assert "nickname" not in store.keys()
+    empty = ProfileStore(("name",))
+    empty.update_many("nickname", [])
+    assert empty.keys() == ["name"]
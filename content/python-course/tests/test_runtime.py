@@ -0,0 +1,28 @@
+import asyncio
+import threading
+
+from pycourse.loopmon import LoopMonitor
+from pycourse.runtime import AsyncRuntime, patch_asyncio_run
+
+
+async def _thread_name():
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+def test_patch_asyncio_run_uses_the_runtime_loop():
+    original = asyncio.run
+    with AsyncRuntime("test-runtime") as runtime, patch_asyncio_run(runtime):
+        assert asyncio.run(_thread_name()) == "test-runtime"
+    assert asyncio.run is original
+
+
+def test_monitor_and_runtime_patches_nest():
+    original = asyncio.run
+    monitor = LoopMonitor()
+    with AsyncRuntime("test-runtime") as runtime, patch_asyncio_run(runtime):
+        with monitor.patch_asyncio_run():
+            assert asyncio.run(_thread_name()) == threading.current_thread().name
+        assert asyncio.run(_thread_name()) == "test-runtime"
+    assert asyncio.run is original
+    assert any(record.coroutine.endswith("_thread_name") for record in monitor.tasks)
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from pycourse.sets import ARRAY_MAX, CHUNK_SIZE, RoaringBitmap, SortedIntSet, int_set
+
+
+def samples(seed):
+    rng = random.Random(seed)
+    dense = rng.sample(range(3 * CHUNK_SIZE), 3 * ARRAY_MAX)          # bitmap chunks
+    sparse = rng.sample(range(10 ** 9), 500)                         # array chunks
+    mixed = dense[: ARRAY_MAX // 2] + sparse[:100] + list(range(CHUNK_SIZE - 50, CHUNK_SIZE + 50))
+    return [dense, sparse, mixed, [], [0], list(range(20))]
+
+
+KINDS = [SortedIntSet, RoaringBitmap, int_set]
+
+
+@pytest.mark.parametrize("seed", [0])
+@pytest.mark.parametrize("left_kind", KINDS, ids=lambda k: k.__name__)
+@pytest.mark.parametrize("right_kind", KINDS + [list], ids=lambda k: k.__name__)
+def test_operations_match_builtin_sets(seed, left_kind, right_kind):
+    data = samples(seed)
+    for left in data:
+        for right in data:
+            a, b = set(left), set(right)
+            x = left_kind(left)
+            y = right_kind(right + right[:10])   # duplicates in raw input
+            assert sorted(x) == sorted(a)
+            assert list(x | y) == sorted(a | b)
+            assert list(x & y) == sorted(a & b)
+            assert list(x - y) == sorted(a - b)
+            assert x.union_size(y) == len(a | b)
+            assert x.intersection_size(y) == len(a & b)
+            assert x.difference_size(y) == len(a - b)
+
+
+def test_union_size_and_intersection_size_agree_on_raw_iterables():
+    for kind in (SortedIntSet, RoaringBitmap):
+        s = kind([1, 2, 3])
+        assert s.union_size([3, 3, 4, 4]) == 4
+        assert s.intersection_size([3, 3, 4, 4]) == 1
+
+
+def test_membership_ranges_and_validation():
+    values = [5, 70000, 70001, 10 ** 7]
+    for kind in (SortedIntSet, RoaringBitmap):
+        s = kind(values)
+        assert 70001 in s and 70002 not in s and -1 not in s
+        assert s == SortedIntSet(values) == RoaringBitmap(values)
+        with pytest.raises(ValueError):
+            kind([-1, 2])
+    assert SortedIntSet(values).count_range(6, 10 ** 7) == 2
+    assert list(RoaringBitmap.from_range(CHUNK_SIZE - 3, CHUNK_SIZE + 2)) == \
+        list(range(CHUNK_SIZE - 3, CHUNK_SIZE + 2))
+    assert isinstance(int_set(range(10 ** 6)), RoaringBitmap)
+    assert isinstance(int_set(random.Random(0).sample(range(10 ** 12), 100)), SortedIntSet)
@@ -0,0 +1,39 @@
+import pickle
+
+import pytest
+
+from pycourse.strings import StringChain, numpy_available
+
+NAMES = ["  alice SMITH ", "BOB  jones", "", "ǆemal", "straße", "x\x00", "a\x00b"]
+CHAINS = [
+    StringChain().strip().lower().replace("  ", " ").title(),
+    StringChain().casefold(),
+    StringChain().upper().swapcase().capitalize(),
+    StringChain().rstrip("\x00").replace("a", "b", 1),
+    StringChain().strip("a ").split(maxsplit=1),
+]
+
+
+@pytest.mark.parametrize("chain", CHAINS, ids=repr)
+def test_chain_matches_method_calls(chain):
+    expected = [chain.function(name) for name in NAMES]
+    assert chain(NAMES) == expected
+    assert list(chain.stream(iter(NAMES))) == expected
+    assert pickle.loads(pickle.dumps(chain))(NAMES) == expected
+
+
+@pytest.mark.skipif(not numpy_available(), reason="NumPy is not installed")
+@pytest.mark.parametrize("chain", CHAINS, ids=repr)
+def test_numpy_backend_gives_the_python_results(chain):
+    assert chain(NAMES, backend="numpy") == chain(NAMES)
+    assert chain(NAMES[:5], backend="numpy") == chain(NAMES[:5])
+
+
+def test_chain_validation():
+    with pytest.raises(ValueError):
+        StringChain().split().lower()
+    with pytest.raises(TypeError):
+        StringChain().strip(b"x")
+    with pytest.raises(ValueError):
+        StringChain().lower()(NAMES, backend="pandas")
+    assert repr(StringChain().replace("a", "b", -1).strip(None)) == "StringChain().replace('a', 'b').strip()"
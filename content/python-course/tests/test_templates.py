@@ -0,0 +1,66 @@
+import pytest
+
+from pycourse.templates import BANNER, Template, banners, todo_rows
+
+
+class Record:
+    pass
+
+
+@pytest.mark.parametrize("layout, args, kwargs", [
+    ("  {index}. [{status}] {task}", (), {"index": 0, "status": "O", "task": "Learn"}),
+    ("{0:>4} {1!r}", (3, "a"), {}),
+    ("{} and {}", ("x", "y"), {}),
+    ("{0.real}/{0.imag:.1f}", (2 + 3j,), {}),
+    ("{row[task]} {row[0]}", (), {"row": {"task": "t", 0: "zero"}}),
+    ("quotes ' \" \\ {{braces}} {0}", (1,), {}),
+])
+def test_render_matches_format(layout, args, kwargs):
+    assert Template(layout).render(*args, **kwargs) == layout.format(*args, **kwargs)
+
+
+def test_render_many_and_values():
+    pair = Template("{0:>4} {1}")
+    rows = [(1, "a"), (2, "b")]
+    assert pair.render_many(rows) == [pair.layout.format(*row) for row in rows]
+    assert pair.join(rows) == "   1 a\n   2 b"
+    assert BANNER.render_values(["A", "B"]) == [BANNER.render(title=t) for t in "AB"]
+    assert banners(["A"]) == BANNER.render(title="A")
+    assert todo_rows([{"task": "t", "completed": True}, {"task": "u", "completed": False}]) \
+        == ["  0. [X] t", "  1. [O] u"]
+
+
+@pytest.mark.parametrize("attribute", [
+    "real if print('INJECTED') else 0",
+    "if",
+    "1",
+    "a b",
+    "ﬁ",
+])
+def test_attribute_names_are_looked_up_not_compiled(attribute, capsys):
+    layout = "{0.%s}" % attribute
+    with pytest.raises(AttributeError) as expected:
+        layout.format(5)
+    with pytest.raises(AttributeError) as raised:
+        Template(layout).render(5)
+    assert str(raised.value) == str(expected.value)
+    assert capsys.readouterr().out == ""
+
+    record = Record()
+    setattr(record, attribute, "found")
+    assert Template(layout).render(record) == layout.format(record) == "found"
+
+
+@pytest.mark.parametrize("layout", ["{0.}", "{0!x}", "{0}{}", "{}{0}"])
+def test_invalid_layouts_raise_like_format(layout):
+    with pytest.raises(ValueError):
+        layout.format(1, 2)
+    with pytest.raises(ValueError):
+        Template(layout)
+
+
+def test_mixed_fields_and_single_field_values():
+    with pytest.raises(ValueError):
+        Template("{0} {name}")
+    with pytest.raises(ValueError):
+        Template("{0} {1}").render_values([1])
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pycourse import transcripts
+from pycourse.runner import COURSES
+
+COURSE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _transcript(course: str) -> str:
+    with open(os.path.join(COURSE_DIR, "transcripts", f"{course}.txt"), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("course", sorted(COURSES))
+def test_deterministic_run_matches_the_transcript(course, tmp_path):
+    # A fresh interpreter, as the runner patches random, the clock and threads.
+    output = tmp_path / f"{course}.txt"
+    subprocess.run([sys.executable, "-m", "pycourse.runner", course, "--deterministic",
+                    "-o", str(output)], cwd=COURSE_DIR, check=True, capture_output=True)
+    expected = _transcript(course)
+    assert output.read_text(encoding="utf-8") == expected, \
+        transcripts.diff(expected, output.read_text(encoding="utf-8"))
+
+
+def test_sections_join_back_into_the_transcript():
+    text = _transcript("basic")
+    sections = transcripts.split(text)
+    assert "".join(section.text for section in sections) == text
+    assert "chapter-1" in [section.key for section in sections]
+
+
+def test_patch_carries_only_changed_chapters():
+    old = _transcript("basic")
+    section = next(s for s in transcripts.split(old) if s.key == "chapter-2")
+    new = old.replace(section.text, section.text + "one more line\n")
+    patch = transcripts.make_patch(transcripts.manifest(old), new)
+    assert patch["mode"] == "patch"
+    assert list(patch["changed"]) == ["chapter-2"]
+    assert transcripts.apply_patch(old, patch) == new
+    assert transcripts.make_patch(old, old)["mode"] == "unchanged"
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pycourse.workqueue import AsyncWorkQueue, QueueFull, ThreadWorkQueue
+
+
+def double(item):
+    return 2 * item
+
+
+async def slow_double(item):
+    await asyncio.sleep(0.001)
+    return 2 * item
+
+
+def test_async_map_batches_and_stats():
+    async def main():
+        async with AsyncWorkQueue(slow_double, workers=3, maxsize=5) as queue:
+            assert await queue.map(range(20)) == [2 * i for i in range(20)]
+        async with AsyncWorkQueue(lambda items: [i + 1 for i in items], batch_size=4) as batched:
+            assert await batched.map(range(10)) == list(range(1, 11))
+        return queue.stats()
+
+    stats = asyncio.run(main())
+    assert stats.submitted == stats.completed == 20
+    assert stats.failed == stats.depth == 0
+
+
+def test_async_handler_errors_fail_their_futures():
+    def check(item):
+        if item == 2:
+            raise KeyError(item)
+        return item
+
+    async def main():
+        async with AsyncWorkQueue(check, workers=1) as queue:
+            futures = [await queue.put(i) for i in range(4)]
+            await queue.join()
+        return futures
+
+    futures = asyncio.run(main())
+    assert isinstance(futures[2].exception(), KeyError)
+    assert [f.result() for i, f in enumerate(futures) if i != 2] == [0, 1, 3]
+
+
+def test_async_put_waiting_for_room_is_resolved_by_cancelling_close():
+    async def main():
+        release = asyncio.Event()
+
+        async def blocked(item):
+            await release.wait()
+            return item
+
+        queue = AsyncWorkQueue(blocked, workers=1, maxsize=1)
+        first = await queue.put(0)            # taken by the consumer
+        await asyncio.sleep(0)
+        second = await queue.put(1)           # fills the queue
+        waiting = asyncio.ensure_future(queue.put(2))
+        await asyncio.sleep(0)
+        closing = asyncio.ensure_future(queue.close(cancel=True))
+        await asyncio.sleep(0)
+        release.set()
+        await closing
+        third = await waiting
+        return first, second, third
+
+    first, second, third = asyncio.run(asyncio.wait_for(main(), 5))
+    assert first.result() == 0
+    assert second.cancelled()
+    assert third.cancelled()
+
+
+def test_async_put_after_close_raises():
+    async def main():
+        queue = AsyncWorkQueue(double)
+        await queue.put(1)
+        await queue.close()
+        with pytest.raises(RuntimeError):
+            await queue.put(2)
+
+    asyncio.run(main())
+
+
+def test_thread_map_and_batches():
+    with ThreadWorkQueue(double, workers=3, maxsize=4) as queue:
+        assert queue.map(range(50)) == [2 * i for i in range(50)]
+    with ThreadWorkQueue(lambda items: [i + 1 for i in items], batch_size=8) as batched:
+        assert batched.map(range(30)) == list(range(1, 31))
+    assert queue.stats().completed == 50
+
+
+def test_thread_put_nowait_and_timeout_when_full():
+    release = threading.Event()
+    queue = ThreadWorkQueue(lambda item: release.wait(), workers=1, maxsize=1)
+    queue.put(0)
+    deadline = time.monotonic() + 5
+    while queue.stats().depth and time.monotonic() < deadline:
+        time.sleep(0.001)
+    queue.put(1)
+    with pytest.raises(QueueFull):
+        queue.put_nowait(2)
+    with pytest.raises(QueueFull):
+        queue.put(2, timeout=0.01)
+    release.set()
+    queue.close()
+
+
+def test_thread_blocked_producer_does_not_block_others():
+    release = threading.Event()
+    queue = ThreadWorkQueue(lambda item: release.wait(), workers=1, maxsize=1)
+    queue.put(0)
+    deadline = time.monotonic() + 5
+    while queue.stats().depth and time.monotonic() < deadline:
+        time.sleep(0.001)
+    queue.put(1)
+    blocked = threading.Thread(target=queue.put, args=(2,), daemon=True)
+    blocked.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    with pytest.raises(QueueFull):
+        queue.put_nowait(3)                  # does not wait for the blocked put
+    assert time.monotonic() - started < 1
+    release.set()
+    blocked.join(5)
+    queue.close()
+    assert queue.stats().completed == 3
+
+
+@pytest.mark.parametrize("cancel", [False, True])
+def test_thread_put_close_race_leaves_no_pending_futures(cancel):
+    for _ in range(50):
+        queue = ThreadWorkQueue(double, workers=2, maxsize=2)
+        futures = []
+
+        def produce():
+            for i in range(20):
+                try:
+                    futures.append(queue.put(i))
+                except RuntimeError:
+                    return
+
+        producers = [threading.Thread(target=produce) for _ in range(3)]
+        for producer in producers:
+            producer.start()
+        queue.close(cancel=cancel)
+        for producer in producers:
+            producer.join(5)
+        assert all(future.done() for future in futures)